@@ -0,0 +1,276 @@
+# er_bench.py
+# This file benchmarks the diagnostic engines against both knowledge bases (er_symptoms.py and
+# er_symptomsmore.py) on seeded synthetic patients, so optimizations can be backed by numbers.
+#
+# Usage:
+#     python er_bench.py [--patients N] [--seed S] [--knowledge-base NAME] [--target NAME]
+#                        [--presentation NAME] [--save baseline.json] [--compare baseline.json]
+#                        [--verbose]
+#
+# Targets: run_diagnostic_tree, and match_diagnosis and get_next_question in each question mode.
+# er_symptoms.py has no run_diagnostic_tree of its own; for it the target scores through the
+# same compiled form, producing the same result dicts.
+#
+# Per presentation and target it reports throughput (calls/s over an untimed loop), p50 and
+# p99 latency (per-call perf_counter_ns) and peak memory (tracemalloc peak above the starting
+# level during one pass, after a warm-up pass has built everything built on first use), plus
+# the peak memory of building each presentation's compiled forms. Results are printed as a
+# summary per target and can be saved as a JSON baseline, and a later run compared to one.
+
+import json
+import random
+import time
+import tracemalloc
+
+from er_model import MULTI_SELECT_QUESTIONS
+
+BASELINE_VERSION = 1
+QUESTION_MODES = ("standard", "adaptive", "early_stop")
+
+
+def synthetic_patients(presentation_data, count, seed=0, answer_rate=0.8, multi_rate=0.3):
+    """
+    Generates reproducible patient answers from a presentation's question options.
+    Each question is answered with probability answer_rate by one of its options, or, for a
+    multi-select question with probability multi_rate, by a tuple of two or three of them.
+    :param presentation_data: dict, one ER_PRESENTATIONS entry
+    :param seed: int, the same seed always yields the same patients for the same questions
+    :return: list of patient data dicts
+    """
+    rng = random.Random(seed)
+    patients = []
+    for _ in range(count):
+        patient_data = {}
+        for key, options in presentation_data["questions"].items():
+            if not options or rng.random() >= answer_rate:
+                continue
+            if key in MULTI_SELECT_QUESTIONS and len(options) > 1 and rng.random() < multi_rate:
+                chosen = set(rng.sample(range(len(options)), min(len(options), rng.randint(2, 3))))
+                patient_data[key] = tuple(option for index, option in enumerate(options) if index in chosen)
+            else:
+                patient_data[key] = rng.choice(options)
+        patients.append(patient_data)
+    return patients
+
+
+def _knowledge_base(name):
+    # -> (ER_PRESENTATIONS, KnowledgeBase, run_diagnostic_tree(presentation, patient_data))
+    if name == "er_symptomsmore":
+        import er_symptomsmore
+        from er_engine import get_knowledge_base
+
+        return er_symptomsmore.ER_PRESENTATIONS, get_knowledge_base(), er_symptomsmore.run_diagnostic_tree
+
+    from er_index import KnowledgeBase
+    from er_symptoms import ER_PRESENTATIONS
+
+    knowledge_base = KnowledgeBase(ER_PRESENTATIONS)
+
+    def run_diagnostic_tree(presentation, patient_data):
+        compiled = knowledge_base.compiled[presentation]
+        return [
+            {"diagnosis": compiled.names[index], "diagnosis_id": index, "match_score": match_score}
+            for index, match_score in compiled.score(patient_data)
+        ]
+
+    return ER_PRESENTATIONS, knowledge_base, run_diagnostic_tree
+
+
+def _targets(knowledge_base, run_diagnostic_tree):
+    from er_engine import get_next_question, match_diagnosis
+
+    targets = {"run_diagnostic_tree": run_diagnostic_tree}
+    for mode in QUESTION_MODES:
+        targets[f"match_diagnosis[{mode}]"] = (
+            lambda presentation, answers, mode=mode:
+            match_diagnosis(presentation, answers, mode, knowledge_base=knowledge_base)
+        )
+        targets[f"get_next_question[{mode}]"] = (
+            lambda presentation, answers, mode=mode:
+            get_next_question(presentation, answers, mode, knowledge_base=knowledge_base)
+        )
+    return targets
+
+
+def _percentile(ordered, fraction):
+    # Nearest-rank percentile of a sorted list
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+
+def measure(function, presentation, patients):
+    """
+    Benchmarks one target on one presentation's patients.
+    :return: dict with calls, throughput (calls/s), p50_us, p99_us and peak_kib
+    """
+    for patient_data in patients:  # Warm-up: builds everything built on first use
+        function(presentation, patient_data)
+
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    for patient_data in patients:
+        function(presentation, patient_data)
+    peak = tracemalloc.get_traced_memory()[1] - start
+    tracemalloc.stop()
+
+    clock = time.perf_counter
+    began = clock()
+    for patient_data in patients:
+        function(presentation, patient_data)
+    elapsed = clock() - began
+
+    clock = time.perf_counter_ns
+    latencies = []
+    for patient_data in patients:
+        began = clock()
+        function(presentation, patient_data)
+        latencies.append(clock() - began)
+    latencies.sort()
+    return {
+        "calls": len(patients),
+        "throughput": len(patients) / elapsed if elapsed else float("inf"),
+        "p50_us": _percentile(latencies, 0.50) / 1000,
+        "p99_us": _percentile(latencies, 0.99) / 1000,
+        "peak_kib": peak / 1024,
+    }
+
+
+def build_peak(presentation, presentation_data):
+    """Returns the tracemalloc peak, in KiB, of building one presentation's KnowledgeBase entry."""
+    from er_index import KnowledgeBase
+
+    tracemalloc.start()
+    KnowledgeBase({presentation: presentation_data}).compiled[presentation].criterion_index()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def run(knowledge_bases=("er_symptoms", "er_symptomsmore"), patients=200, seed=0, targets=None, presentations=None):
+    """
+    Runs the suite and returns its results in baseline form.
+    :param targets: iterable of target names to run, or None for all
+    :param presentations: iterable of presentation names to run, or None for all
+    """
+    import platform
+    import sys
+
+    baseline = {
+        "version": BASELINE_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "patients": patients,
+        "seed": seed,
+        "build_kib": {},
+        "results": {},
+    }
+    for name in knowledge_bases:
+        er_presentations, knowledge_base, run_diagnostic_tree = _knowledge_base(name)
+        selected = [
+            presentation for presentation in er_presentations
+            if presentations is None or presentation in presentations
+        ]
+        if not selected:
+            continue
+        cohorts = {
+            presentation: synthetic_patients(er_presentations[presentation], patients, seed)
+            for presentation in selected
+        }
+        baseline["build_kib"][name] = {
+            presentation: build_peak(presentation, er_presentations[presentation]) for presentation in selected
+        }
+        results = baseline["results"][name] = {}
+        for target, function in _targets(knowledge_base, run_diagnostic_tree).items():
+            if targets is not None and target not in targets:
+                continue
+            results[target] = {
+                presentation: measure(function, presentation, cohort) for presentation, cohort in cohorts.items()
+            }
+    return baseline
+
+
+def summarize(by_presentation):
+    """Combines one target's per-presentation results: total throughput, worst p50/p99 and peak."""
+    calls = sum(result["calls"] for result in by_presentation.values())
+    seconds = sum(result["calls"] / result["throughput"] for result in by_presentation.values())
+    return {
+        "calls": calls,
+        "throughput": calls / seconds if seconds else float("inf"),
+        "p50_us": max(result["p50_us"] for result in by_presentation.values()),
+        "p99_us": max(result["p99_us"] for result in by_presentation.values()),
+        "peak_kib": max(result["peak_kib"] for result in by_presentation.values()),
+    }
+
+
+def _row(label, result):
+    return (
+        f"  {label:<34} {result['throughput']:>12,.0f}/s {result['p50_us']:>9.1f} µs {result['p99_us']:>9.1f} µs"
+        f" {result['peak_kib']:>9.1f} KiB"
+    )
+
+
+def report(baseline, verbose=False):
+    """Prints a summary line per knowledge base and target, and every presentation with verbose."""
+    print(f"{baseline['patients']} patients per presentation, seed {baseline['seed']}, Python {baseline['python']}")
+    print("Summary lines give the total throughput and the worst presentation's p50, p99 and peak.")
+    for name, targets in baseline["results"].items():
+        builds = baseline["build_kib"][name]
+        print(f"\n{name}: {len(builds)} presentations, build peak up to {max(builds.values()):.1f} KiB each")
+        print(f"  {'target':<34} {'throughput':>14} {'p50':>12} {'p99':>12} {'peak':>13}")
+        for target, by_presentation in targets.items():
+            print(_row(target, summarize(by_presentation)))
+            if verbose:
+                for presentation, result in by_presentation.items():
+                    print(_row(f"  {presentation}", result))
+
+
+def compare(baseline, previous):
+    """
+    Prints how a run compares to a saved baseline, per knowledge base and target, over the
+    presentations both contain. Ratios above 1 mean the new run is faster (throughput) or
+    slower (p99).
+    """
+    print(f"\nCompared to the baseline of {previous['created']} (Python {previous['python']}):")
+    for name, targets in baseline["results"].items():
+        for target, by_presentation in targets.items():
+            old = previous["results"].get(name, {}).get(target)
+            if not old:
+                continue
+            shared = [presentation for presentation in by_presentation if presentation in old]
+            if not shared:
+                continue
+            new = summarize({presentation: by_presentation[presentation] for presentation in shared})
+            old = summarize({presentation: old[presentation] for presentation in shared})
+            print(
+                f"  {name} {target:<28} throughput x{new['throughput'] / old['throughput']:.2f}"
+                f"  p99 x{new['p99_us'] / old['p99_us']:.2f}"
+            )
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Benchmark the diagnostic engines on synthetic patients")
+    parser.add_argument("--patients", type=int, default=200, help="patients per presentation")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--knowledge-base", action="append", choices=("er_symptoms", "er_symptomsmore"),
+                        help="knowledge base to run (default: both); repeatable")
+    parser.add_argument("--target", action="append", help="target to run (default: all); repeatable")
+    parser.add_argument("--presentation", action="append", help="presentation to run (default: all); repeatable")
+    parser.add_argument("--save", help="write the results to this JSON baseline")
+    parser.add_argument("--compare", help="compare the results to this JSON baseline")
+    parser.add_argument("--verbose", action="store_true", help="print every presentation")
+    arguments = parser.parse_args()
+
+    results = run(
+        arguments.knowledge_base or ("er_symptoms", "er_symptomsmore"), arguments.patients, arguments.seed,
+        arguments.target, arguments.presentation,
+    )
+    report(results, arguments.verbose)
+    if arguments.compare:
+        with open(arguments.compare, encoding="utf-8") as baseline_file:
+            compare(results, json.load(baseline_file))
+    if arguments.save:
+        with open(arguments.save, "w", encoding="utf-8") as baseline_file:
+            json.dump(results, baseline_file, indent=1)
+        print(f"\nSaved {arguments.save}")
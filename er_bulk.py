@@ -0,0 +1,233 @@
+# er_bulk.py
+# This file scores patient records in bulk from the command line, streaming them from a file
+# or stdin through a process pool and writing one JSON line of results per record, in input
+# order. Only a bounded number of chunks is in flight, so memory use does not grow with the input.
+#
+# Usage:
+#     python -m er_bulk [input] [-o output] [--format jsonl|csv] [--presentation NAME]
+#                       [--jobs N] [--chunk-size N] [-k K] [--threshold T] [--batch]
+#
+# JSONL input: one object per line, either {"presentation", "patient_data", "id"?} or, with
+# --presentation, the patient data itself. A JSON array value is a multi-select finding.
+# CSV input: a header row naming the question keys, plus "presentation" (unless --presentation
+# is given) and optionally "id" columns. Empty cells are unanswered, and "|" separates the
+# options of a multi-select finding.
+# Output: {"id"?, "presentation", "results"} per record, or {"record", "error"} for a record
+# that cannot be scored, where record counts input records from 1.
+# Records are scored one at a time by default. With --batch (requires NumPy), each chunk's
+# records are grouped by presentation and each group scored by run_diagnostic_tree_batch on
+# the criteria matrices mapped from the snapshot. That only pays off for chunks holding
+# hundreds of records of one presentation, and holding a chunk's records and NumPy buffers
+# while scoring it leaves each worker with more private memory than the default.
+
+import gc
+import json
+import os
+import sys
+
+import er_symptomsmore
+from er_index import DEFAULT_THRESHOLD
+
+MULTI_SEPARATOR = "|"
+
+
+def _jsonl_record(line, presentation):
+    record = json.loads(line)
+    if not isinstance(record, dict):
+        raise ValueError("Record must be a JSON object")
+    if presentation is not None and "patient_data" not in record:
+        return None, presentation, record
+    return record.get("id"), record.get("presentation", presentation), record.get("patient_data", {})
+
+
+def _csv_record(row, header, presentation):
+    if len(row) != len(header):
+        raise ValueError(f"Expected {len(header)} fields, got {len(row)}")
+    record_id = None
+    patient_data = {}
+    for key, value in zip(header, row):
+        if key == "id":
+            record_id = value
+        elif key == "presentation" and presentation is None:
+            presentation = value
+        elif value:
+            patient_data[key] = tuple(value.split(MULTI_SEPARATOR)) if MULTI_SEPARATOR in value else value
+    return record_id, presentation, patient_data
+
+
+def _patient_record(input_format, header, presentation, raw):
+    # -> (record id, presentation, patient data with multi-select findings as tuples)
+    if input_format == "csv":
+        record_id, name, patient_data = _csv_record(raw, header, presentation)
+    else:
+        record_id, name, patient_data = _jsonl_record(raw, presentation)
+    if not isinstance(patient_data, dict):
+        raise ValueError("patient_data must be an object")
+    patient_data = {key: tuple(value) if isinstance(value, list) else value for key, value in patient_data.items()}
+    return record_id, name, patient_data
+
+
+def _output(record_id, name, results):
+    if isinstance(results, dict):
+        raise ValueError(f"{results['error']}: {name!r}")
+    output = {"presentation": name, "results": results}
+    if record_id is not None:
+        output = {"id": record_id, **output}
+    return output
+
+
+def score_chunk(chunk):
+    """
+    Scores one chunk of raw records in a worker process.
+    :param chunk: (input format, CSV header or None, presentation or None, k, threshold,
+        batch, number of the first record, list of raw JSONL lines or CSV rows); with batch,
+        the records of each presentation are scored together by run_diagnostic_tree_batch
+    :return: str, the chunk's output lines
+    """
+    input_format, header, presentation, k, threshold, batch, record_number, records = chunk
+    lines = []
+    groups = {}  # presentation -> (offsets, record ids, patient data), with batch
+    for offset, raw in enumerate(records):
+        try:
+            record_id, name, patient_data = _patient_record(input_format, header, presentation, raw)
+            if batch:
+                offsets, record_ids, patients = groups.setdefault(name, ([], [], []))
+                offsets.append(offset)
+                record_ids.append(record_id)
+                patients.append(patient_data)
+                lines.append(None)  # Written once its group is scored
+                continue
+            output = _output(record_id, name, er_symptomsmore.run_diagnostic_tree(name, patient_data, k, threshold))
+        except (TypeError, ValueError) as error:  # Includes JSON decoding errors
+            output = {"record": record_number + offset, "error": str(error)}
+        lines.append(json.dumps(output))
+
+    for name, (offsets, record_ids, patients) in groups.items():
+        try:
+            results = er_symptomsmore.run_diagnostic_tree_batch(name, patients, k, threshold)
+        except (TypeError, ValueError):  # Score one record at a time to tell which one fails
+            results = None
+        for index, offset in enumerate(offsets):
+            try:
+                if results is None:
+                    patient_results = er_symptomsmore.run_diagnostic_tree(name, patients[index], k, threshold)
+                else:
+                    patient_results = results if isinstance(results, dict) else results[index]
+                output = _output(record_ids[index], name, patient_results)
+            except (TypeError, ValueError) as error:
+                output = {"record": record_number + offset, "error": str(error)}
+            lines[offset] = json.dumps(output)
+    lines.append("")
+    return "\n".join(lines)
+
+
+def _initialize_worker():
+    # Compiled presentations come from the memory-mapped snapshot instead of each shard;
+    # forked workers inherit the parent's, already opened by preload_for_workers().
+    er_symptomsmore.get_snapshot()
+
+
+def read_chunks(stream, input_format, presentation, k, threshold, chunk_size, batch=False):
+    """Yields score_chunk arguments for successive chunks of an input stream."""
+    header = None
+    record_number = 1
+    if input_format == "csv":
+        import csv
+
+        records = csv.reader(stream)
+        header = next(records, None)
+        if header is None:
+            return
+        header = [key.strip() for key in header]
+    else:
+        records = (line for line in stream if line.strip())
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) == chunk_size:
+            yield input_format, header, presentation, k, threshold, batch, record_number, chunk
+            record_number += len(chunk)
+            chunk = []
+    if chunk:
+        yield input_format, header, presentation, k, threshold, batch, record_number, chunk
+
+
+def score_stream(chunks, jobs=None, window=None, batch=False):
+    """
+    Scores chunks across a process pool, yielding each chunk's output in input order.
+    At most `window` chunks (twice the worker count by default) are submitted and not yet
+    written at any time. Where the platform can fork, the knowledge base is compiled once
+    here and inherited by the workers copy-on-write (see preload_for_workers).
+    :param jobs: int, worker processes; 1 scores in this process without a pool
+    :param batch: bool, the chunks were read with batch (see preload_for_workers)
+    """
+    if jobs == 1:
+        for chunk in chunks:
+            yield score_chunk(chunk)
+        return
+
+    import multiprocessing
+    from collections import deque
+    from concurrent.futures import ProcessPoolExecutor
+
+    jobs = jobs or os.cpu_count() or 1
+    window = window or 2 * jobs
+    context = None
+    if "fork" in multiprocessing.get_all_start_methods():
+        er_symptomsmore.preload_for_workers(batch)
+        context = multiprocessing.get_context("fork")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context, initializer=_initialize_worker) as pool:
+        if context is not None:
+            # With fork, the first submission forks every worker. Objects frozen at that point
+            # stay out of the workers' collections for good, while this process collects them
+            # again as soon as the workers exist.
+            gc.freeze()
+            try:
+                pool.submit(int)
+            finally:
+                gc.unfreeze()
+        pending = deque()
+        for chunk in chunks:
+            if len(pending) == window:
+                yield pending.popleft().result()
+            pending.append(pool.submit(score_chunk, chunk))
+        while pending:
+            yield pending.popleft().result()
+
+
+def main(arguments=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="python -m er_bulk", description="Score patient records in bulk")
+    parser.add_argument("input", nargs="?", default="-", help="JSONL or CSV file, or - for stdin (default)")
+    parser.add_argument("-o", "--output", default="-", help="JSONL file, or - for stdout (default)")
+    parser.add_argument("--format", choices=("jsonl", "csv"), help="input format (default: from the file extension)")
+    parser.add_argument("--presentation", help="score every record against this chief complaint")
+    parser.add_argument("--jobs", type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument("--chunk-size", type=int, default=500, help="records per worker task")
+    parser.add_argument("-k", type=int, default=None, help="results per record (default: all)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument(
+        "--batch", action="store_true", help="score the records of each presentation in a chunk together (requires NumPy)"
+    )
+    arguments = parser.parse_args(arguments)
+
+    input_format = arguments.format or ("csv" if arguments.input.lower().endswith(".csv") else "jsonl")
+    source = sys.stdin if arguments.input == "-" else open(arguments.input, newline="", encoding="utf-8")
+    target = sys.stdout if arguments.output == "-" else open(arguments.output, "w", encoding="utf-8")
+    try:
+        chunks = read_chunks(
+            source, input_format, arguments.presentation, arguments.k, arguments.threshold, arguments.chunk_size,
+            arguments.batch,
+        )
+        for output in score_stream(chunks, arguments.jobs, batch=arguments.batch):
+            target.write(output)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+# er_engine.py
+# This file holds the question-flow engine of the diagnostic tool: picking the next question
+# and matching the answers to a diagnosis. It has no UI dependencies, so batch jobs and services
+# can import it without Streamlit; main.py builds its pages on top of it.
+#
+# Run `python er_engine.py` to measure its import time in fresh interpreters.
+
+from _thread import allocate_lock  # threading.Lock, without importing threading at cold start
+
+from er_index import KnowledgeBase
+from er_symptomsmore import ER_PRESENTATIONS
+
+_KNOWLEDGE_BASE = None
+_KNOWLEDGE_BASE_LOCK = allocate_lock()
+
+
+def get_knowledge_base():
+    """
+    Returns the compiled view of ER_PRESENTATIONS, creating it on first use; each
+    presentation in it is only imported and compiled once it is looked up.
+    Imported modules are not re-executed when Streamlit reruns main.py, so it is built
+    once per process and shared by every session. Sessions run on threads of their own,
+    so the first build holds a lock, as st.cache_resource would: concurrent first visits
+    wait for it instead of each building a copy.
+    """
+    global _KNOWLEDGE_BASE
+    if _KNOWLEDGE_BASE is None:
+        with _KNOWLEDGE_BASE_LOCK:
+            if _KNOWLEDGE_BASE is None:
+                _KNOWLEDGE_BASE = KnowledgeBase(ER_PRESENTATIONS)
+    return _KNOWLEDGE_BASE
+
+
+def get_next_question(presentation, answers, mode="standard", scorer=None, knowledge_base=None):
+    """
+    Determines the next question to ask based on the current answers.
+    Returns the question key and a tuple of options.
+    In "adaptive" mode the question with the highest expected information gain is asked
+    next, and (None, None) is returned as soon as the diagnosis is decided.
+    In "early_stop" mode (None, None) is returned as soon as the top-scoring diagnosis
+    from run_diagnostic_tree can no longer be overtaken, or nothing can reach the threshold.
+    An IncrementalScorer already holding the answers can be passed to avoid rescoring them.
+    Another KnowledgeBase than get_knowledge_base() can be passed as knowledge_base.
+    """
+    knowledge_base = knowledge_base or get_knowledge_base()
+    questions = knowledge_base.presentations[presentation].questions
+    if mode == "adaptive":
+        question_key = knowledge_base.match_tables[presentation].best_question(answers)
+        if question_key is None:
+            return None, None
+        return question_key, knowledge_base.presentations[presentation].options(question_key)
+    if mode == "early_stop":
+        if scorer is not None:
+            decided, _ = scorer.decided_leader()
+        else:
+            decided, _ = knowledge_base.compiled[presentation].decided_leader(answers)
+        if decided:
+            return None, None
+    for question in questions:
+        if question.key not in answers:
+            return question.key, question.options
+    return None, None
+
+
+def match_diagnosis(presentation, answers, mode="standard", scorer=None, knowledge_base=None):
+    """
+    Matches the user's answers to a possible diagnosis based on the ER_PRESENTATIONS data.
+    Backed by a per-presentation lookup table that is built on first use and cached.
+    In "adaptive" mode unanswered questions count as skipped rather than as mismatches.
+    In "early_stop" mode the top-scoring diagnosis from run_diagnostic_tree is returned,
+    taken from the IncrementalScorer when one is passed.
+    Another KnowledgeBase than get_knowledge_base() can be passed as knowledge_base.
+    """
+    knowledge_base = knowledge_base or get_knowledge_base()
+    if mode == "standard":
+        return knowledge_base.match_tables[presentation].lookup(answers)
+    if mode == "adaptive":
+        return knowledge_base.match_tables[presentation].resolve(answers)
+    if mode == "early_stop":
+        if scorer is not None:
+            _, leader = scorer.decided_leader()
+        else:
+            _, leader = knowledge_base.compiled[presentation].decided_leader(answers)
+        if leader is None:
+            return None
+        return knowledge_base.presentations[presentation].diagnoses[leader]
+    return knowledge_base.match_tables[presentation].lookup(answers)
+
+
+def _import_seconds(module, runs=20):
+    # Median wall time of importing a module in fresh interpreters, after a first import
+    # has written the bytecode cache as it would be in a deployment.
+    import os
+    import statistics
+    import subprocess
+    import sys
+
+    environment = dict(os.environ)
+    environment.pop("PYTHONDONTWRITEBYTECODE", None)
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"import {module}; print(time.perf_counter() - start)"
+    )
+    timings = []
+    for _ in range(runs + 1):
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True, env=environment
+        )
+        timings.append(float(result.stdout))
+    return statistics.median(timings[1:])
+
+
+if __name__ == "__main__":
+    import subprocess
+    import sys
+
+    engine = _import_seconds("er_engine")
+    print(f"import er_engine: {engine * 1000:6.1f} ms (median of 20 fresh interpreters)")
+    leaked = subprocess.run(
+        [sys.executable, "-c", "import sys, er_engine; print('streamlit' in sys.modules)"],
+        capture_output=True, text=True, check=True,
+    ).stdout.strip()
+    print(f"streamlit imported: {leaked}")
+    try:
+        streamlit = _import_seconds("streamlit", runs=5)
+        print(f"import streamlit: {streamlit * 1000:6.1f} ms (median of 5), which main.py adds on top")
+    except subprocess.CalledProcessError:
+        print("import streamlit: not installed")
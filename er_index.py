@@ -0,0 +1,862 @@
+# er_index.py
+# This file compiles the ER_PRESENTATIONS dictionaries into integer bitsets so that
+# scoring a patient becomes a handful of AND/popcount operations instead of a dict walk.
+# test_er_index.py checks them against a direct reading of both knowledge bases.
+
+import math
+from itertools import repeat
+from operator import itemgetter
+from _collections_abc import Mapping  # collections.abc without its extra import
+from _thread import allocate_lock  # threading.Lock, without importing threading at cold start
+
+from er_model import MULTI_VALUE_TYPES, ModelPool, Presentation
+
+DEFAULT_THRESHOLD = 0.6  # Fraction of a diagnosis's criteria that must match
+
+
+def min_hits_for(scores, threshold):
+    """
+    Returns the fewest hits whose score reaches the threshold, given a diagnosis's
+    score-by-hits table, or len(scores) when the threshold is out of reach.
+    """
+    return next((hits for hits, score in enumerate(scores) if score >= threshold), len(scores))
+
+
+_SCORE_TABLES = {}
+
+
+def score_table(total_criteria):
+    """
+    Returns the match_score by number of hits of a diagnosis with total_criteria criteria,
+    as a tuple shared by every diagnosis with that many.
+    """
+    scores = _SCORE_TABLES.get(total_criteria)
+    if scores is None:
+        scores = tuple(hits / total_criteria for hits in range(total_criteria + 1))
+        scores = _SCORE_TABLES.setdefault(total_criteria, scores)
+    return scores
+
+
+def top_matches(matches, k=None):
+    """
+    Orders (index, match_score) pairs best first, keeping index order among ties,
+    and keeps the first k when k is given.
+    :param matches: iterable of (index, match_score) pairs in increasing index order
+    """
+    if k is not None and k <= 0:
+        return []
+    ordered = sorted(matches, key=itemgetter(1), reverse=True)
+    return ordered if k is None else ordered[:k]
+
+
+class CompiledPresentation:
+    """
+    Bitset form of one presentation.
+    Every (question key, option) pair gets an integer id, and each diagnosis's
+    criteria are stored as a mask of the ids that satisfy them.
+    """
+
+    def __init__(self, presentation):
+        """
+        :param presentation: er_model.Presentation
+        """
+        self.feature_ids = {}
+        self.names = []
+        self.masks = []
+        totals = []
+
+        for question in presentation.questions:
+            for option in question.options:
+                self._feature_id(question.key, option)
+
+        for index, diagnosis in enumerate(presentation.diagnoses):
+            mask = 0
+            for criterion in diagnosis.criteria:
+                for option in criterion.values:
+                    mask |= self._feature_id(criterion.key, option)
+            self.names.append(diagnosis.name)
+            self.masks.append(mask)
+            totals.append(len(diagnosis.criteria))
+
+        # Criteria that at least one answer option can still satisfy, used to bound
+        # the score a diagnosis can reach while questions are unanswered.
+        self.open_criteria = []
+        for index, diagnosis in enumerate(presentation.diagnoses):
+            self.open_criteria.append(tuple(
+                criterion.key for criterion in diagnosis.criteria
+                if any(criterion.accepts(option) for option in presentation.options(criterion.key))
+            ))
+
+        # Differentiating factors, kept apart from the scoring arrays and read only on request
+        self.texts = tuple(diagnosis.differentiating_factors for diagnosis in presentation.diagnoses)
+        self._set_scores(totals)
+        self._load_criteria_matrix = None
+
+    @classmethod
+    def from_arrays(cls, feature_ids, names, texts, masks, totals, open_criteria, criteria_matrix=None):
+        """
+        Rebuilds a compiled presentation from its stored arrays, as written by er_snapshot.py,
+        without the source dict.
+        :param texts: sequence of differentiating factors, indexed like names
+        :param criteria_matrix: optional callable returning the stored criteria matrix,
+            called by criteria_matrix() on first use instead of building it
+        """
+        compiled = cls.__new__(cls)
+        compiled.feature_ids = feature_ids
+        compiled.names = names
+        compiled.texts = texts
+        compiled.masks = masks
+        compiled.open_criteria = open_criteria
+        compiled._set_scores(totals)
+        compiled._load_criteria_matrix = criteria_matrix
+        return compiled
+
+    def _set_scores(self, totals):
+        self.scores = [score_table(total_criteria) for total_criteria in totals]
+        self.min_hits = [min_hits_for(scores, DEFAULT_THRESHOLD) for scores in self.scores]
+        self._criteria_matrix = None
+        self._diagnoses_by_feature = None
+        self._criterion_index = None
+        self._batch_columns = None
+        self._min_hits_by_threshold = {DEFAULT_THRESHOLD: self.min_hits}
+
+    def _feature_id(self, key, option):
+        bit = self.feature_ids.get((key, option))
+        if bit is None:
+            bit = 1 << len(self.feature_ids)
+            self.feature_ids[(key, option)] = bit
+        return bit
+
+    def min_hits_for(self, threshold):
+        """Returns the per-diagnosis minimum hits for a threshold, cached per threshold."""
+        min_hits = self._min_hits_by_threshold.get(threshold)
+        if min_hits is None:
+            min_hits = [min_hits_for(scores, threshold) for scores in self.scores]
+            self._min_hits_by_threshold[threshold] = min_hits
+        return min_hits
+
+    def score(self, patient_data, k=None, threshold=DEFAULT_THRESHOLD):
+        """
+        Scores patient data against every diagnosis.
+        :param k: int, optional limit on the number of results
+        :param threshold: float, minimum match_score for a diagnosis to be returned
+        :return: list of (diagnosis index, match_score) above the threshold, best first
+        """
+        min_hits = self._min_hits_by_threshold.get(threshold) or self.min_hits_for(threshold)
+        criterion_ids, criterion_masks = self._criterion_index or self.criterion_index()
+        mask = self._encode_criteria(patient_data, criterion_ids)
+        # Each answer hits a diagnosis at most once, so a diagnosis needing more hits
+        # than there are answers is pruned before it is scored.
+        answered = len(patient_data)
+        scores = self.scores
+        matches = []
+        for index, criterion_mask in enumerate(criterion_masks):
+            needed = min_hits[index]
+            if needed <= answered:
+                hits = (mask & criterion_mask).bit_count()
+                if hits >= needed:
+                    matches.append((index, scores[index][hits]))
+        return top_matches(matches, k)
+
+    def criterion_index(self):
+        """
+        Returns the criterion-level form of the masks, built on first use: one bit per
+        (diagnosis, criterion) instead of per (question key, option).
+        criterion_ids maps each question key to a dict of option -> bits of the criteria
+        that option satisfies (0 for an option no criterion takes), and criterion_masks[index]
+        holds the bits of a diagnosis's criteria. OR-ing the ids of several options of one
+        question sets each criterion's bit once, so a multi-select record scores with the
+        same single popcount per diagnosis as a single-value one.
+        """
+        if self._criterion_index is None:
+            criterion_ids = {}
+            for key, option in self.feature_ids:
+                criterion_ids.setdefault(key, {})[option] = 0
+            criterion_masks = []
+            next_bit = 0
+            for diagnosis_mask in self.masks:
+                # Every criterion has at least one option, and all of a diagnosis's
+                # options for one question belong to its single criterion on it.
+                bits_by_key = {}
+                for feature, bit in self.feature_ids.items():
+                    if diagnosis_mask & bit:
+                        criterion_bit = bits_by_key.get(feature[0])
+                        if criterion_bit is None:
+                            criterion_bit = bits_by_key[feature[0]] = 1 << next_bit
+                            next_bit += 1
+                        options = criterion_ids.setdefault(feature[0], {})
+                        options[feature[1]] = options.get(feature[1], 0) | criterion_bit
+                criterion_mask = 0
+                for criterion_bit in bits_by_key.values():
+                    criterion_mask |= criterion_bit
+                criterion_masks.append(criterion_mask)
+            self._criterion_index = (criterion_ids, criterion_masks)
+        return self._criterion_index
+
+    @staticmethod
+    def _encode_criteria(patient_data, criterion_ids):
+        # criterion_ids lists every option of every question, so only answers outside
+        # the vocabulary or with several options take the exception path.
+        mask = 0
+        for key, value in patient_data.items():
+            try:
+                mask |= criterion_ids[key][value]
+            except (KeyError, TypeError):
+                options = criterion_ids.get(key)
+                if options is not None and isinstance(value, MULTI_VALUE_TYPES):
+                    for option in value:
+                        try:
+                            mask |= options.get(option, 0)
+                        except TypeError:  # Unhashable answers never match
+                            pass
+        return mask
+
+    def decided_leader(self, answers):
+        """
+        Bounds every diagnosis's achievable match_score given partial answers.
+        Each unanswered criterion is counted as a hit for the upper bound and as a miss
+        for the lower bound.
+        :return: (decided, index), where decided is True once answering the remaining
+            questions cannot change the top result of score(), and index is that
+            top diagnosis (None when nothing can still reach the threshold)
+        """
+        criterion_ids, criterion_masks = self.criterion_index()
+        mask = self._encode_criteria(answers, criterion_ids)
+        hits = []
+        open_counts = []
+        for index, criterion_mask in enumerate(criterion_masks):
+            hits.append((mask & criterion_mask).bit_count())
+            open_counts.append(sum(1 for key in self.open_criteria[index] if key not in answers))
+        return self._decide(hits, open_counts)
+
+    def _decide(self, hits, open_counts):
+        lower = [self.scores[index][count] for index, count in enumerate(hits)]
+        if not any(count + open_counts[index] >= self.min_hits[index] for index, count in enumerate(hits)):
+            return True, None
+
+        leader = max(range(len(lower)), key=lambda index: (lower[index], -index))
+        if hits[leader] < self.min_hits[leader]:
+            return False, None
+        for index, count in enumerate(hits):
+            bound = self.scores[index][count + open_counts[index]]
+            # Ties keep diagnosis order, so an earlier diagnosis that can tie also overtakes.
+            if index != leader and (bound > lower[leader] or (bound == lower[leader] and index < leader)):
+                return False, None
+        return True, leader
+
+    def diagnoses_by_feature(self):
+        """
+        Returns the reverse index from (question key, option) to the indices of the
+        diagnoses whose criteria that answer satisfies, built on first use.
+        """
+        if self._diagnoses_by_feature is None:
+            self._diagnoses_by_feature = {
+                feature: tuple(index for index, mask in enumerate(self.masks) if mask & bit)
+                for feature, bit in self.feature_ids.items()
+            }
+        return self._diagnoses_by_feature
+
+    def criteria_matrix(self):
+        """
+        Returns the (features x diagnoses) 0/1 criteria matrix, built (or, for a snapshot
+        presentation, attached) on first use. Requires NumPy.
+        """
+        if self._criteria_matrix is None and self._load_criteria_matrix is not None:
+            self._criteria_matrix = self._load_criteria_matrix()
+        if self._criteria_matrix is None:
+            import numpy as np
+
+            matrix = np.zeros((len(self.feature_ids), len(self.masks)), dtype=np.float32)
+            for index, diagnosis_mask in enumerate(self.masks):
+                for feature in range(diagnosis_mask.bit_length()):
+                    if diagnosis_mask >> feature & 1:
+                        matrix[feature, index] = 1
+            self._criteria_matrix = matrix
+        return self._criteria_matrix
+
+    def score_batch(self, patients, chunk_size=10000, k=None, threshold=DEFAULT_THRESHOLD):
+        """
+        Scores many patient records with one matrix multiply per chunk.
+        :param patients: iterable of patient data dicts
+        :param chunk_size: int, number of records encoded into each one-hot matrix
+        :param k: int, optional limit on the number of results per patient
+        :param threshold: float, minimum match_score for a diagnosis to be returned
+        :return: list with one score() result per patient, in input order
+        """
+        import numpy as np
+
+        criteria = self.criteria_matrix()
+        columns_by_key, totals = self._batch_columns or self.batch_columns()
+        min_hits = np.array(self.min_hits_for(threshold))
+        limit = None if k is None else max(k, 0)
+        results = []
+        chunk = []
+        for patient_data in patients:
+            chunk.append(patient_data)
+            if len(chunk) == chunk_size:
+                results.extend(self._score_chunk(np, chunk, criteria, columns_by_key, totals, min_hits, limit))
+                chunk = []
+        if chunk:
+            results.extend(self._score_chunk(np, chunk, criteria, columns_by_key, totals, min_hits, limit))
+        return results
+
+    def batch_columns(self):
+        """
+        Returns (columns_by_key, totals), the encoding score_batch() uses, built on first use:
+        question key -> {option: criteria matrix row}, with an unanswered question mapped
+        to -1, and each diagnosis's number of criteria as a NumPy array. Requires NumPy.
+        """
+        if self._batch_columns is None:
+            import numpy as np
+
+            columns_by_key = {}
+            for (key, option), bit in self.feature_ids.items():
+                columns_by_key.setdefault(key, {None: -1})[option] = bit.bit_length() - 1
+            totals = np.array([len(scores) - 1 for scores in self.scores], dtype=np.float64)
+            self._batch_columns = (columns_by_key, totals)
+        return self._batch_columns
+
+    @staticmethod
+    def _option_columns(values, rows, get, selected_rows, selected_columns):
+        # Appends (row, criteria row) for every known option of the multi-select answers at rows.
+        for row in rows:
+            value = values[row]
+            if isinstance(value, MULTI_VALUE_TYPES):
+                for option in value:
+                    try:
+                        column = get(option, -1)
+                    except TypeError:  # Unhashable answers never match
+                        continue
+                    if column >= 0:
+                        selected_rows.append(row)
+                        selected_columns.append(column)
+
+    def _score_chunk(self, np, chunk, criteria, columns_by_key, totals, min_hits, limit=None):
+        count = len(chunk)
+        features = criteria.shape[0]
+        # codes[row, question] is the criteria row of that answer, or -1, the spare last
+        # column of one_hot, for an unanswered question or one that matches nothing.
+        codes = np.empty((count, len(columns_by_key)), dtype=np.intp)
+        one_hot = np.zeros((count, features + 1), dtype=np.float32)
+        multi_questions = []
+        selected_rows = []
+        selected_columns = []
+        for question, (key, columns) in enumerate(columns_by_key.items()):
+            # -2 marks an answer that is not a single known option: a multi-select
+            # answer, or one outside the vocabulary that _option_columns() skips.
+            get = columns.get
+            try:
+                question_codes = np.fromiter(
+                    map(get, map(dict.get, chunk, repeat(key, count)), repeat(-2, count)), dtype=np.intp, count=count
+                )
+                values = None
+            except TypeError:  # an unhashable answer, such as a JSON list of options
+                values = list(map(dict.get, chunk, repeat(key, count)))
+                question_codes = np.array(
+                    [get(value, -2) if value.__class__ is str or value is None else -2 for value in values],
+                    dtype=np.intp,
+                )
+            multi_rows = np.flatnonzero(question_codes == -2)
+            if len(multi_rows):
+                question_codes[multi_rows] = -1
+                if values is None:
+                    values = list(map(dict.get, chunk, repeat(key, count)))
+                selected = len(selected_rows)
+                self._option_columns(values, multi_rows.tolist(), get, selected_rows, selected_columns)
+                if len(selected_rows) > selected:
+                    multi_questions.append((multi_rows, [column for column in columns.values() if column >= 0]))
+            codes[:, question] = question_codes
+        one_hot[np.arange(count).repeat(codes.shape[1]), codes.ravel()] = 1
+        one_hot[selected_rows, selected_columns] = 1
+        hits = one_hot[:, :features] @ criteria
+        # A multi-select answer hits each diagnosis's one criterion on its question at most
+        # once, so per-question counts above 1 are taken back off.
+        for multi_rows, columns in multi_questions:
+            question_hits = one_hot[np.ix_(multi_rows, columns)] @ criteria[columns]
+            hits[multi_rows] -= np.maximum(question_hits - 1, 0)
+        hits = hits.astype(np.int64)
+
+        rows, indices = np.nonzero(hits >= min_hits)
+        match_scores = hits[rows, indices] / totals[indices]
+        # Best score first within each row, ties in diagnosis order, like sorted(reverse=True).
+        order = np.lexsort((indices, -match_scores, rows))
+        rows, indices, match_scores = rows[order], indices[order], match_scores[order]
+        counts = np.bincount(rows, minlength=count)
+        if limit is not None:
+            starts = np.repeat(np.cumsum(counts) - counts, counts)
+            kept = np.arange(len(rows)) - starts < limit
+            indices, match_scores = indices[kept], match_scores[kept]
+            counts = np.minimum(counts, limit)
+        matches = list(zip(indices.tolist(), match_scores.tolist()))
+        ends = np.cumsum(counts).tolist()
+        return [matches[end - row_count:end] for end, row_count in zip(ends, counts.tolist())]
+
+
+class IncrementalScorer:
+    """
+    Running score() state for a progressive session.
+    Each answer touches only the diagnoses it affects, through the reverse index of
+    the compiled presentation, so candidates can be ranked after every answer.
+    """
+
+    def __init__(self, compiled):
+        self.compiled = compiled
+        self.answers = {}
+        self.hits = [0] * len(compiled.masks)
+        self.open_counts = [len(keys) for keys in compiled.open_criteria]
+        self._open_by_key = {}
+        for index, keys in enumerate(compiled.open_criteria):
+            for key in keys:
+                self._open_by_key.setdefault(key, []).append(index)
+
+    def _matching(self, key, value):
+        diagnoses_by_feature = self.compiled.diagnoses_by_feature()
+        if isinstance(value, MULTI_VALUE_TYPES):
+            # A diagnosis counts once however many of the selected options it accepts.
+            matching = set()
+            for option in value:
+                try:
+                    matching.update(diagnoses_by_feature.get((key, option), ()))
+                except TypeError:
+                    pass
+            return matching
+        try:
+            return diagnoses_by_feature.get((key, value), ())
+        except TypeError:
+            return ()
+
+    def answer(self, key, value):
+        """Records an answer, replacing any earlier answer to the same question."""
+        if key in self.answers:
+            for index in self._matching(key, self.answers[key]):
+                self.hits[index] -= 1
+        else:
+            for index in self._open_by_key.get(key, ()):
+                self.open_counts[index] -= 1
+        self.answers[key] = value
+        for index in self._matching(key, value):
+            self.hits[index] += 1
+
+    def ranked(self, k=None):
+        """
+        Returns the (diagnosis index, match_score) pairs above the threshold, best first,
+        exactly as score() would for the answers so far.
+        :param k: int, optional limit on the number of pairs returned
+        """
+        compiled = self.compiled
+        return top_matches(
+            (
+                (index, compiled.scores[index][hits])
+                for index, hits in enumerate(self.hits)
+                if hits >= compiled.min_hits[index]
+            ),
+            k,
+        )
+
+    def decided_leader(self):
+        """Same as CompiledPresentation.decided_leader for the answers so far."""
+        return self.compiled._decide(self.hits, self.open_counts)
+
+
+class GlobalIndex:
+    """
+    Inverted index from (question key, option) to diagnoses across every presentation,
+    so a patient without a chief complaint only touches diagnoses sharing a finding.
+    Diagnosis ids number every diagnosis in presentation order.
+    """
+
+    def __init__(self, compiled_presentations):
+        self.compiled = dict(compiled_presentations)
+        self.diagnoses = []
+        self.min_hits = []
+        self.scores = []
+        self.diagnoses_by_feature = {}
+        for name, compiled in compiled_presentations.items():
+            offset = len(self.diagnoses)
+            self.diagnoses.extend((name, index) for index in range(len(compiled.masks)))
+            self.min_hits.extend(compiled.min_hits)
+            self.scores.extend(compiled.scores)
+            for feature, indices in compiled.diagnoses_by_feature().items():
+                self.diagnoses_by_feature.setdefault(feature, []).extend(offset + index for index in indices)
+        self._min_hits_by_threshold = {DEFAULT_THRESHOLD: self.min_hits}
+
+    min_hits_for = CompiledPresentation.min_hits_for
+
+    def score(self, patient_data, k=None, threshold=DEFAULT_THRESHOLD):
+        """
+        Scores patient data against the diagnoses that share at least one finding, and
+        against all of them when the threshold is 0 or less.
+        :param k: int, optional limit on the number of results
+        :param threshold: float, minimum match_score for a diagnosis to be returned
+        :return: list of (diagnosis id, match_score) above the threshold, best first
+        """
+        hits = {}
+        for key, value in patient_data.items():
+            if isinstance(value, MULTI_VALUE_TYPES):
+                matching = set()
+                for option in value:
+                    try:
+                        matching.update(self.diagnoses_by_feature.get((key, option), ()))
+                    except TypeError:
+                        pass
+            else:
+                try:
+                    matching = self.diagnoses_by_feature.get((key, value), ())
+                except TypeError:
+                    matching = ()
+            for diagnosis_id in matching:
+                hits[diagnosis_id] = hits.get(diagnosis_id, 0) + 1
+        if threshold <= 0:
+            # Every diagnosis reaches the threshold without a single hit, shared finding or not.
+            for diagnosis_id in range(len(self.diagnoses)):
+                hits.setdefault(diagnosis_id, 0)
+
+        min_hits = self.min_hits_for(threshold)
+        return top_matches(
+            (
+                (diagnosis_id, self.scores[diagnosis_id][count])
+                for diagnosis_id, count in sorted(hits.items())
+                if count >= min_hits[diagnosis_id]
+            ),
+            k,
+        )
+
+
+class ResultCache:
+    """
+    Thread-safe LRU cache with hit/miss counters, in the spirit of functools.lru_cache.
+    Each entry is stored with a version token; get() treats an entry whose token differs
+    from the caller's current one as a miss, so stale results are never returned.
+    """
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        # Dicts keep insertion order, so the first key is always the least recently used.
+        self._entries = {}
+        self._lock = allocate_lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key, version):
+        """Returns the cached value for key, or None on a miss."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None and entry[0] is version:
+                self._entries[key] = entry
+                self._hits += 1
+                return entry[1]
+            self._misses += 1
+            return None
+
+    def put(self, key, version, value):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (version, value)
+            while len(self._entries) > self.maxsize:
+                del self._entries[next(iter(self._entries))]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(self):
+        """Returns hits, misses, maxsize and currsize, like functools.lru_cache's cache_info()."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "maxsize": self.maxsize,
+                "currsize": len(self._entries),
+            }
+
+
+def compile_presentations(presentations):
+    """Compiles every presentation in an ER_PRESENTATIONS-style dict."""
+    pool = ModelPool()
+    return {
+        name: CompiledPresentation(Presentation.from_dict(name, data, pool))
+        for name, data in presentations.items()
+    }
+
+
+class MatchTable:
+    """
+    Lookup table for first-match diagnosis, as used by main.py.
+    A diagnosis matches when every criterion holds (Criterion.accepts, the same exact
+    membership test run_diagnostic_tree counts hits with), and the first one wins.
+
+    Options that satisfy the same criteria are collapsed into one class per question,
+    so an answer tuple reduces to a tuple of class ids. The table over those tuples is
+    enumerated up front when it has at most `max_enumerated` entries and is otherwise
+    filled on first lookup of each tuple.
+    """
+
+    def __init__(self, presentation, max_enumerated=4096):
+        """
+        :param presentation: er_model.Presentation
+        """
+        self.presentation = presentation
+        self.diagnoses = presentation.diagnoses
+        self.keys = []
+        for diagnosis in self.diagnoses:
+            for criterion in diagnosis.criteria:
+                if criterion.key not in self.keys:
+                    self.keys.append(criterion.key)
+
+        everyone = (1 << len(self.diagnoses)) - 1
+        self.option_classes = []
+        self.class_masks = []
+        for key in self.keys:
+            criteria = [diagnosis.criterion(key) for diagnosis in self.diagnoses]
+            values = list(presentation.options(key))
+            for criterion in criteria:
+                if criterion is not None:
+                    values.extend(criterion.values)
+
+            # Class 0 is always the unanswered class, shared by values outside the vocabulary.
+            classes = {}
+            option_classes = {}
+            masks = []
+            for value in [None] + values:
+                mask = everyone
+                for index, criterion in enumerate(criteria):
+                    if criterion is not None and not criterion.accepts(value):
+                        mask &= ~(1 << index)
+                if mask not in classes:
+                    classes[mask] = len(masks)
+                    masks.append(mask)
+                option_classes[value] = classes[mask]
+            self.option_classes.append(option_classes)
+            self.class_masks.append(masks)
+        self._key_classes = list(zip(self.keys, self.option_classes))
+
+        self.table = {}
+        size = 1
+        for masks in self.class_masks:
+            size *= len(masks)
+        if size <= max_enumerated:
+            self._enumerate(0, (), everyone)
+
+    def _enumerate(self, position, classes, mask):
+        if position == len(self.keys):
+            self.table[classes] = self._first(mask)
+            return
+        for class_id, class_mask in enumerate(self.class_masks[position]):
+            self._enumerate(position + 1, classes + (class_id,), mask & class_mask)
+
+    def _first(self, mask):
+        if not mask:
+            return None
+        return self.diagnoses[(mask & -mask).bit_length() - 1]
+
+    def lookup(self, answers):
+        """Returns the first diagnosis whose criteria all hold for the answers, or None."""
+        # option_classes maps None (unanswered) to class 0, so a None class id marks an
+        # answer outside the vocabulary or a multi-select one, and an unhashable answer
+        # raises TypeError; both are resolved without the table.
+        try:
+            classes = tuple([option_classes.get(answers.get(key)) for key, option_classes in self._key_classes])
+        except TypeError:
+            classes = None
+        if classes is None or None in classes:
+            mask = (1 << len(self.diagnoses)) - 1
+            for position, key in enumerate(self.keys):
+                mask &= self._answer_mask(position, answers.get(key))
+            return self._first(mask)
+        try:
+            return self.table[classes]
+        except KeyError:
+            mask = (1 << len(self.diagnoses)) - 1
+            for class_id, masks in zip(classes, self.class_masks):
+                mask &= masks[class_id]
+            diagnosis = self.table[classes] = self._first(mask)
+            return diagnosis
+
+    def _answer_mask(self, position, value):
+        # Diagnoses whose criterion on this question, if any, accepts the answer
+        masks = self.class_masks[position]
+        option_classes = self.option_classes[position]
+        if isinstance(value, MULTI_VALUE_TYPES):
+            mask = masks[0]
+            for option in value:
+                try:
+                    mask |= masks[option_classes.get(option, 0)]
+                except TypeError:
+                    pass
+            return mask
+        return masks[option_classes.get(value, 0)]
+
+    def _possible_masks(self, position, answers):
+        key = self.keys[position]
+        if key in answers:
+            return [self._answer_mask(position, answers[key])]
+        masks = self.class_masks[position]
+        options = self.presentation.options(key)
+        if not options:
+            # A criterion on a key that is never asked can never be satisfied.
+            return [masks[0]]
+        # A multi-select answer is never empty, so its mask is the union of single options'
+        # masks and these bounds hold for it too.
+        return [masks[self.option_classes[position].get(option, 0)] for option in options]
+
+    def candidates(self, answers):
+        """
+        Returns two diagnosis masks for partial answers: the diagnoses that can still
+        match for some choice of the unanswered questions, and those that match for all.
+        """
+        everyone = (1 << len(self.diagnoses)) - 1
+        possible = certain = everyone
+        for position in range(len(self.keys)):
+            union = 0
+            intersection = everyone
+            for mask in self._possible_masks(position, answers):
+                union |= mask
+                intersection &= mask
+            possible &= union
+            certain &= intersection
+        return possible, certain
+
+    def is_decided(self, answers):
+        """Returns True when no answer to the remaining questions can change lookup()."""
+        possible, certain = self.candidates(answers)
+        return not possible or bool(possible & -possible & certain)
+
+    def resolve(self, answers):
+        """
+        Like lookup(), but unanswered questions are treated as still open rather than
+        as failed criteria, so a decided diagnosis is returned before every question is asked.
+        """
+        possible, certain = self.candidates(answers)
+        if possible & -possible & certain:
+            return self._first(possible)
+        return self.lookup(answers)
+
+    def best_question(self, answers):
+        """
+        Returns the unanswered question with the highest expected information gain over
+        the diagnoses still in play, or None once the result is decided.
+        Options are treated as equally likely and diagnoses in play as equally probable.
+        """
+        possible, certain = self.candidates(answers)
+        if not possible or possible & -possible & certain:
+            return None
+
+        in_play = possible.bit_count()
+        best_key = None
+        best_gain = 0.0
+        for question in self.presentation.questions:
+            key, options = question.key, question.options
+            if key in answers or key not in self.keys or not options:
+                continue
+            position = self.keys.index(key)
+            masks = self.class_masks[position]
+            option_classes = self.option_classes[position]
+            remaining = 0.0
+            for option in options:
+                consistent = (possible & masks[option_classes.get(option, 0)]).bit_count()
+                if consistent:
+                    remaining += math.log2(consistent)
+            gain = math.log2(in_play) - remaining / len(options)
+            if best_key is None or gain > best_gain:
+                best_key = key
+                best_gain = gain
+        return best_key
+
+
+class LazyMapping(Mapping):
+    """
+    Read-only mapping of name -> build(name), building each value on first lookup and
+    keeping it for every later one. Safe to share between threads: a value is built by one
+    of them and the others wait for it. Once every name is built, build is released along
+    with whatever it refers to.
+    """
+
+    def __init__(self, names, build):
+        """
+        :param names: iterable of the mapping's keys, in order
+        :param build: callable(name) returning the value for name
+        """
+        self._names = dict.fromkeys(names)
+        self._build = build
+        self._values = {}
+        self._lock = allocate_lock()
+
+    def __getitem__(self, name):
+        value = self._values.get(name)
+        if value is None:
+            if name not in self._names:
+                raise KeyError(name)
+            with self._lock:
+                value = self._values.get(name)
+                if value is None:
+                    value = self._build(name)
+                    self._values[name] = value
+                    if len(self._values) == len(self._names):
+                        self._build = None
+        return value
+
+    def __contains__(self, name):
+        return name in self._names
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def is_built(self, name):
+        """Returns True once the value for name has been built."""
+        return name in self._values
+
+
+class MatchTables(LazyMapping):
+    """
+    Read-only mapping of presentation name -> MatchTable, building each table on first
+    lookup (see LazyMapping). A session only ever asks for the tables of the complaints it
+    opens, so the rest are never enumerated.
+    """
+
+    def __init__(self, presentations):
+        """
+        :param presentations: mapping of name -> er_model.Presentation
+        """
+        super().__init__(presentations, lambda name: MatchTable(presentations[name]))
+
+
+class KnowledgeBase:
+    """
+    Read-only compiled view of an ER_PRESENTATIONS-style dict, shared by every caller:
+    complaint names, the er_model form of each presentation, its bitset form and its
+    match_diagnosis lookup table. Each form of a presentation is built the first time it
+    is looked up (see LazyMapping), so a session that opens one complaint neither imports
+    nor compiles the others. Until then the entry is read from the source dict, which is
+    let go once every presentation has been built.
+    Its presentations and their bitset forms share objects through `pool`; pass a version
+    still loaded as share_with to have a new version share them too.
+    """
+
+    def __init__(self, presentations, share_with=None):
+        """
+        :param share_with: optional KnowledgeBase whose ModelPool this one uses as well;
+            the pool is freed once no version built with it is referenced any more
+        """
+        pool = ModelPool() if share_with is None else share_with.pool
+        self.pool = pool
+        self.complaints = tuple(presentations)
+        self.presentations = LazyMapping(
+            self.complaints, lambda name: Presentation.from_dict(name, presentations[name], pool)
+        )
+        models, compile_presentation = self.presentations, self._compile  # Not self: no reference cycle
+        self.compiled = LazyMapping(self.complaints, lambda name: compile_presentation(pool, models[name]))
+        self.match_tables = MatchTables(models)
+
+    @staticmethod
+    def _compile(pool, presentation):
+        # Keyed on the pooled questions and diagnoses, so an unchanged presentation of another
+        # version built with the same pool gets the same compiled form.
+        return pool.shared(
+            (CompiledPresentation, presentation.questions, presentation.diagnoses),
+            lambda: CompiledPresentation(presentation),
+        )
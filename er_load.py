@@ -0,0 +1,290 @@
+# er_load.py
+# This file load-tests the Streamlit app (main.py) headlessly with streamlit.testing's AppTest:
+# N sessions, each on its own thread as the Streamlit server runs them, pick a chief complaint,
+# answer every question with seeded random choices and start over, for a number of cases each.
+#
+# Usage:
+#     python er_load.py [--sessions 1,5,10,20] [--cases 3] [--mode standard|adaptive|early_stop|rapid]
+#                       [--think-time SECONDS] [--seed S] [--save results.json]
+#     python er_load.py --question-step [--cases 20] [--mode ...] [--seed S]
+#
+# AppTest sets up and tears down a process-wide runtime around every run, so runs from
+# different sessions are serialized by a lock. That matches one app instance closely: its
+# script runs are CPU-bound Python and contend for the same GIL.
+#
+# For each session count it reports the latency of each interaction (one AppTest run: a click
+# and the script runs it triggers, including st.rerun, plus the time queued behind other
+# sessions), its service time without the queueing, the script runs per interaction and per
+# case, and the interaction throughput of the whole instance. A second pass under tracemalloc
+# measures the Python memory each live session retains (AppTest's own copy of the rendered page
+# included), and the peak RSS of the process is printed at the end, so the sessions one
+# instance can serve can be estimated.
+# With --question-step it instead compares the render time of the question step as a whole
+# page and as the question panel fragment alone (see question_step_latency).
+# Requires Streamlit.
+
+import json
+import random
+import threading
+import time
+
+_RUN_LOCK = threading.Lock()
+
+
+def _session_script():
+    # Runs as the Streamlit script of each simulated session: counts script runs, then runs
+    # main.py, or only its question panel as a fragment rerun would (see question_step_latency).
+    import streamlit as st
+
+    import main
+
+    st.session_state["_load_script_runs"] = st.session_state.get("_load_script_runs", 0) + 1
+    if st.session_state.get("_load_panel_only"):
+        main.question_panel(main.get_knowledge_base())
+    else:
+        main.main()
+
+
+def _peak_rss_bytes():
+    import resource
+    import sys
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class Session:
+    """One simulated student, clicking through cases on its own AppTest."""
+
+    def __init__(self, seed, mode="standard", think_time=0.0, timeout=60):
+        """
+        :param think_time: float, mean seconds the student spends reading before each click
+            (exponentially distributed), 0 to click as fast as the app answers
+        """
+        from streamlit.testing.v1 import AppTest
+
+        self.rng = random.Random(seed)
+        self.mode = mode
+        self.think_time = think_time
+        self.app = AppTest.from_function(_session_script, default_timeout=timeout)
+        self.interactions = []  # (latency seconds, service seconds, script runs) per AppTest run
+        self.case_runs = []  # Script runs per completed case
+
+    def _run(self):
+        if self.think_time:
+            time.sleep(self.rng.expovariate(1 / self.think_time))
+        state = self.app.session_state
+        before = state["_load_script_runs"] if "_load_script_runs" in state else 0
+        queued = time.perf_counter()
+        with _RUN_LOCK:
+            began = time.perf_counter()
+            self.app.run()
+            finished = time.perf_counter()
+        if self.app.exception:
+            raise RuntimeError(f"main.py raised: {self.app.exception[0].message}")
+        runs = self.app.session_state["_load_script_runs"] - before
+        self.interactions.append((finished - queued, finished - began, runs))
+        return runs
+
+    def case(self, before_answer=None):
+        """
+        Picks a chief complaint, answers questions until the results page, then starts over.
+        :param before_answer: optional function called with no arguments before each answer
+        """
+        app = self.app
+        runs = 0
+        if not app.session_state or "step" not in app.session_state:
+            runs += self._run()
+        app.radio[0].set_value(self.mode)
+        runs += self._run()
+        complaints = [button for button in app.button if button.key and button.key.startswith("btn_")]
+        self.rng.choice(complaints).click()
+        runs += self._run()
+        if self.mode == "rapid" and app.session_state["step"] == "questions":
+            for select in app.selectbox:
+                select.set_value(self.rng.choice(select.options) if self.rng.random() < 0.8 else None)
+            for select in app.multiselect:
+                select.set_value(self.rng.sample(select.options, min(len(select.options), self.rng.randint(0, 2))))
+            app.button(key="rapid_submit").click()
+            runs += self._run()
+        while app.session_state["step"] == "questions":
+            if before_answer is not None:
+                before_answer()
+            if app.multiselect:
+                select = app.multiselect[0]
+                select.set_value(self.rng.sample(select.options, min(len(select.options), self.rng.randint(1, 2))))
+                runs += self._run()
+                app.button(key=select.key.replace("_select", "_confirm")).click()
+            else:
+                self.rng.choice(list(app.button)).click()
+            runs += self._run()
+        app.button[0].click()  # Start Over
+        runs += self._run()
+        self.case_runs.append(runs)
+
+
+def _percentile(ordered, fraction):
+    # Nearest-rank percentile of a sorted list
+    return ordered[min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))]
+
+
+def run_sessions(count, cases=3, mode="standard", think_time=0.0, seed=0):
+    """
+    Runs `count` concurrent sessions of `cases` cases each.
+    :return: (list of Session, seconds from the first click to the last session finishing)
+    """
+    sessions = [Session(seed * 100003 + index, mode, think_time) for index in range(count)]
+    errors = []
+    start = threading.Barrier(count)
+
+    def drive(session):
+        try:
+            start.wait()
+            for _ in range(cases):
+                session.case()
+        except Exception as error:  # Reported after every session has finished
+            errors.append(error)
+
+    threads = [threading.Thread(target=drive, args=(session,)) for session in sessions]
+    began = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - began
+    if errors:
+        raise errors[0]
+    return sessions, elapsed
+
+
+def question_step_latency(cases=20, mode="standard", seed=0):
+    """
+    Measures the render time of the question step on one session, before each answer: the
+    whole page, as every answer re-rendered it before the question panel became a fragment,
+    and the question panel alone, which is all a fragment rerun executes. AppTest always
+    runs the whole script, so the panel is rendered as the session's only script output.
+    :return: dict of p50/p95/p99 milliseconds for "page" and "panel"
+    """
+    session = Session(seed, mode)
+    app = session.app
+    timings = {"page": [], "panel": []}
+
+    def render_both():
+        for name, panel_only in (("page", False), ("panel", True)):
+            app.session_state["_load_panel_only"] = panel_only
+            began = time.perf_counter()
+            app.run()
+            timings[name].append(time.perf_counter() - began)
+            if app.exception:
+                raise RuntimeError(f"main.py raised: {app.exception[0].message}")
+        app.session_state["_load_panel_only"] = False
+
+    for _ in range(cases):
+        session.case(render_both)
+    result = {}
+    for name, seconds in timings.items():
+        seconds.sort()
+        result[name] = {
+            f"p{round(fraction * 100)}_ms": _percentile(seconds, fraction) * 1000 for fraction in (0.50, 0.95, 0.99)
+        }
+    return result
+
+
+def session_memory(count, cases=1, mode="standard", seed=0):
+    """Returns the Python memory, in bytes, retained per live session after `cases` cases each."""
+    import gc
+    import tracemalloc
+
+    gc.collect()
+    tracemalloc.start()
+    sessions, _ = run_sessions(count, cases, mode, 0.0, seed)
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del sessions
+    return retained / count
+
+
+def measure(count, cases=3, mode="standard", think_time=0.0, seed=0):
+    """
+    Runs `count` concurrent sessions, then measures their memory in a second, slower pass of
+    one case per session under tracemalloc.
+    :return: dict of the measurements for this session count
+    """
+    sessions, elapsed = run_sessions(count, cases, mode, think_time, seed)
+    interactions = [interaction for session in sessions for interaction in session.interactions]
+    latencies = sorted(latency for latency, _, _ in interactions)
+    case_runs = [script_runs for session in sessions for script_runs in session.case_runs]
+    return {
+        "sessions": count,
+        "cases": len(case_runs),
+        "interactions": len(interactions),
+        "interactions_per_second": len(interactions) / elapsed,
+        "p50_ms": _percentile(latencies, 0.50) * 1000,
+        "p95_ms": _percentile(latencies, 0.95) * 1000,
+        "p99_ms": _percentile(latencies, 0.99) * 1000,
+        "service_ms": sum(service for _, service, _ in interactions) / len(interactions) * 1000,
+        "script_runs_per_interaction": sum(runs for _, _, runs in interactions) / len(interactions),
+        "script_runs_per_case": sum(case_runs) / len(case_runs),
+        "memory_per_session_kib": session_memory(count, 1, mode, seed) / 1024,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    from streamlit import config, logger
+
+    parser = argparse.ArgumentParser(description="Load-test main.py with simulated Streamlit sessions")
+    parser.add_argument("--sessions", default="1,5,10,20", help="comma-separated session counts to run")
+    parser.add_argument("--cases", type=int, default=3, help="cases each session clicks through")
+    parser.add_argument("--mode", default="standard", choices=("standard", "adaptive", "early_stop", "rapid"))
+    parser.add_argument("--think-time", type=float, default=0.0, help="mean seconds between a session's clicks")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save", help="write the results to this JSON file")
+    parser.add_argument("--question-step", action="store_true", help="benchmark rendering the question step")
+    arguments = parser.parse_args()
+    # AppTest runs in bare mode, which warns on every session_state read from this thread.
+    # Parsing the config first keeps it from resetting the level afterwards.
+    config.get_config_options()
+    logger.set_log_level("error")
+
+    # Warm-up: imports Streamlit and main.py and compiles the knowledge base once, as the
+    # first visitor of a freshly started server would.
+    run_sessions(1, 1, arguments.mode, 0.0, arguments.seed)
+
+    if arguments.question_step:
+        latency = question_step_latency(arguments.cases, arguments.mode, arguments.seed)
+        print(f"Question step render time over {arguments.cases} cases, {arguments.mode} questions")
+        for name, label in (("page", "whole page"), ("panel", "question panel fragment")):
+            print(f"  {label:<24}" + "".join(f" {key[:-3]} {value:5.1f} ms" for key, value in latency[name].items()))
+        if arguments.save:
+            with open(arguments.save, "w", encoding="utf-8") as results_file:
+                json.dump({"cases": arguments.cases, "mode": arguments.mode, **latency}, results_file, indent=1)
+        sys.exit()
+
+    print(
+        f"{arguments.cases} cases per session, {arguments.mode} questions, {arguments.think_time} s think time,"
+        f" Python {sys.version.split()[0]}"
+    )
+    print(
+        f"{'sessions':>8} {'clicks/s':>9} {'p50':>9} {'p95':>9} {'p99':>9} {'service':>9}"
+        f" {'runs/click':>11} {'runs/case':>10} {'memory/session':>15}"
+    )
+    results = []
+    for count in (int(value) for value in arguments.sessions.split(",")):
+        result = measure(count, arguments.cases, arguments.mode, arguments.think_time, arguments.seed)
+        results.append(result)
+        print(
+            f"{count:>8} {result['interactions_per_second']:>9.1f} {result['p50_ms']:>6.1f} ms"
+            f" {result['p95_ms']:>6.1f} ms {result['p99_ms']:>6.1f} ms {result['service_ms']:>6.1f} ms"
+            f" {result['script_runs_per_interaction']:>11.2f} {result['script_runs_per_case']:>10.1f}"
+            f" {result['memory_per_session_kib']:>11.1f} KiB"
+        )
+    print(f"Peak RSS of the process: {_peak_rss_bytes() / (1024 * 1024):.1f} MiB")
+    if arguments.save:
+        settings = {"cases": arguments.cases, "mode": arguments.mode, "think_time": arguments.think_time}
+        with open(arguments.save, "w", encoding="utf-8") as results_file:
+            json.dump({**settings, "results": results}, results_file, indent=1)
+        print(f"Saved {arguments.save}")
@@ -0,0 +1,307 @@
+# er_model.py
+# This file defines the immutable, typed form of a knowledge base: Presentation, Question,
+# Diagnosis and Criterion objects with __slots__, holding tuples of interned strings.
+# Every option string is interned with sys.intern, so the interned string itself serves as
+# the option id. Option tuples and identical questions, criteria and diagnoses are shared
+# through a ModelPool: across the presentations of one knowledge base, and across several
+# versions loaded side by side when they are built with the same pool. A pool lives only as
+# long as the versions built with it, so retiring every version that used it frees it as well.
+#
+# Run `python er_model.py` to compare the memory footprint of the dict and model forms and of
+# whole KnowledgeBase versions, and to check what is left once the versions are released.
+
+import sys
+
+# Answer types that hold several findings for one question. A multi-select answer satisfies
+# a criterion when at least one of its options does.
+MULTI_VALUE_TYPES = (set, frozenset, list, tuple)
+
+# Questions whose findings usually come several at a time; main.py offers them as a
+# multi-select. Any question accepts a multi-select answer when scoring.
+MULTI_SELECT_QUESTIONS = frozenset({
+    "associated_symptoms", "physical_exam", "past_medical_history", "social_history", "risk_factors", "red_flags",
+})
+
+
+class _Frozen:
+    """Base for the model classes: attributes are set once in __init__ and never again."""
+
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    __delattr__ = __setattr__
+
+    def _set(self, **fields):
+        for name, value in fields.items():
+            object.__setattr__(self, name, value)
+
+
+class Criterion(_Frozen):
+    """
+    One entry of a diagnosis's "match" dict.
+    Whether written as a plain string or a list, a criterion is normalized into the
+    frozenset `accepted`, and an answer satisfies it only when it is an exact member.
+    `values` keeps the options in the order they were written, and `scalar` records a
+    plain-string criterion so the dict form can be written back.
+    """
+
+    __slots__ = ("key", "values", "accepted", "scalar")
+
+    def __init__(self, key, values, scalar, accepted=None):
+        """:param accepted: optional frozenset of the values, to share one already built"""
+        self._set(key=key, values=values, accepted=frozenset(values) if accepted is None else accepted, scalar=scalar)
+
+    def accepts(self, value):
+        """
+        Exact membership test shared by match_diagnosis and run_diagnostic_tree.
+        A multi-select answer is accepted when any of its options is.
+        """
+        if isinstance(value, MULTI_VALUE_TYPES):
+            return any(self.accepts(option) for option in value)
+        try:
+            return value in self.accepted
+        except TypeError:  # Unhashable answers never match
+            return False
+
+    def raw(self):
+        """Returns the criterion as it is written in ER_PRESENTATIONS."""
+        return self.values[0] if self.scalar else list(self.values)
+
+    def __repr__(self):
+        return f"Criterion({self.key!r}, {self.raw()!r})"
+
+
+class Question(_Frozen):
+    """A question and its answer options; multi is set for a multi-select question."""
+
+    __slots__ = ("key", "options", "multi")
+
+    def __init__(self, key, options, multi=False):
+        self._set(key=key, options=options, multi=multi)
+
+    def __repr__(self):
+        return f"Question({self.key!r}, {self.options!r})"
+
+
+class Diagnosis(_Frozen):
+    """A diagnosis with its match criteria and teaching text."""
+
+    __slots__ = ("name", "criteria", "differentiating_factors")
+
+    def __init__(self, name, criteria, differentiating_factors):
+        self._set(name=name, criteria=criteria, differentiating_factors=differentiating_factors)
+
+    def criterion(self, key):
+        """Returns the criterion on a question key, or None."""
+        for criterion in self.criteria:
+            if criterion.key == key:
+                return criterion
+        return None
+
+    def __repr__(self):
+        return f"Diagnosis({self.name!r})"
+
+
+class Presentation(_Frozen):
+    """A chief complaint: its questions, in asking order, and its diagnoses, in match order."""
+
+    __slots__ = ("name", "questions", "diagnoses")
+
+    def __init__(self, name, questions, diagnoses):
+        self._set(name=name, questions=questions, diagnoses=diagnoses)
+
+    def question(self, key):
+        """Returns the question asked under a key, or None."""
+        for question in self.questions:
+            if question.key == key:
+                return question
+        return None
+
+    def options(self, key):
+        """Returns the answer options of a question, or () when it is never asked."""
+        question = self.question(key)
+        return () if question is None else question.options
+
+    @classmethod
+    def from_dict(cls, name, presentation_data, pool=None):
+        """
+        Builds the model form of one ER_PRESENTATIONS entry, sharing interned objects.
+        :param pool: ModelPool to share objects through, or None for a pool of its own
+        """
+        if pool is None:
+            pool = ModelPool()
+        questions = tuple(
+            pool.question(sys.intern(key), pool.strings(options), key in MULTI_SELECT_QUESTIONS)
+            for key, options in presentation_data["questions"].items()
+        )
+        diagnoses = tuple(
+            pool.diagnosis(
+                sys.intern(diagnosis["name"]),
+                tuple(
+                    pool.criterion(sys.intern(key), pool.strings([value] if isinstance(value, str) else value),
+                                   isinstance(value, str))
+                    for key, value in diagnosis["match"].items()
+                ),
+                sys.intern(diagnosis["differentiating_factors"]),
+            )
+            for diagnosis in presentation_data["diagnoses"]
+        )
+        return cls(sys.intern(name), questions, diagnoses)
+
+    def to_dict(self):
+        """Returns the ER_PRESENTATIONS dict form of this presentation."""
+        return {
+            "questions": {question.key: list(question.options) for question in self.questions},
+            "diagnoses": [
+                {
+                    "name": diagnosis.name,
+                    "match": {criterion.key: criterion.raw() for criterion in diagnosis.criteria},
+                    "differentiating_factors": diagnosis.differentiating_factors,
+                }
+                for diagnosis in self.diagnoses
+            ],
+        }
+
+    def __repr__(self):
+        return f"Presentation({self.name!r})"
+
+
+class ModelPool:
+    """
+    Immutable objects shared by the presentations built with it: option tuples, accepted
+    frozensets, questions, criteria and diagnoses. It is owned by whoever loads the knowledge base
+    (a KnowledgeBase holds the one its presentations were built with) and is never pruned,
+    so it is dropped together with the versions that use it rather than kept per process.
+    """
+
+    def __init__(self):
+        self._objects = {}
+
+    def __len__(self):
+        return len(self._objects)
+
+    def strings(self, values):
+        """Returns the shared tuple of the interned values."""
+        strings = tuple(sys.intern(value) for value in values)
+        return self._objects.setdefault(strings, strings)
+
+    def accepted(self, values):
+        """Returns the shared frozenset of the values."""
+        accepted = frozenset(values)
+        return self._objects.setdefault(accepted, accepted)
+
+    def question(self, key, options, multi):
+        pool_key = (Question, key, options, multi)
+        question = self._objects.get(pool_key)
+        if question is None:
+            question = self._objects[pool_key] = Question(key, options, multi)
+        return question
+
+    def criterion(self, key, values, scalar):
+        pool_key = (Criterion, key, values, scalar)
+        criterion = self._objects.get(pool_key)
+        if criterion is None:
+            criterion = self._objects[pool_key] = Criterion(key, values, scalar, self.accepted(values))
+        return criterion
+
+    def diagnosis(self, name, criteria, differentiating_factors):
+        pool_key = (Diagnosis, name, criteria, differentiating_factors)
+        diagnosis = self._objects.get(pool_key)
+        if diagnosis is None:
+            diagnosis = self._objects[pool_key] = Diagnosis(name, criteria, differentiating_factors)
+        return diagnosis
+
+    def shared(self, pool_key, build):
+        """
+        Returns the object pooled under pool_key, calling build() for it on first use.
+        For objects derived from pooled ones, such as er_index's compiled presentations:
+        a key made of pooled objects is equal only for an identical source.
+        """
+        shared = self._objects.get(pool_key)
+        if shared is None:
+            shared = self._objects[pool_key] = build()
+        return shared
+
+
+def build_model(presentations, pool=None):
+    """
+    Converts an ER_PRESENTATIONS-style mapping into a dict of name -> Presentation.
+    :param pool: ModelPool to share objects through, for example the one of a version
+        still loaded, or None for a new pool shared by these presentations only
+    """
+    if pool is None:
+        pool = ModelPool()
+    return {name: Presentation.from_dict(name, data, pool) for name, data in presentations.items()}
+
+
+def _measure(build):
+    import gc
+    import tracemalloc
+
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def _load_shards():
+    # Executes every shard afresh, as reloading a new knowledge-base version would.
+    import os
+
+    from er_presentations import SHARDS
+
+    directory = os.path.join(os.path.dirname(os.path.abspath(__file__)), "er_presentations")
+    presentations = {}
+    for name, module in SHARDS.items():
+        namespace = {}
+        with open(os.path.join(directory, f"{module}.py")) as shard:
+            exec(compile(shard.read(), shard.name, "exec"), namespace)
+        presentations[name] = namespace["PRESENTATION"]
+    return presentations
+
+
+def _build_versions(versions):
+    pool = ModelPool()
+    return [build_model(_load_shards(), pool) for _ in range(versions)]
+
+
+def _build_knowledge_bases(versions):
+    # Model and bitset forms of every presentation, with every version sharing the pool of the first
+    from er_index import KnowledgeBase
+
+    knowledge_bases = [KnowledgeBase(_load_shards())]
+    while len(knowledge_bases) < versions:
+        knowledge_bases.append(KnowledgeBase(_load_shards(), share_with=knowledge_bases[0]))
+    for knowledge_base in knowledge_bases:
+        for _ in knowledge_base.compiled.values():  # Each form is built on first lookup
+            pass
+    return knowledge_bases
+
+
+if __name__ == "__main__":
+    import gc
+    import tracemalloc
+
+    versions = 3
+    _, dict_size = _measure(lambda: [_load_shards() for _ in range(versions)])
+    _, model_size = _measure(lambda: _build_versions(versions))
+    print(f"{versions} knowledge-base versions of {len(_load_shards())} presentations held in memory")
+    print(f"dict form:  {dict_size / 1024:8.1f} KiB")
+    print(f"model form: {model_size / 1024:8.1f} KiB ({model_size / dict_size:.0%} of the dict form)")
+    _, knowledge_base_size = _measure(lambda: _build_knowledge_bases(versions))
+    print(
+        f"KnowledgeBase: {knowledge_base_size / 1024:8.1f} KiB ({knowledge_base_size / dict_size:.0%} of the dict form,"
+        " model and bitset forms)"
+    )
+
+    gc.collect()
+    tracemalloc.start()
+    loaded = _build_versions(versions)
+    del loaded
+    gc.collect()
+    print(f"left after releasing them: {tracemalloc.get_traced_memory()[0] / 1024:8.1f} KiB")
+    tracemalloc.stop()
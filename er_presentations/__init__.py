@@ -0,0 +1,147 @@
+# er_presentations/__init__.py
+# The expanded ER knowledge base, split into one module per presentation.
+# Each shard defines PRESENTATION with the "questions" and "diagnoses" of one chief complaint
+# and is only imported the first time that presentation is looked up.
+
+from _collections_abc import MutableMapping  # collections.abc without its extra import
+
+# Chief complaint -> shard module, in display order
+SHARDS = {
+    # 1-5: Classic Chief Complaints
+    "Chest Pain": "chest_pain",
+    "Abdominal Pain": "abdominal_pain",
+    "Shortness of Breath": "shortness_of_breath",
+    "Headache": "headache",
+    "Back Pain": "back_pain",
+    # 6-10: Fever & Infectious
+    "Fever": "fever",
+    "Sore Throat": "sore_throat",
+    "Cough": "cough",
+    "Rash": "rash",
+    "Nausea and Vomiting": "nausea_and_vomiting",
+    # 11-15: Trauma & Orthopedic
+    "Extremity Pain/Injury": "extremity_pain_injury",
+    "Head Injury": "head_injury",
+    "Trauma (General)": "trauma_general",
+    "Joint Pain/Swelling": "joint_pain_swelling",
+    "Acute Wounds": "acute_wounds",
+    # 16-20: Cardiovascular
+    "Palpitations": "palpitations",
+    "Hypertension": "hypertension",
+    "Syncope": "syncope",
+    "Dizziness": "dizziness",
+    "Edema": "edema",
+    # 21-25: Neurological
+    "Weakness": "weakness",
+    "Seizures": "seizures",
+    "Altered Mental Status": "altered_mental_status",
+    "Focal Neurological Deficit": "focal_neurological_deficit",
+    "Vertigo": "vertigo",
+    # 21-25: Neurological (continued)
+    "Numbness/Tingling": "numbness_tingling",
+    "Speech Difficulty": "speech_difficulty",
+    "Tremors": "tremors",
+    "Visual Disturbance": "visual_disturbance",
+    # 26-30: Gastrointestinal
+    "Diarrhea": "diarrhea",
+    "Constipation": "constipation",
+    "Hematochezia": "hematochezia",
+    "Melena": "melena",
+    "Jaundice": "jaundice",
+    # 31-35: Genitourinary
+    "Dysuria": "dysuria",
+    "Hematuria": "hematuria",
+    "Flank Pain": "flank_pain",
+    "Testicular Pain": "testicular_pain",
+    "Vaginal Bleeding": "vaginal_bleeding",
+    # 36-40: Respiratory
+    "Hemoptysis": "hemoptysis",
+    "Wheezing": "wheezing",
+    "Stridor": "stridor",
+    "Cyanosis": "cyanosis",
+    "Respiratory Distress": "respiratory_distress",
+    # 41-45: ENT & Ophthalmologic
+    "Epistaxis": "epistaxis",
+    "Ear Pain": "ear_pain",
+    "Eye Pain/Redness": "eye_pain_redness",
+    "Facial Swelling": "facial_swelling",
+    "Neck Pain": "neck_pain",
+    # 46-50: Miscellaneous & New Presentations
+    "Foreign Body Ingestion": "foreign_body_ingestion",
+    "Fever in Pediatric Patient": "fever_in_pediatric_patient",
+    "Allergic Reaction": "allergic_reaction",
+    "Hypotension/Shock": "hypotension_shock",
+    "Fatigue": "fatigue",
+}
+
+
+class LazyPresentations(MutableMapping):
+    """
+    Dict-compatible ER_PRESENTATIONS that imports each presentation's shard on first access.
+    Membership tests, len() and iterating over the names never load a shard; the values()
+    and items() views load each one as they reach it.
+    Entries can be assigned or deleted like a regular dict, and callbacks registered with
+    watch() are told the name of each one that is. The rest of the dict interface (get,
+    pop, setdefault, update, ==, ...) comes from MutableMapping.
+    """
+
+    def __init__(self, shards, package=__name__):
+        self._package = package
+        self._shards = dict(shards)
+        self._names = dict.fromkeys(shards)
+        self._loaded = {}
+        self._watchers = []
+
+    def __getitem__(self, name):
+        try:
+            return self._loaded[name]
+        except KeyError:
+            pass
+        if name not in self._shards:
+            raise KeyError(name)
+        module = __import__(f"{self._package}.{self._shards[name]}", fromlist=["PRESENTATION"])
+        return self._loaded.setdefault(name, module.PRESENTATION)
+
+    def __setitem__(self, name, presentation_data):
+        self._names[name] = None
+        self._shards.pop(name, None)
+        self._loaded[name] = presentation_data
+        self._changed(name)
+
+    def __delitem__(self, name):
+        del self._names[name]
+        self._shards.pop(name, None)
+        self._loaded.pop(name, None)
+        self._changed(name)
+
+    def _changed(self, name):
+        for callback in self._watchers:
+            callback(name)
+
+    def watch(self, callback):
+        """Registers callback(name), called after an entry is assigned or deleted."""
+        self._watchers.append(callback)
+
+    def __contains__(self, name):
+        return name in self._names
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self):
+        return len(self._names)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({len(self._loaded)} of {len(self)} loaded)"
+
+    def copy(self):
+        """Returns a plain dict of every presentation, loading all shards."""
+        return dict(self.items())
+
+    def is_loaded(self, name):
+        """Returns True once the presentation's shard has been imported."""
+        return name in self._loaded
+
+    def from_shard(self, name):
+        """Returns True while the entry is still the one defined by its shard (not assigned over)."""
+        return name in self._shards
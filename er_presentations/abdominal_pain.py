@@ -0,0 +1,79 @@
+# er_presentations/abdominal_pain.py
+# Questions and diagnoses for the "Abdominal Pain" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "location": ["RUQ", "LUQ", "RLQ", "LLQ", "Epigastric", "Periumbilical", "Diffuse", "Suprapubic", "Flank"],
+        "character": ["Colicky", "Dull", "Sharp", "Burning", "Cramping", "Tearing"],
+        "onset": ["Sudden", "Gradual"],
+        "radiation": ["To the shoulder", "To the back", "To the groin", "To the pelvis", "None"],
+        "associated_symptoms": ["Nausea/Vomiting", "Fever/Chills", "Bloating", "Diarrhea", "Constipation", "Weight loss", "Jaundice", "Hematochezia", "Melena", "Dysuria"],
+        "exacerbating_factors": ["Fatty meals", "Movement", "Eating", "Coughing", "None"],
+        "relieving_factors": ["Antacids", "Bowel movement", "Fetal position", "None"],
+        "past_medical_history": ["Prior surgeries", "Gallstones", "Alcohol use", "NSAID use", "IBD", "Pregnancy", "Pancreatitis", "AAA"],
+        "physical_exam": ["Rebound tenderness", "Guarding", "Murphy’s sign", "Rovsing’s sign", "CVA tenderness", "Pulsatile mass"],
+        "social_history": ["Recent travel", "Alcohol use", "IV drug use"]
+    },
+    "diagnoses": [
+        {
+            "name": "Appendicitis",
+            "match": {"location": ["Periumbilical", "RLQ"], "character": "Sharp", "associated_symptoms": ["Fever/Chills", "Nausea/Vomiting"], "physical_exam": ["Rebound tenderness", "Rovsing’s sign"]},
+            "differentiating_factors": "Pain starts periumbilical, migrates to RLQ (McBurney’s point). Anorexia, low-grade fever, rebound tenderness. Rovsing’s, psoas, or obturator signs positive. CT: thickened appendix, periappendiceal fluid; ultrasound in pediatrics. Surgical emergency (appendectomy). USMLE key: migration of pain."
+        },
+        {
+            "name": "Cholecystitis",
+            "match": {"location": "RUQ", "character": ["Colicky", "Dull"], "exacerbating_factors": "Fatty meals", "physical_exam": "Murphy’s sign"},
+            "differentiating_factors": "RUQ pain radiating to right shoulder, post-fatty meal. Murphy’s sign positive. Ultrasound: gallstones, wall thickening, pericholecystic fluid. Leukocytosis, elevated LFTs. Antibiotics (ceftriaxone + metronidazole), cholecystectomy. USMLE key: Murphy’s sign specific."
+        },
+        {
+            "name": "Diverticulitis",
+            "match": {"location": "LLQ", "character": "Dull", "associated_symptoms": ["Fever/Chills", "Constipation"]},
+            "differentiating_factors": "LLQ pain with fever, leukocytosis, often elderly. CT: sigmoid diverticula, fat stranding, or abscess. Antibiotics (ciprofloxacin + metronidazole); surgery for complications. USMLE key: LLQ pain in older patients."
+        },
+        {
+            "name": "Pancreatitis",
+            "match": {"location": ["Epigastric", "LUQ"], "character": "Dull", "radiation": "To the back", "past_medical_history": ["Alcohol use", "Gallstones"]},
+            "differentiating_factors": "Epigastric pain radiating to back, nausea/vomiting. Risk factors: alcohol, gallstones, hypertriglyceridemia. Lipase >3x upper limit, amylase elevated. CT for complications (necrosis, pseudocyst). IV fluids, NPO, pain control. USMLE key: lipase more specific."
+        },
+        {
+            "name": "Peptic Ulcer Disease (PUD)",
+            "match": {"location": "Epigastric", "character": "Burning", "relieving_factors": "Antacids", "past_medical_history": "NSAID use"},
+            "differentiating_factors": "Gnawing epigastric pain; duodenal ulcers relieved by food, gastric worsened. Risk factors: H. pylori, NSAIDs. EGD diagnostic; H. pylori testing (urea breath test, stool antigen). PPIs, H. pylori eradication (clarithromycin, amoxicillin, PPI). USMLE key: perforation risk (free air on CXR)."
+        },
+        {
+            "name": "Bowel Obstruction",
+            "match": {"location": "Diffuse", "character": "Cramping", "associated_symptoms": ["Nausea/Vomiting", "Constipation"]},
+            "differentiating_factors": "Cramping pain, vomiting (feculent if distal), distension, no flatus/stool. Risk factors: adhesions, hernias, malignancy. X-ray: air-fluid levels, dilated loops. NG tube, fluids; surgery if strangulation. USMLE key: high-pitched bowel sounds early."
+        },
+        {
+            "name": "Mesenteric Ischemia",
+            "match": {"location": "Diffuse", "character": "Severe", "associated_symptoms": ["Nausea/Vomiting"], "past_medical_history": "CAD"},
+            "differentiating_factors": "Severe pain out of proportion to exam, elderly with vascular risk factors (atrial fibrillation). CT angiography; lactic acidosis. Surgical emergency (revascularization). USMLE key: disproportionate pain."
+        },
+        {
+            "name": "Ectopic Pregnancy",
+            "match": {"location": ["RLQ", "LLQ"], "character": "Sharp", "associated_symptoms": "Vaginal bleeding", "past_medical_history": "Pregnancy"},
+            "differentiating_factors": "Unilateral pelvic pain, vaginal bleeding, positive β-hCG. Transvaginal ultrasound: no intrauterine pregnancy, adnexal mass. Methotrexate or surgery. USMLE key: rule out in reproductive-age women."
+        },
+        {
+            "name": "Abdominal Aortic Aneurysm (AAA) Rupture",
+            "match": {"location": ["Diffuse", "Flank"], "character": "Tearing", "associated_symptoms": ["Hypotension", "Syncope"], "physical_exam": "Pulsatile mass"},
+            "differentiating_factors": "Sudden, severe pain with hypotension, pulsatile mass. Risk factors: smoking, hypertension, elderly males. Bedside ultrasound or CT. Surgical emergency. USMLE key: classic triad (pain, hypotension, pulsatile mass)."
+        },
+        {
+            "name": "Gastroenteritis",
+            "match": {"location": "Diffuse", "character": "Cramping", "associated_symptoms": ["Diarrhea", "Nausea/Vomiting"], "social_history": "Recent travel"},
+            "differentiating_factors": "Cramping pain with diarrhea, vomiting, often viral (norovirus) or bacterial (Salmonella). Stool studies if severe. Fluids, antiemetics (ondansetron). USMLE key: dehydration risk."
+        },
+        {
+            "name": "Ovarian Torsion",
+            "match": {"location": ["RLQ", "LLQ"], "character": "Sharp", "associated_symptoms": "Nausea/Vomiting", "past_medical_history": "Pregnancy"},
+            "differentiating_factors": "Sudden, unilateral pelvic pain, nausea. Ultrasound with Doppler: enlarged ovary, reduced flow. Surgical detorsion. USMLE key: ovarian cyst or pregnancy risk."
+        },
+        {
+            "name": "Perforated Viscus",
+            "match": {"location": "Diffuse", "character": "Sharp", "associated_symptoms": ["Fever", "Nausea/Vomiting"], "physical_exam": "Guarding"},
+            "differentiating_factors": "Sudden, severe pain with guarding, rebound tenderness. CXR: free air under diaphragm. Surgical emergency. USMLE key: often due to perforated ulcer or appendix."
+        }
+    ]
+}
@@ -0,0 +1,34 @@
+# er_presentations/acute_wounds.py
+# Questions and diagnoses for the "Acute Wounds" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "type": ["Laceration", "Abrasion", "Puncture wound", "Avulsion"],
+        "location": ["Head/Face", "Extremity", "Trunk"],
+        "risk_factors": ["Contaminated wound", "Animal bite", "Diabetic"],
+        "physical_exam": ["Foreign body", "Signs of infection"],
+        "past_medical_history": ["Tetanus status", "Diabetes"]
+    },
+    "diagnoses": [
+        {
+            "name": "Laceration",
+            "match": {"type": "Laceration"},
+            "differentiating_factors": "Clean cut requiring sutures. Irrigate, explore for foreign bodies. USMLE key: cosmetic closure for face."
+        },
+        {
+            "name": "Abscess",
+            "match": {"location": "Extremity", "risk_factors": "Diabetic", "physical_exam": "Signs of infection"},
+            "differentiating_factors": "Fluctuant, tender, red nodule. Incision and drainage, antibiotics if systemic. USMLE key: MRSA common."
+        },
+        {
+            "name": "Animal Bite",
+            "match": {"risk_factors": "Animal bite"},
+            "differentiating_factors": "Puncture wounds, crush injuries. Rabies prophylaxis, tetanus, antibiotics (amoxicillin-clavulanate). USMLE key: Pasteurella in cat bites."
+        },
+        {
+            "name": "Tetanus",
+            "match": {"past_medical_history": "Tetanus status", "type": "Puncture wound"},
+            "differentiating_factors": "Muscle stiffness, spasms post-dirty wound. Tetanus immunoglobulin, vaccine. USMLE key: unvaccinated patients."
+        }
+    ]
+}
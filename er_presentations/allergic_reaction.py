@@ -0,0 +1,34 @@
+# er_presentations/allergic_reaction.py
+# Questions and diagnoses for the "Allergic Reaction" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Sudden", "Gradual"],
+        "associated_symptoms": ["Rash", "Wheezing", "Swelling", "Dyspnea"],
+        "past_medical_history": ["Allergies", "Asthma"],
+        "physical_exam": ["Urticaria", "Angioedema"],
+        "social_history": ["Allergen exposure"]
+    },
+    "diagnoses": [
+        {
+            "name": "Anaphylaxis",
+            "match": {"onset": "Sudden", "associated_symptoms": ["Wheezing", "Dyspnea"], "physical_exam": "Angioedema"},
+            "differentiating_factors": "Rapid-onset rash, wheezing, hypotension. IM epinephrine, antihistamines, steroids. USMLE key: biphasic reaction risk."
+        },
+        {
+            "name": "Urticaria",
+            "match": {"onset": "Sudden", "associated_symptoms": "Rash", "physical_exam": "Urticaria"},
+            "differentiating_factors": "Itchy hives, no systemic symptoms. Antihistamines (cetirizine). USMLE key: rule out anaphylaxis."
+        },
+        {
+            "name": "Angioedema",
+            "match": {"onset": "Sudden", "associated_symptoms": "Swelling", "past_medical_history": "Allergies"},
+            "differentiating_factors": "Non-pitting swelling, often ACE inhibitor-related. C1 esterase inhibitor for HAE, antihistamines for allergic. USMLE key: drug history."
+        },
+        {
+            "name": "Contact Dermatitis",
+            "match": {"onset": "Gradual", "associated_symptoms": "Rash"},
+            "differentiating_factors": "Localized rash, itching post-allergen contact. Topical steroids. USMLE key: avoid allergen."
+        }
+    ]
+}
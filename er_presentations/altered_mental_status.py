@@ -0,0 +1,34 @@
+# er_presentations/altered_mental_status.py
+# Questions and diagnoses for the "Altered Mental Status" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Sudden", "Gradual"],
+        "associated_symptoms": ["Fever", "Headache", "Weakness", "Seizures"],
+        "past_medical_history": ["Diabetes", "Drug/alcohol use", "Stroke", "Infection"],
+        "physical_exam": ["Focal deficits", "Nuchal rigidity"],
+        "social_history": ["Drug use", "Alcohol use"]
+    },
+    "diagnoses": [
+        {
+            "name": "Hypoglycemia",
+            "match": {"onset": "Sudden", "past_medical_history": "Diabetes"},
+            "differentiating_factors": "Confusion, diaphoresis, anxiety. Glucose <70 mg/dL. IV dextrose. USMLE key: rapid response to glucose."
+        },
+        {
+            "name": "Infectious Encephalitis",
+            "match": {"onset": "Gradual", "associated_symptoms": ["Fever", "Headache"]},
+            "differentiating_factors": "Fever, headache, altered status. LP: lymphocytic pleocytosis. Acyclovir for HSV. USMLE key: viral etiology."
+        },
+        {
+            "name": "Toxic-Metabolic Encephalopathy",
+            "match": {"onset": "Gradual", "past_medical_history": ["Drug/alcohol use"]},
+            "differentiating_factors": "Confusion due to drugs, organ failure. Treat underlying cause. USMLE key: reversible with correction."
+        },
+        {
+            "name": "Stroke",
+            "match": {"onset": "Sudden", "associated_symptoms": "Weakness", "physical_exam": "Focal deficits"},
+            "differentiating_factors": "Sudden altered status with focal deficits. CT head, tPA if ischemic. USMLE key: time-sensitive."
+        }
+    ]
+}
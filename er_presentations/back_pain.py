@@ -0,0 +1,53 @@
+# er_presentations/back_pain.py
+# Questions and diagnoses for the "Back Pain" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "location": ["Cervical", "Thoracic", "Lumbar", "Sacral"],
+        "onset": ["Sudden (with injury)", "Gradual"],
+        "radiation": ["To the leg", "To the chest", "To the groin", "None"],
+        "red_flags": ["Fever", "Urinary retention", "Saddle anesthesia", "Weight loss", "Neurological deficits", "Bowel incontinence"],
+        "exacerbating_factors": ["Movement", "Coughing", "None"],
+        "relieving_factors": ["Rest", "Heat", "None"],
+        "past_medical_history": ["Trauma", "Cancer", "Infection", "Osteoporosis"],
+        "physical_exam": ["Spinal tenderness", "Paraspinal muscle spasm", "Straight leg raise positive"],
+        "social_history": ["IV drug use", "Heavy lifting"]
+    },
+    "diagnoses": [
+        {
+            "name": "Lumbar Strain",
+            "match": {"location": "Lumbar", "onset": "Sudden (with injury)", "radiation": "None"},
+            "differentiating_factors": "Localized pain post-lifting or trauma, improves with rest. No neurological deficits. NSAIDs, muscle relaxants, physical therapy. USMLE key: benign, common cause."
+        },
+        {
+            "name": "Herniated Disc",
+            "match": {"location": "Lumbar", "radiation": "To the leg", "physical_exam": "Straight leg raise positive"},
+            "differentiating_factors": "Radiating pain in dermatomal pattern, sensory/motor deficits. Positive straight leg raise. MRI diagnostic. Steroids, surgery if progressive deficits. USMLE key: sciatica symptoms."
+        },
+        {
+            "name": "Aortic Dissection",
+            "match": {"location": ["Thoracic", "Lumbar"], "onset": "Sudden (with injury)", "character": "Tearing"},
+            "differentiating_factors": "Severe, tearing pain radiating to back, unequal pulses or BP differential. CT/MRI diagnostic. Surgical emergency; beta-blockers for BP. USMLE key: pulse deficit."
+        },
+        {
+            "name": "Pyelonephritis",
+            "match": {"location": "Lumbar", "red_flags": ["Fever"], "associated_symptoms": "Dysuria"},
+            "differentiating_factors": "Flank pain, fever, dysuria, CVA tenderness. Urinalysis: pyuria, nitrites. Antibiotics (ciprofloxacin). USMLE key: CVA tenderness."
+        },
+        {
+            "name": "Spinal Epidural Abscess",
+            "match": {"red_flags": ["Fever", "Neurological deficits"], "social_history": "IV drug use"},
+            "differentiating_factors": "Back pain with fever, neurological deficits. MRI diagnostic. Antibiotics (vancomycin, ceftriaxone), surgical drainage. USMLE key: IV drug use, rapid progression."
+        },
+        {
+            "name": "Cauda Equina Syndrome",
+            "match": {"red_flags": ["Saddle anesthesia", "Urinary retention", "Bowel incontinence"]},
+            "differentiating_factors": "Low back pain, saddle anesthesia, urinary retention. MRI: disc herniation or mass. Surgical emergency. USMLE key: neurological emergency."
+        },
+        {
+            "name": "Vertebral Osteomyelitis",
+            "match": {"red_flags": ["Fever", "Weight loss"], "past_medical_history": "Infection"},
+            "differentiating_factors": "Chronic back pain with fever, weight loss. MRI: vertebral destruction. Antibiotics, possible surgery. USMLE key: IV drug use or immunocompromised."
+        }
+    ]
+}
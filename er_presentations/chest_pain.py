@@ -0,0 +1,76 @@
+# er_presentations/chest_pain.py
+# Questions and diagnoses for the "Chest Pain" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "location": ["Central", "Left-sided", "Right-sided", "Substernal", "Diffuse"],
+        "character": ["Crushing", "Sharp", "Dull", "Burning", "Tearing", "Pressure", "Aching"],
+        "radiation": ["To the arm", "To the jaw", "To the back", "To the shoulder", "To the neck", "None"],
+        "onset": ["Sudden", "Gradual"],
+        "duration": ["Seconds", "Minutes", "Hours", "Days"],
+        "associated_symptoms": ["Dyspnea", "Nausea/Vomiting", "Sweating", "Palpitations", "Syncope", "Fever", "Cough", "Hemoptysis", "Fatigue"],
+        "exacerbating_factors": ["Exertion", "Inspiration", "Eating", "Movement", "Swallowing", "Stress", "None"],
+        "relieving_factors": ["Rest", "Nitroglycerin", "Antacids", "Leaning forward", "None"],
+        "risk_factors": ["Hypertension", "Smoking", "Diabetes", "Family history of CAD", "Obesity", "Hyperlipidemia", "Cocaine use", "Recent trauma"],
+        "past_medical_history": ["CAD", "GERD", "Pulmonary disease", "Recent surgery", "Connective tissue disorder", "Atrial fibrillation"],
+        "physical_exam": ["Tachycardia", "Hypotension", "Unequal pulses", "Pericardial rub", "Murmur", "Decreased breath sounds", "Crackles"],
+        "social_history": ["Cocaine use", "Smoking history", "Alcohol use"]
+    },
+    "diagnoses": [
+        {
+            "name": "Myocardial Infarction (MI)",
+            "match": {"location": ["Central", "Substernal"], "character": ["Crushing", "Pressure"], "radiation": ["To the arm", "To the jaw"], "associated_symptoms": ["Dyspnea", "Nausea/Vomiting", "Sweating"]},
+            "differentiating_factors": "Severe, central chest pain, often radiating to left arm/jaw, lasting >20 minutes. Associated with dyspnea, diaphoresis, nausea. EKG: ST-elevation (STEMI), new Q waves, or non-ST elevation (NSTEMI). Troponin elevated. Risk factors: CAD, smoking, diabetes, hyperlipidemia. Management: MONA (morphine, oxygen, nitroglycerin, aspirin), heparin, cath lab for STEMI. USMLE key: PCI within 90 minutes."
+        },
+        {
+            "name": "Pulmonary Embolism (PE)",
+            "match": {"character": "Sharp", "associated_symptoms": ["Dyspnea", "Tachycardia"], "exacerbating_factors": "Inspiration", "risk_factors": ["Recent surgery", "Recent trauma"]},
+            "differentiating_factors": "Sudden-onset, pleuritic chest pain with dyspnea, tachycardia, hypoxia. Wells score or PERC rule for risk stratification. D-dimer if low probability; CT pulmonary angiography (CTPA) diagnostic. Risk factors: immobilization, malignancy, hypercoagulable states. Treat with anticoagulation (heparin, DOACs); thrombolytics if unstable. USMLE key: hypoxia with clear lungs, S1Q3T3 on EKG."
+        },
+        {
+            "name": "Pericarditis",
+            "match": {"location": "Central", "character": "Sharp", "relieving_factors": "Leaning forward", "exacerbating_factors": "Inspiration", "physical_exam": "Pericardial rub"},
+            "differentiating_factors": "Sharp, pleuritic pain, worse supine, improved leaning forward. Pericardial friction rub pathognomonic. EKG: diffuse ST-elevation, PR depression. Often post-viral or autoimmune (e.g., SLE). Echocardiogram for effusion. Treat with NSAIDs (ibuprofen) and colchicine. USMLE key: friction rub and positional relief."
+        },
+        {
+            "name": "Gastroesophageal Reflux Disease (GERD)",
+            "match": {"character": "Burning", "location": ["Central", "Substernal"], "exacerbating_factors": "Eating", "relieving_factors": "Antacids", "past_medical_history": "GERD"},
+            "differentiating_factors": "Burning substernal pain, postprandial or worse supine, with regurgitation or dysphagia. No EKG changes or troponin elevation. Trial of PPI (omeprazole) or antacids diagnostic. EGD for complications (Barrett’s esophagus). USMLE key: rule out cardiac causes."
+        },
+        {
+            "name": "Aortic Dissection",
+            "match": {"character": "Tearing", "radiation": ["To the back", "To the neck"], "onset": "Sudden", "physical_exam": ["Unequal pulses", "Hypotension"]},
+            "differentiating_factors": "Sudden, severe, tearing pain radiating to back, with unequal pulses or BP differential (>20 mmHg). Risk factors: hypertension, Marfan’s, Ehlers-Danlos. CXR: widened mediastinum; CT/MRI diagnostic. Surgical emergency; beta-blockers (labetalol) for BP. USMLE key: pulse deficit or neurological symptoms."
+        },
+        {
+            "name": "Pneumothorax",
+            "match": {"character": "Sharp", "onset": "Sudden", "associated_symptoms": ["Dyspnea"], "physical_exam": "Decreased breath sounds"},
+            "differentiating_factors": "Sudden unilateral pain with dyspnea, decreased breath sounds, hyperresonance. Risk factors: smoking, trauma, tall/thin habitus. CXR: lung collapse. Tension pneumothorax: tracheal deviation, hypotension. Chest tube or needle decompression. USMLE key: young males, sudden onset."
+        },
+        {
+            "name": "Costochondritis",
+            "match": {"character": "Sharp", "exacerbating_factors": "Movement", "relieving_factors": "Rest"},
+            "differentiating_factors": "Localized, reproducible pain at costochondral junctions. No systemic symptoms or EKG changes. Common post-trauma or in younger patients. Treat with NSAIDs, rest. USMLE key: reproducible pain."
+        },
+        {
+            "name": "Esophageal Spasm",
+            "match": {"character": ["Crushing", "Burning"], "radiation": "None", "exacerbating_factors": "Swallowing"},
+            "differentiating_factors": "Intermittent, severe pain mimicking MI, triggered by swallowing or stress. Normal EKG/troponin. Esophageal manometry diagnostic. Calcium channel blockers (diltiazem) or nitrates. USMLE key: mimics cardiac pain."
+        },
+        {
+            "name": "Boerhaave Syndrome",
+            "match": {"character": "Severe", "onset": "Sudden", "associated_symptoms": ["Nausea/Vomiting"], "exacerbating_factors": "Swallowing"},
+            "differentiating_factors": "Sudden, severe pain post-forceful vomiting, with subcutaneous emphysema or Hamman’s sign. CXR: pneumomediastinum; CT/esophagram confirms esophageal rupture. Surgical emergency. USMLE key: Mackler’s triad (pain, vomiting, emphysema)."
+        },
+        {
+            "name": "Myocarditis",
+            "match": {"character": "Dull", "associated_symptoms": ["Fever", "Dyspnea"], "past_medical_history": "Recent viral illness"},
+            "differentiating_factors": "Diffuse pain with fever, fatigue, or heart failure post-viral illness (e.g., coxsackievirus). EKG: diffuse ST changes; troponin elevated. Cardiac MRI or biopsy diagnostic. Supportive care; avoid NSAIDs in acute phase. USMLE key: viral prodrome."
+        },
+        {
+            "name": "Pneumonia",
+            "match": {"character": "Sharp", "associated_symptoms": ["Fever", "Cough"], "physical_exam": "Crackles"},
+            "differentiating_factors": "Pleuritic pain with fever, productive cough, dyspnea. CXR: consolidation. Leukocytosis, elevated CRP. Antibiotics (levofloxacin or ceftriaxone + azithromycin). USMLE key: community-acquired vs. hospital-acquired."
+        }
+    ]
+}
@@ -0,0 +1,33 @@
+# er_presentations/constipation.py
+# Questions and diagnoses for the "Constipation" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Acute", "Chronic"],
+        "associated_symptoms": ["Abdominal pain", "Bloating", "Rectal bleeding"],
+        "past_medical_history": ["Hypothyroidism", "Opioid use"],
+        "physical_exam": ["Abdominal distension", "Hard stool"]
+    },
+    "diagnoses": [
+        {
+            "name": "Functional Constipation",
+            "match": {"onset": "Chronic", "associated_symptoms": "Bloating"},
+            "differentiating_factors": "Chronic, no red flags. Fiber, laxatives (polyethylene glycol). USMLE key: Rome IV criteria."
+        },
+        {
+            "name": "Bowel Obstruction",
+            "match": {"onset": "Acute", "associated_symptoms": ["Abdominal pain", "Nausea"]},
+            "differentiating_factors": "Acute constipation, vomiting, distension. X-ray: air-fluid levels. NG tube, surgery if needed. USMLE key: high-pitched bowel sounds."
+        },
+        {
+            "name": "Hypothyroidism",
+            "match": {"onset": "Chronic", "past_medical_history": "Hypothyroidism"},
+            "differentiating_factors": "Constipation with fatigue, cold intolerance. Elevated TSH. Levothyroxine. USMLE key: systemic symptoms."
+        },
+        {
+            "name": "Opioid-Induced Constipation",
+            "match": {"onset": "Chronic", "past_medical_history": "Opioid use"},
+            "differentiating_factors": "Constipation post-opioid use. Methylnaltrexone, laxatives. USMLE key: common in chronic pain."
+        }
+    ]
+}
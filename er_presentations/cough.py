@@ -0,0 +1,36 @@
+# er_presentations/cough.py
+# Questions and diagnoses for the "Cough" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Acute", "Chronic (>8 weeks)"],
+        "character": ["Productive", "Dry"],
+        "associated_symptoms": ["Fever", "Dyspnea", "Chest pain", "Hemoptysis", "Weight loss"],
+        "risk_factors": ["Smoking", "Allergen exposure", "Occupational exposure"],
+        "past_medical_history": ["Asthma", "COPD", "GERD"],
+        "physical_exam": ["Wheezing", "Crackles"],
+        "social_history": ["Smoking history", "Travel history"]
+    },
+    "diagnoses": [
+        {
+            "name": "Acute Bronchitis",
+            "match": {"onset": "Acute", "character": "Productive", "associated_symptoms": "Fever"},
+            "differentiating_factors": "Self-limiting cough, often post-viral. Supportive care; antibiotics if bacterial. USMLE key: usually viral."
+        },
+        {
+            "name": "Pneumonia",
+            "match": {"onset": "Acute", "associated_symptoms": ["Fever", "Dyspnea"], "physical_exam": "Crackles"},
+            "differentiating_factors": "Fever, productive cough, dyspnea, crackles. CXR: consolidation. Antibiotics (levofloxacin or ceftriaxone + azithromycin). USMLE key: CURB-65 score."
+        },
+        {
+            "name": "COPD Exacerbation",
+            "match": {"onset": "Acute", "character": "Productive", "past_medical_history": "COPD"},
+            "differentiating_factors": "Increased cough, sputum, dyspnea in smoker. Bronchodilators, steroids, antibiotics if bacterial. USMLE key: smoking history."
+        },
+        {
+            "name": "Lung Cancer",
+            "match": {"onset": "Chronic (>8 weeks)", "associated_symptoms": ["Hemoptysis", "Weight loss"], "risk_factors": "Smoking"},
+            "differentiating_factors": "Chronic cough, hemoptysis, weight loss in smokers. CT: lung mass. Bronchoscopy for biopsy. USMLE key: smokers >40."
+        }
+    ]
+}
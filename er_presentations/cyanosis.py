@@ -0,0 +1,34 @@
+# er_presentations/cyanosis.py
+# Questions and diagnoses for the "Cyanosis" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "location": ["Central", "Peripheral"],
+        "onset": ["Sudden", "Gradual"],
+        "associated_symptoms": ["Dyspnea", "Chest pain", "Fever"],
+        "past_medical_history": ["COPD", "Congenital heart disease"],
+        "physical_exam": ["Clubbing", "Murmurs"]
+    },
+    "diagnoses": [
+        {
+            "name": "Pulmonary Embolism",
+            "match": {"onset": "Sudden", "associated_symptoms": ["Dyspnea", "Chest pain"]},
+            "differentiating_factors": "Sudden central cyanosis, hypoxia, tachycardia. CTPA diagnostic. Anticoagulation (heparin). USMLE key: hypoxia with clear lungs."
+        },
+        {
+            "name": "Pneumonia",
+            "match": {"onset": "Gradual", "associated_symptoms": ["Fever", "Dyspnea"]},
+            "differentiating_factors": "Cyanosis, fever, productive cough. CXR: consolidation. Antibiotics (levofloxacin). USMLE key: CURB-65 score."
+        },
+        {
+            "name": "Congenital Heart Disease",
+            "match": {"onset": "Gradual", "past_medical_history": "Congenital heart disease"},
+            "differentiating_factors": "Central cyanosis, murmurs, clubbing. Echocardiogram diagnostic. Surgical correction. USMLE key: cyanotic heart defects (e.g., tetralogy of Fallot)."
+        },
+        {
+            "name": "Methemoglobinemia",
+            "match": {"onset": "Sudden", "associated_symptoms": "Dyspnea"},
+            "differentiating_factors": "Central cyanosis, normal SpO2, chocolate-brown blood. Methylene blue. USMLE key: drug exposure (e.g., benzocaine)."
+        }
+    ]
+}
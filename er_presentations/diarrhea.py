@@ -0,0 +1,34 @@
+# er_presentations/diarrhea.py
+# Questions and diagnoses for the "Diarrhea" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Acute", "Chronic (>4 weeks)"],
+        "character": ["Watery", "Bloody", "Fatty"],
+        "associated_symptoms": ["Fever", "Abdominal pain", "Weight loss"],
+        "past_medical_history": ["IBD", "Celiac disease", "Recent antibiotics"],
+        "social_history": ["Recent travel", "Food exposure"]
+    },
+    "diagnoses": [
+        {
+            "name": "Viral Gastroenteritis",
+            "match": {"onset": "Acute", "character": "Watery", "associated_symptoms": ["Nausea", "Fever"]},
+            "differentiating_factors": "Acute watery diarrhea, vomiting, often norovirus. Supportive care, fluids. USMLE key: self-limiting."
+        },
+        {
+            "name": "Bacterial Enteritis",
+            "match": {"onset": "Acute", "character": "Bloody", "social_history": "Recent travel"},
+            "differentiating_factors": "Bloody diarrhea, fever, abdominal pain (Salmonella, Shigella). Stool culture, antibiotics if severe (ciprofloxacin). USMLE key: travel history."
+        },
+        {
+            "name": "Clostridium Difficile Colitis",
+            "match": {"onset": "Acute", "past_medical_history": "Recent antibiotics"},
+            "differentiating_factors": "Watery diarrhea post-antibiotics, C. diff toxin positive. Vancomycin or fidaxomicin. USMLE key: pseudomembranous colitis."
+        },
+        {
+            "name": "Inflammatory Bowel Disease (IBD)",
+            "match": {"onset": "Chronic (>4 weeks)", "character": "Bloody", "past_medical_history": "IBD"},
+            "differentiating_factors": "Chronic bloody diarrhea, weight loss. Colonoscopy diagnostic. Mesalamine, steroids. USMLE key: Crohn’s vs. ulcerative colitis."
+        }
+    ]
+}
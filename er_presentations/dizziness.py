@@ -0,0 +1,40 @@
+# er_presentations/dizziness.py
+# Questions and diagnoses for the "Dizziness" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "type": ["Vertigo (spinning sensation)", "Lightheadedness", "Disequilibrium"],
+        "onset": ["Sudden", "Gradual"],
+        "associated_symptoms": ["Nausea", "Hearing loss", "Tinnitus", "Headache", "Focal neurological deficits"],
+        "triggers": ["Head movement", "Standing up"],
+        "past_medical_history": ["Migraine", "Stroke"],
+        "physical_exam": ["Nystagmus", "Gait instability"]
+    },
+    "diagnoses": [
+        {
+            "name": "Benign Paroxysmal Positional Vertigo (BPPV)",
+            "match": {"type": "Vertigo (spinning sensation)", "onset": "Sudden", "triggers": "Head movement"},
+            "differentiating_factors": "Brief vertigo triggered by head movements. Dix-Hallpike maneuver diagnostic. Epley maneuver. USMLE key: no hearing loss."
+        },
+        {
+            "name": "Ménière's Disease",
+            "match": {"type": "Vertigo (spinning sensation)", "associated_symptoms": ["Hearing loss", "Tinnitus"]},
+            "differentiating_factors": "Vertigo, tinnitus, hearing loss, episodes lasting hours. Low-salt diet, diuretics. USMLE key: fluctuating hearing loss."
+        },
+        {
+            "name": "Vestibular Neuritis",
+            "match": {"type": "Vertigo (spinning sensation)", "onset": "Sudden", "associated_symptoms": "Nausea"},
+            "differentiating_factors": "Severe vertigo lasting days, post-viral. No hearing loss. Steroids, supportive care. USMLE key: viral prodrome."
+        },
+        {
+            "name": "Orthostatic Hypotension",
+            "match": {"type": "Lightheadedness", "triggers": "Standing up"},
+            "differentiating_factors": "Lightheadedness on standing, BP drop. Fluids, address cause (medications). USMLE key: common in elderly."
+        },
+        {
+            "name": "Vestibular Migraine",
+            "match": {"type": "Vertigo (spinning sensation)", "past_medical_history": "Migraine"},
+            "differentiating_factors": "Vertigo with headache, photophobia. Triptans, prophylaxis (propranolol). USMLE key: migraine history."
+        }
+    ]
+}
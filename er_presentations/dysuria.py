@@ -0,0 +1,34 @@
+# er_presentations/dysuria.py
+# Questions and diagnoses for the "Dysuria" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Acute", "Chronic"],
+        "associated_symptoms": ["Fever", "Hematuria", "Urgency", "Flank pain"],
+        "past_medical_history": ["UTI", "Diabetes", "Kidney stones"],
+        "physical_exam": ["CVA tenderness", "Suprapubic tenderness"],
+        "social_history": ["Sexual history"]
+    },
+    "diagnoses": [
+        {
+            "name": "Urinary Tract Infection (UTI)",
+            "match": {"onset": "Acute", "associated_symptoms": ["Urgency", "Fever"]},
+            "differentiating_factors": "Dysuria, urgency, frequency, pyuria on urinalysis. Nitrofurantoin or TMP-SMX. USMLE key: E. coli most common."
+        },
+        {
+            "name": "Pyelonephritis",
+            "match": {"onset": "Acute", "associated_symptoms": ["Fever", "Flank pain"], "physical_exam": "CVA tenderness"},
+            "differentiating_factors": "Dysuria with fever, flank pain, CVA tenderness. Urinalysis: pyuria, WBC casts. Ciprofloxacin, ceftriaxone. USMLE key: systemic symptoms."
+        },
+        {
+            "name": "Urethritis",
+            "match": {"onset": "Acute", "social_history": "Sexual history"},
+            "differentiating_factors": "Dysuria, discharge, often STD-related (gonorrhea, chlamydia). NAAT testing, doxycycline or azithromycin. USMLE key: sexual history critical."
+        },
+        {
+            "name": "Nephrolithiasis",
+            "match": {"onset": "Acute", "associated_symptoms": ["Flank pain", "Hematuria"], "past_medical_history": "Kidney stones"},
+            "differentiating_factors": "Severe flank pain radiating to groin, hematuria. CT: stone visualization. Hydration, analgesia, tamsulosin. USMLE key: colicky pain."
+        }
+    ]
+}
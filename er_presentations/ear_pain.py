@@ -0,0 +1,34 @@
+# er_presentations/ear_pain.py
+# Questions and diagnoses for the "Ear Pain" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Sudden", "Gradual"],
+        "associated_symptoms": ["Fever", "Hearing loss", "Discharge", "Vertigo"],
+        "past_medical_history": ["Recent URI", "Swimming"],
+        "physical_exam": ["Tympanic membrane erythema", "Effusion"],
+        "social_history": ["Swimming"]
+    },
+    "diagnoses": [
+        {
+            "name": "Acute Otitis Media",
+            "match": {"onset": "Sudden", "associated_symptoms": "Fever", "physical_exam": "Tympanic membrane erythema"},
+            "differentiating_factors": "Ear pain, fever, bulging TM. Amoxicillin, observation in mild cases. USMLE key: pediatric common."
+        },
+        {
+            "name": "Otitis Externa",
+            "match": {"onset": "Sudden", "social_history": "Swimming", "physical_exam": "Ear canal edema"},
+            "differentiating_factors": "Ear pain, canal swelling, often swimmer’s ear. Topical antibiotics (ciprofloxacin drops). USMLE key: Pseudomonas aeruginosa."
+        },
+        {
+            "name": "Mastoiditis",
+            "match": {"onset": "Gradual", "associated_symptoms": "Fever", "physical_exam": "Mastoid tenderness"},
+            "differentiating_factors": "Ear pain, mastoid tenderness, post-URI. CT: mastoid air cell opacification. IV antibiotics, possible surgery. USMLE key: complication of otitis media."
+        },
+        {
+            "name": "TM Perforation",
+            "match": {"onset": "Sudden", "associated_symptoms": "Hearing loss"},
+            "differentiating_factors": "Sudden pain, hearing loss post-trauma or infection. Otoscopy: perforation. Keep dry, antibiotics if infected. USMLE key: avoid water exposure."
+        }
+    ]
+}
@@ -0,0 +1,34 @@
+# er_presentations/edema.py
+# Questions and diagnoses for the "Edema" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "location": ["Unilateral", "Bilateral"],
+        "associated_symptoms": ["Shortness of breath", "Calf pain", "Redness/Warmth", "Chest pain"],
+        "past_medical_history": ["CHF", "DVT", "Liver disease", "Renal disease"],
+        "physical_exam": ["Pitting edema", "JVD", "Hepatomegaly"],
+        "social_history": ["Recent travel"]
+    },
+    "diagnoses": [
+        {
+            "name": "Deep Vein Thrombosis (DVT)",
+            "match": {"location": "Unilateral", "associated_symptoms": "Calf pain", "social_history": "Recent travel"},
+            "differentiating_factors": "Unilateral swelling, pain. Doppler ultrasound diagnostic. Anticoagulation (heparin, DOACs). USMLE key: Virchow’s triad."
+        },
+        {
+            "name": "Congestive Heart Failure (CHF)",
+            "match": {"location": "Bilateral", "associated_symptoms": "Shortness of breath", "physical_exam": ["JVD", "Pitting edema"]},
+            "differentiating_factors": "Bilateral pitting edema, orthopnea, JVD. BNP elevated, CXR: pulmonary edema. Diuretics, ACE inhibitors. USMLE key: S3 gallop."
+        },
+        {
+            "name": "Nephrotic Syndrome",
+            "match": {"location": "Bilateral", "past_medical_history": "Renal disease"},
+            "differentiating_factors": "Bilateral edema, hypoalbuminemia, proteinuria. Urinalysis: >3.5 g/day protein. Treat underlying cause, diuretics. USMLE key: frothy urine."
+        },
+        {
+            "name": "Cirrhosis",
+            "match": {"location": "Bilateral", "past_medical_history": "Liver disease", "physical_exam": "Hepatomegaly"},
+            "differentiating_factors": "Edema with ascites, jaundice. LFTs abnormal, low albumin. Diuretics, address liver disease. USMLE key: portal hypertension."
+        }
+    ]
+}
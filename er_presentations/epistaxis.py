@@ -0,0 +1,35 @@
+# er_presentations/epistaxis.py
+# Questions and diagnoses for the "Epistaxis" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Sudden", "Recurrent"],
+        "location": ["Anterior", "Posterior"],
+        "associated_symptoms": ["Nasal trauma", "Hypertension", "Bleeding elsewhere"],
+        "past_medical_history": ["Anticoagulant use", "Liver disease"],
+        "physical_exam": ["Nasal mucosa dryness", "Septal deviation"],
+        "social_history": ["Cocaine use"]
+    },
+    "diagnoses": [
+        {
+            "name": "Anterior Epistaxis",
+            "match": {"onset": "Sudden", "location": "Anterior", "physical_exam": "Nasal mucosa dryness"},
+            "differentiating_factors": "Bleeding from Kiesselbach’s plexus, often due to trauma or dry mucosa. Nasal compression, oxymetazoline, cautery. USMLE key: most common, benign."
+        },
+        {
+            "name": "Posterior Epistaxis",
+            "match": {"onset": "Sudden", "location": "Posterior", "past_medical_history": "Hypertension"},
+            "differentiating_factors": "Severe bleeding, elderly, hypertension. Nasal packing, ENT consult. USMLE key: risk of airway compromise."
+        },
+        {
+            "name": "Coagulopathy",
+            "match": {"associated_symptoms": "Bleeding elsewhere", "past_medical_history": "Anticoagulant use"},
+            "differentiating_factors": "Epistaxis with other bleeding sites, anticoagulant use. INR/PTT, reverse anticoagulation (vitamin K for warfarin). USMLE key: check medications."
+        },
+        {
+            "name": "Hereditary Hemorrhagic Telangiectasia",
+            "match": {"onset": "Recurrent", "associated_symptoms": "Bleeding elsewhere"},
+            "differentiating_factors": "Recurrent epistaxis, telangiectasias on skin/mucosa. ENT referral, laser therapy. USMLE key: genetic condition."
+        }
+    ]
+}
@@ -0,0 +1,40 @@
+# er_presentations/extremity_pain_injury.py
+# Questions and diagnoses for the "Extremity Pain/Injury" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "location": ["Arm", "Leg", "Hand", "Foot", "Shoulder"],
+        "onset": ["Acute (with injury)", "Chronic"],
+        "mechanism": ["Fall", "Twisting injury", "Direct blow", "Overuse"],
+        "physical_exam": ["Deformity", "Swelling", "Inability to bear weight", "Ecchymosis"],
+        "associated_symptoms": ["Numbness", "Weakness"],
+        "past_medical_history": ["Arthritis", "Diabetes"]
+    },
+    "diagnoses": [
+        {
+            "name": "Fracture",
+            "match": {"onset": "Acute (with injury)", "physical_exam": ["Deformity", "Inability to bear weight"]},
+            "differentiating_factors": "Severe pain post-trauma, deformity. X-ray diagnostic. Immobilization, possible surgery. USMLE key: Ottawa rules for ankle/knee."
+        },
+        {
+            "name": "Dislocation",
+            "match": {"onset": "Acute (with injury)", "physical_exam": "Deformity"},
+            "differentiating_factors": "Joint deformity post-trauma. X-ray confirms. Reduction, immobilization. USMLE key: shoulder, patella common."
+        },
+        {
+            "name": "Sprain/Strain",
+            "match": {"onset": "Acute (with injury)", "physical_exam": "Swelling"},
+            "differentiating_factors": "Pain, swelling without deformity. RICE (rest, ice, compression, elevation), NSAIDs. USMLE key: ligament (sprain) vs. muscle (strain)."
+        },
+        {
+            "name": "Cellulitis",
+            "match": {"onset": "Gradual", "physical_exam": "Swelling", "past_medical_history": "Diabetes"},
+            "differentiating_factors": "Redness, warmth, swelling, possible fever. Antibiotics (cephalexin). USMLE key: diabetic patients at risk."
+        },
+        {
+            "name": "Compartment Syndrome",
+            "match": {"onset": "Acute (with injury)", "associated_symptoms": ["Pain", "Numbness"], "physical_exam": "Tense swelling"},
+            "differentiating_factors": "Severe pain out of proportion, paresthesias, tense swelling. Measure compartment pressure. Fasciotomy if elevated. USMLE key: 6 Ps (pain, pallor, pulselessness, etc.)."
+        }
+    ]
+}
@@ -0,0 +1,34 @@
+# er_presentations/eye_pain_redness.py
+# Questions and diagnoses for the "Eye Pain/Redness" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Sudden", "Gradual"],
+        "associated_symptoms": ["Vision loss", "Photophobia", "Discharge", "Foreign body sensation"],
+        "past_medical_history": ["Contact lens use", "Autoimmune disease"],
+        "physical_exam": ["Ciliary flush", "Corneal opacity"],
+        "social_history": ["Trauma"]
+    },
+    "diagnoses": [
+        {
+            "name": "Conjunctivitis",
+            "match": {"onset": "Gradual", "associated_symptoms": "Discharge"},
+            "differentiating_factors": "Red eye, discharge (viral, bacterial, allergic). Viral: supportive; bacterial: erythromycin drops; allergic: antihistamines. USMLE key: distinguish etiology."
+        },
+        {
+            "name": "Corneal Abrasion",
+            "match": {"onset": "Sudden", "associated_symptoms": "Foreign body sensation", "social_history": "Trauma"},
+            "differentiating_factors": "Sudden pain, fluorescein staining positive. Antibiotic drops, avoid contact lenses. USMLE key: trauma history."
+        },
+        {
+            "name": "Acute Angle-Closure Glaucoma",
+            "match": {"onset": "Sudden", "associated_symptoms": ["Vision loss", "Nausea"], "physical_exam": "Ciliary flush"},
+            "differentiating_factors": "Severe pain, blurred vision, halos, fixed pupil. Elevated IOP on tonometry. Acetazolamide, timolol, laser iridotomy. USMLE key: ophthalmic emergency."
+        },
+        {
+            "name": "Uveitis",
+            "match": {"onset": "Gradual", "associated_symptoms": "Photophobia", "past_medical_history": "Autoimmune disease"},
+            "differentiating_factors": "Pain, photophobia, ciliary flush, often autoimmune (e.g., HLA-B27). Steroid drops, treat underlying cause. USMLE key: slit-lamp exam."
+        }
+    ]
+}
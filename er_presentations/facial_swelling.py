@@ -0,0 +1,34 @@
+# er_presentations/facial_swelling.py
+# Questions and diagnoses for the "Facial Swelling" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Sudden", "Gradual"],
+        "associated_symptoms": ["Fever", "Dyspnea", "Rash", "Tooth pain"],
+        "past_medical_history": ["Allergies", "Dental infection"],
+        "physical_exam": ["Erythema", "Airway compromise"],
+        "social_history": ["Allergen exposure"]
+    },
+    "diagnoses": [
+        {
+            "name": "Anaphylaxis",
+            "match": {"onset": "Sudden", "associated_symptoms": ["Dyspnea", "Rash"], "past_medical_history": "Allergies"},
+            "differentiating_factors": "Rapid swelling, urticaria, respiratory distress. IM epinephrine, antihistamines. USMLE key: airway management critical."
+        },
+        {
+            "name": "Angioedema",
+            "match": {"onset": "Sudden", "past_medical_history": "Allergies"},
+            "differentiating_factors": "Non-pitting swelling, often lips or eyes, ACE inhibitor-related. C1 esterase inhibitor for HAE, antihistamines for allergic. USMLE key: drug history."
+        },
+        {
+            "name": "Ludwig’s Angina",
+            "match": {"onset": "Gradual", "associated_symptoms": ["Fever", "Tooth pain"]},
+            "differentiating_factors": "Submandibular swelling, fever, dental infection. CT: abscess. Antibiotics (clindamycin), surgical drainage. USMLE key: airway emergency."
+        },
+        {
+            "name": "Cellulitis",
+            "match": {"onset": "Gradual", "associated_symptoms": "Fever", "physical_exam": "Erythema"},
+            "differentiating_factors": "Erythema, warmth, swelling, often post-trauma. Antibiotics (cephalexin). USMLE key: rule out abscess."
+        }
+    ]
+}
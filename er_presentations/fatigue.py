@@ -0,0 +1,34 @@
+# er_presentations/fatigue.py
+# Questions and diagnoses for the "Fatigue" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Acute", "Chronic"],
+        "associated_symptoms": ["Weight loss", "Fever", "Dyspnea", "Depression"],
+        "past_medical_history": ["Anemia", "Hypothyroidism", "Depression"],
+        "physical_exam": ["Pallor", "Lymphadenopathy"],
+        "social_history": ["Stress"]
+    },
+    "diagnoses": [
+        {
+            "name": "Anemia",
+            "match": {"onset": "Chronic", "associated_symptoms": "Dyspnea", "physical_exam": "Pallor"},
+            "differentiating_factors": "Fatigue, pallor, low hemoglobin. Iron studies, B12, folate levels. Treat underlying cause (iron, B12). USMLE key: microcytic vs. macrocytic."
+        },
+        {
+            "name": "Hypothyroidism",
+            "match": {"onset": "Chronic", "associated_symptoms": "Weight gain", "past_medical_history": "Hypothyroidism"},
+            "differentiating_factors": "Fatigue, cold intolerance, elevated TSH. Levothyroxine. USMLE key: systemic symptoms."
+        },
+        {
+            "name": "Depression",
+            "match": {"onset": "Chronic", "associated_symptoms": "Depression", "social_history": "Stress"},
+            "differentiating_factors": "Fatigue, low mood, anhedonia. PHQ-9 screening, SSRIs (sertraline). USMLE key: rule out organic causes."
+        },
+        {
+            "name": "Chronic Fatigue Syndrome",
+            "match": {"onset": "Chronic", "associated_symptoms": "Post-exertional malaise"},
+            "differentiating_factors": "Severe fatigue >6 months, unrefreshing sleep. Supportive care, CBT. USMLE key: diagnosis of exclusion."
+        }
+    ]
+}
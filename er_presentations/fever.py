@@ -0,0 +1,52 @@
+# er_presentations/fever.py
+# Questions and diagnoses for the "Fever" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Acute (< 48 hours)", "Subacute (days to weeks)", "Chronic (>2 weeks)"],
+        "associated_symptoms": ["Rash", "Sore throat", "Cough", "Headache", "Abdominal pain", "Joint pain", "Night sweats", "Altered mental status"],
+        "travel_history": ["Yes (specify region)", "No"],
+        "immune_status": ["Immunocompromised", "Immunocompetent"],
+        "risk_factors": ["Recent hospitalization", "Animal exposure", "IV drug use", "Tick exposure"],
+        "past_medical_history": ["HIV", "Diabetes", "Recent surgery"],
+        "physical_exam": ["Lymphadenopathy", "Murmur", "Rash", "Splenomegaly"],
+        "social_history": ["Travel", "Homelessness"]
+    },
+    "diagnoses": [
+        {
+            "name": "Influenza",
+            "match": {"onset": "Acute (< 48 hours)", "associated_symptoms": ["Sore throat", "Cough", "Myalgias"]},
+            "differentiating_factors": "Sudden fever, myalgias, sore throat, dry cough. Rapid flu test confirms. Antivirals (oseltamivir) if <48 hours. USMLE key: seasonal pattern."
+        },
+        {
+            "name": "Sepsis",
+            "match": {"onset": "Acute (< 48 hours)", "associated_symptoms": ["Altered mental status", "Tachycardia"]},
+            "differentiating_factors": "Fever with organ dysfunction (hypotension, confusion). qSOFA score for risk. Blood cultures, broad-spectrum antibiotics (vancomycin, piperacillin-tazobactam), fluids. USMLE key: early goal-directed therapy."
+        },
+        {
+            "name": "Meningitis",
+            "match": {"onset": "Acute (< 48 hours)", "associated_symptoms": ["Headache", "Stiff neck"], "physical_exam": "Nuchal rigidity"},
+            "differentiating_factors": "Fever, headache, nuchal rigidity. Kernig’s/Brudzinski’s signs. LP: elevated WBC, low glucose (bacterial). Antibiotics (ceftriaxone, vancomycin), steroids. USMLE key: meningococcal rash."
+        },
+        {
+            "name": "Cellulitis",
+            "match": {"associated_symptoms": "Redness/swelling on skin", "onset": "Subacute (days to weeks)"},
+            "differentiating_factors": "Localized redness, warmth, swelling with fever. Antibiotics (cephalexin, clindamycin). USMLE key: check for abscess."
+        },
+        {
+            "name": "Malaria",
+            "match": {"travel_history": "Yes (specify region)", "associated_symptoms": ["Fever", "Chills"]},
+            "differentiating_factors": "Cyclic fevers, chills, sweats in endemic travel history. Thick/thin blood smears. Antimalarials (artemether-lumefantrine). USMLE key: travel history critical."
+        },
+        {
+            "name": "Endocarditis",
+            "match": {"onset": "Subacute (days to weeks)", "associated_symptoms": ["Fever", "Joint pain"], "physical_exam": "Murmur"},
+            "differentiating_factors": "Persistent fever, murmurs, embolic phenomena. Blood cultures, echocardiogram. Prolonged antibiotics (vancomycin, gentamicin). USMLE key: Duke criteria."
+        },
+        {
+            "name": "Lyme Disease",
+            "match": {"risk_factors": "Tick exposure", "associated_symptoms": ["Rash", "Joint pain"]},
+            "differentiating_factors": "Fever, erythema migrans, joint pain post-tick bite. Serology confirms. Doxycycline. USMLE key: early localized stage."
+        }
+    ]
+}
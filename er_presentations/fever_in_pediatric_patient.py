@@ -0,0 +1,34 @@
+# er_presentations/fever_in_pediatric_patient.py
+# Questions and diagnoses for the "Fever in Pediatric Patient" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "age": ["Neonate (<28 days)", "Infant (1-12 months)", "Child (>1 year)"],
+        "associated_symptoms": ["Lethargy", "Poor feeding", "Rash", "Seizures"],
+        "past_medical_history": ["Prematurity", "Vaccination status"],
+        "physical_exam": ["Fontanelle bulging", "Nuchal rigidity"],
+        "social_history": ["Daycare exposure"]
+    },
+    "diagnoses": [
+        {
+            "name": "Neonatal Sepsis",
+            "match": {"age": "Neonate (<28 days)", "associated_symptoms": ["Lethargy", "Poor feeding"]},
+            "differentiating_factors": "Fever or hypothermia, lethargy, poor feeding. Blood/CSF cultures, broad-spectrum antibiotics (ampicillin, gentamicin). USMLE key: Group B Streptococcus."
+        },
+        {
+            "name": "Febrile Seizure",
+            "match": {"age": "Child (>1 year)", "associated_symptoms": "Seizures"},
+            "differentiating_factors": "Seizure with fever, age 6 months-5 years. Antipyretics, workup for infection. USMLE key: simple vs. complex seizures."
+        },
+        {
+            "name": "Meningitis",
+            "match": {"associated_symptoms": ["Lethargy", "Rash"], "physical_exam": "Nuchal rigidity"},
+            "differentiating_factors": "Fever, irritability, nuchal rigidity. LP: bacterial vs. viral. Antibiotics (ceftriaxone, vancomycin). USMLE key: meningococcal rash."
+        },
+        {
+            "name": "Kawasaki Disease",
+            "match": {"age": "Child (>1 year)", "associated_symptoms": "Rash"},
+            "differentiating_factors": "Prolonged fever, rash, conjunctivitis, strawberry tongue. IVIG, aspirin. USMLE key: coronary artery aneurysms."
+        }
+    ]
+}
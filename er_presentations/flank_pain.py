@@ -0,0 +1,33 @@
+# er_presentations/flank_pain.py
+# Questions and diagnoses for the "Flank Pain" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Sudden", "Gradual"],
+        "associated_symptoms": ["Fever", "Hematuria", "Dysuria", "Nausea"],
+        "past_medical_history": ["Kidney stones", "UTI", "AAA"],
+        "physical_exam": ["CVA tenderness", "Pulsatile mass"]
+    },
+    "diagnoses": [
+        {
+            "name": "Nephrolithiasis",
+            "match": {"onset": "Sudden", "associated_symptoms": ["Hematuria", "Nausea"]},
+            "differentiating_factors": "Colicky flank pain, hematuria, nausea. CT: stones. Hydration, tamsulosin. USMLE key: radiating pain to groin."
+        },
+        {
+            "name": "Pyelonephritis",
+            "match": {"onset": "Sudden", "associated_symptoms": ["Fever", "Dysuria"], "physical_exam": "CVA tenderness"},
+            "differentiating_factors": "Flank pain, fever, dysuria, CVA tenderness. Urinalysis: pyuria, WBC casts. Antibiotics (ciprofloxacin). USMLE key: systemic symptoms."
+        },
+        {
+            "name": "Abdominal Aortic Aneurysm (AAA)",
+            "match": {"onset": "Sudden", "physical_exam": "Pulsatile mass"},
+            "differentiating_factors": "Severe flank pain, pulsatile mass, hypotension. Ultrasound/CT. Surgical emergency. USMLE key: elderly males, smoking."
+        },
+        {
+            "name": "Renal Infarction",
+            "match": {"onset": "Sudden", "associated_symptoms": "Hematuria"},
+            "differentiating_factors": "Sudden flank pain, hematuria, elevated LDH. CT angiography. Anticoagulation. USMLE key: atrial fibrillation risk."
+        }
+    ]
+}
@@ -0,0 +1,29 @@
+# er_presentations/focal_neurological_deficit.py
+# Questions and diagnoses for the "Focal Neurological Deficit" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Sudden", "Gradual"],
+        "type": ["Speech difficulties", "Facial droop", "Hemiparesis"],
+        "risk_factors": ["Hypertension", "Diabetes", "Smoking"],
+        "past_medical_history": ["Stroke", "TIA"],
+        "physical_exam": ["Cranial nerve deficits", "Motor weakness"]
+    },
+    "diagnoses": [
+        {
+            "name": "Transient Ischemic Attack (TIA)",
+            "match": {"onset": "Sudden"},
+            "differentiating_factors": "Transient deficits resolving <24 hours. Antiplatelets (aspirin), risk factor control. USMLE key: stroke warning."
+        },
+        {
+            "name": "Stroke (CVA)",
+            "match": {"onset": "Sudden", "type": ["Speech difficulties", "Facial droop", "Hemiparesis"]},
+            "differentiating_factors": "Persistent focal deficits. CT to rule out hemorrhage; tPA if ischemic. USMLE key: NIHSS score."
+        },
+        {
+            "name": "Multiple Sclerosis",
+            "match": {"onset": "Gradual", "past_medical_history": "MS"},
+            "differentiating_factors": "Relapsing-remitting deficits, optic neuritis. MRI: white matter lesions. Steroids, DMARDs. USMLE key: separated in time and space."
+        }
+    ]
+}
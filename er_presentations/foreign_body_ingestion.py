@@ -0,0 +1,30 @@
+# er_presentations/foreign_body_ingestion.py
+# Questions and diagnoses for the "Foreign Body Ingestion" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Sudden"],
+        "associated_symptoms": ["Choking", "Dysphagia", "Chest pain", "Abdominal pain"],
+        "object": ["Coin", "Food", "Sharp object", "Battery"],
+        "past_medical_history": ["Esophageal disease", "Pediatric"],
+        "physical_exam": ["Drooling", "Respiratory distress"],
+        "social_history": ["Child vs. adult"]
+    },
+    "diagnoses": [
+        {
+            "name": "Esophageal Foreign Body",
+            "match": {"onset": "Sudden", "associated_symptoms": ["Dysphagia", "Drooling"], "past_medical_history": "Pediatric"},
+            "differentiating_factors": "Sudden dysphagia, drooling, often pediatric (coin, battery). X-ray: radiopaque object. Endoscopy for removal. USMLE key: battery ingestion urgent."
+        },
+        {
+            "name": "Airway Foreign Body",
+            "match": {"onset": "Sudden", "associated_symptoms": ["Choking", "Respiratory distress"]},
+            "differentiating_factors": "Choking, stridor, respiratory distress. CXR, bronchoscopy for removal. USMLE key: pediatric emergency."
+        },
+        {
+            "name": "Perforation",
+            "match": {"onset": "Sudden", "object": "Sharp object", "associated_symptoms": "Chest pain"},
+            "differentiating_factors": "Pain post-ingestion of sharp object, pneumomediastinum on CXR. Surgical emergency. USMLE key: Boerhaave syndrome risk."
+        }
+    ]
+}
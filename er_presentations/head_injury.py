@@ -0,0 +1,34 @@
+# er_presentations/head_injury.py
+# Questions and diagnoses for the "Head Injury" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "mechanism": ["Fall", "Assault", "Motor vehicle accident"],
+        "loss_of_consciousness": ["Yes", "No"],
+        "associated_symptoms": ["Headache", "Nausea/Vomiting", "Amnesia", "Focal neurological deficit", "Seizure"],
+        "past_medical_history": ["Anticoagulant use", "Alcoholism"],
+        "physical_exam": ["Scalp hematoma", "Pupillary asymmetry"]
+    },
+    "diagnoses": [
+        {
+            "name": "Concussion",
+            "match": {"loss_of_consciousness": "Yes", "associated_symptoms": "Amnesia"},
+            "differentiating_factors": "Transient LOC, amnesia, headache, dizziness. CT if red flags (vomiting, age >60). Rest, monitor for post-concussion syndrome. USMLE key: no focal deficits."
+        },
+        {
+            "name": "Subdural Hematoma",
+            "match": {"associated_symptoms": ["Headache", "Focal neurological deficit"], "past_medical_history": "Anticoagulant use"},
+            "differentiating_factors": "Slow-onset symptoms in elderly post-minor trauma. CT: crescent-shaped hematoma. Surgical evacuation if symptomatic. USMLE key: anticoagulation risk."
+        },
+        {
+            "name": "Epidural Hematoma",
+            "match": {"mechanism": "Motor vehicle accident", "associated_symptoms": ["Headache", "Nausea/Vomiting"]},
+            "differentiating_factors": "Lucid interval, then rapid decline. CT: lens-shaped hematoma. Neurosurgical emergency. USMLE key: arterial bleed, temporal bone fracture."
+        },
+        {
+            "name": "Traumatic Subarachnoid Hemorrhage",
+            "match": {"mechanism": "Motor vehicle accident", "associated_symptoms": "Headache"},
+            "differentiating_factors": "Sudden headache post-trauma. CT: blood in subarachnoid space. Monitor for vasospasm. USMLE key: trauma-related SAH."
+        }
+    ]
+}
@@ -0,0 +1,58 @@
+# er_presentations/headache.py
+# Questions and diagnoses for the "Headache" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Sudden (Thunderclap)", "Gradual"],
+        "character": ["Throbbing", "Band-like pressure", "Sharp", "Dull", "Worse with valsalva"],
+        "location": ["Unilateral", "Bilateral", "Occipital", "Temporal", "Frontal"],
+        "associated_symptoms": ["Photophobia", "Phonophobia", "Nausea/Vomiting", "Fever", "Stiff neck", "Visual changes", "Focal neurological deficits", "Tearing", "Nasal congestion"],
+        "triggers": ["Stress", "Caffeine withdrawal", "Sleep deprivation", "Hypertension", "Food triggers"],
+        "relieving_factors": ["Rest", "Analgesics", "Dark room", "None"],
+        "past_medical_history": ["Migraine", "Hypertension", "Recent trauma", "Infection"],
+        "physical_exam": ["Papilledema", "Nuchal rigidity", "Temporal tenderness", "Focal neurological signs"],
+        "social_history": ["Alcohol use", "Smoking"]
+    },
+    "diagnoses": [
+        {
+            "name": "Migraine",
+            "match": {"onset": "Gradual", "character": "Throbbing", "associated_symptoms": ["Photophobia", "Phonophobia", "Nausea/Vomiting"], "past_medical_history": "Migraine"},
+            "differentiating_factors": "Unilateral, pulsating headache, 4-72 hours, with nausea, photophobia, or aura. Triggers: stress, foods. Triptans (sumatriptan), NSAIDs. Prophylaxis (propranolol) if frequent. USMLE key: aura in 30% of cases."
+        },
+        {
+            "name": "Tension Headache",
+            "match": {"onset": "Gradual", "character": "Band-like pressure", "location": "Bilateral"},
+            "differentiating_factors": "Bilateral, non-pulsatile, stress-related. No nausea or photophobia. NSAIDs, stress management. USMLE key: most common headache type."
+        },
+        {
+            "name": "Subarachnoid Hemorrhage",
+            "match": {"onset": "Sudden (Thunderclap)", "associated_symptoms": ["Stiff neck", "Focal neurological deficits"]},
+            "differentiating_factors": "Worst headache of life, sudden onset. Seizures, altered mental status. Non-contrast CT head; LP if negative (xanthochromia). Neurosurgical emergency. USMLE key: sentinel bleed history."
+        },
+        {
+            "name": "Meningitis",
+            "match": {"character": "Worse with valsalva", "associated_symptoms": ["Fever", "Stiff neck"], "physical_exam": "Nuchal rigidity"},
+            "differentiating_factors": "Fever, headache, nuchal rigidity. Kernig’s/Brudzinski’s signs. LP: elevated WBC, low glucose (bacterial). Antibiotics (ceftriaxone, vancomycin), steroids. USMLE key: meningococcal rash."
+        },
+        {
+            "name": "Temporal Arteritis",
+            "match": {"location": "Temporal", "associated_symptoms": "Visual changes", "physical_exam": "Temporal tenderness"},
+            "differentiating_factors": "Unilateral temporal pain, jaw claudication, visual loss in >50y. ESR/CRP elevated. Temporal artery biopsy. High-dose steroids (prednisone). USMLE key: vision loss irreversible."
+        },
+        {
+            "name": "Cluster Headache",
+            "match": {"location": "Unilateral", "character": "Sharp", "associated_symptoms": ["Tearing", "Nasal congestion"]},
+            "differentiating_factors": "Severe, unilateral orbital pain, 15-180 minutes, with lacrimation, nasal congestion. High-flow oxygen, triptans. USMLE key: male predominance, nocturnal attacks."
+        },
+        {
+            "name": "Idiopathic Intracranial Hypertension",
+            "match": {"associated_symptoms": "Visual changes", "physical_exam": "Papilledema"},
+            "differentiating_factors": "Headache with visual changes, pulsatile tinnitus, often in obese young females. LP: elevated opening pressure. Acetazolamide, weight loss. USMLE key: papilledema on fundoscopy."
+        },
+        {
+            "name": "Cervicogenic Headache",
+            "match": {"location": "Occipital", "exacerbating_factors": "Movement"},
+            "differentiating_factors": "Occipital pain radiating forward, related to neck movement or posture. Physical therapy, analgesics. USMLE key: cervical spine pathology."
+        }
+    ]
+}
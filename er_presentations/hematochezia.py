@@ -0,0 +1,34 @@
+# er_presentations/hematochezia.py
+# Questions and diagnoses for the "Hematochezia" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "character": ["Bright red blood", "Mixed with stool"],
+        "associated_symptoms": ["Abdominal pain", "Weight loss", "Fever"],
+        "past_medical_history": ["IBD", "Diverticulosis", "Hemorrhoids"],
+        "physical_exam": ["Anal fissure", "Masses"],
+        "social_history": ["NSAID use"]
+    },
+    "diagnoses": [
+        {
+            "name": "Hemorrhoids",
+            "match": {"character": "Bright red blood", "past_medical_history": "Hemorrhoids"},
+            "differentiating_factors": "Bright red blood on wiping, no systemic symptoms. Anoscopy confirms. Fiber, topical treatments. USMLE key: common, benign."
+        },
+        {
+            "name": "Diverticular Bleeding",
+            "match": {"character": "Bright red blood", "past_medical_history": "Diverticulosis"},
+            "differentiating_factors": "Painless hematochezia in elderly. Colonoscopy, angiography if severe. USMLE key: self-limiting in most cases."
+        },
+        {
+            "name": "Inflammatory Bowel Disease (IBD)",
+            "match": {"character": "Mixed with stool", "past_medical_history": "IBD"},
+            "differentiating_factors": "Bloody diarrhea, abdominal pain, weight loss. Colonoscopy diagnostic. Mesalamine, steroids. USMLE key: chronic symptoms."
+        },
+        {
+            "name": "Colorectal Cancer",
+            "match": {"associated_symptoms": ["Weight loss", "Abdominal pain"]},
+            "differentiating_factors": "Hematochezia with weight loss, change in bowel habits. Colonoscopy with biopsy. USMLE key: age >50, screening critical."
+        }
+    ]
+}
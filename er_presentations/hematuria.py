@@ -0,0 +1,34 @@
+# er_presentations/hematuria.py
+# Questions and diagnoses for the "Hematuria" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "character": ["Gross", "Microscopic"],
+        "associated_symptoms": ["Dysuria", "Flank pain", "Weight loss"],
+        "past_medical_history": ["Kidney stones", "Bladder cancer", "Trauma"],
+        "physical_exam": ["CVA tenderness", "Abdominal mass"],
+        "social_history": ["Smoking"]
+    },
+    "diagnoses": [
+        {
+            "name": "Nephrolithiasis",
+            "match": {"character": "Gross", "associated_symptoms": "Flank pain"},
+            "differentiating_factors": "Colicky flank pain, hematuria. CT: stones. Hydration, analgesia. USMLE key: calcium oxalate most common."
+        },
+        {
+            "name": "Bladder Cancer",
+            "match": {"character": "Gross", "associated_symptoms": "Weight loss", "social_history": "Smoking"},
+            "differentiating_factors": "Painless gross hematuria, smoking history. Cystoscopy, biopsy. USMLE key: elderly males, smoking."
+        },
+        {
+            "name": "Urinary Tract Infection (UTI)",
+            "match": {"character": "Microscopic", "associated_symptoms": "Dysuria"},
+            "differentiating_factors": "Dysuria, urgency, hematuria on urinalysis. Antibiotics (nitrofurantoin). USMLE key: pyuria present."
+        },
+        {
+            "name": "Glomerulonephritis",
+            "match": {"character": "Microscopic", "associated_symptoms": "Edema"},
+            "differentiating_factors": "Hematuria, proteinuria, hypertension. Renal biopsy, treat underlying cause (e.g., post-streptococcal). USMLE key: cola-colored urine."
+        }
+    ]
+}
@@ -0,0 +1,35 @@
+# er_presentations/hemoptysis.py
+# Questions and diagnoses for the "Hemoptysis" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Sudden", "Gradual"],
+        "character": ["Streaks of blood", "Frank blood"],
+        "associated_symptoms": ["Cough", "Fever", "Weight loss", "Chest pain"],
+        "past_medical_history": ["TB", "Lung cancer", "COPD"],
+        "physical_exam": ["Wheezing", "Clubbing"],
+        "social_history": ["Smoking", "Travel history"]
+    },
+    "diagnoses": [
+        {
+            "name": "Bronchitis",
+            "match": {"onset": "Gradual", "character": "Streaks of blood", "associated_symptoms": "Cough"},
+            "differentiating_factors": "Productive cough with blood streaks, often post-viral. Supportive care, antibiotics if bacterial. USMLE key: benign, common."
+        },
+        {
+            "name": "Pulmonary Embolism",
+            "match": {"onset": "Sudden", "associated_symptoms": ["Chest pain", "Dyspnea"]},
+            "differentiating_factors": "Sudden hemoptysis, dyspnea, hypoxia. CTPA diagnostic. Anticoagulation (heparin). USMLE key: Wells score, S1Q3T3 on EKG."
+        },
+        {
+            "name": "Lung Cancer",
+            "match": {"onset": "Gradual", "associated_symptoms": ["Weight loss", "Cough"], "social_history": "Smoking"},
+            "differentiating_factors": "Chronic hemoptysis, weight loss, smoking history. CT: lung mass. Bronchoscopy for biopsy. USMLE key: smokers >40."
+        },
+        {
+            "name": "Tuberculosis",
+            "match": {"onset": "Gradual", "associated_symptoms": ["Fever", "Weight loss"], "past_medical_history": "TB"},
+            "differentiating_factors": "Hemoptysis, night sweats, weight loss. CXR: cavitary lesions, sputum AFB positive. RIPE therapy. USMLE key: reactivation TB."
+        }
+    ]
+}
@@ -0,0 +1,23 @@
+# er_presentations/hypertension.py
+# Questions and diagnoses for the "Hypertension" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "bp_reading": ["Severe (>180/120)", "Mild"],
+        "associated_symptoms": ["Headache", "Chest pain", "Shortness of breath", "Visual changes"],
+        "past_medical_history": ["Chronic hypertension", "Renal disease"],
+        "physical_exam": ["Papilledema", "Retinal hemorrhages"]
+    },
+    "diagnoses": [
+        {
+            "name": "Hypertensive Emergency",
+            "match": {"bp_reading": "Severe (>180/120)", "associated_symptoms": ["Headache", "Chest pain", "Shortness of breath"]},
+            "differentiating_factors": "BP >180/120 with end-organ damage (encephalopathy, AKI). IV medications (labetalol, nicardipine). USMLE key: gradual BP reduction."
+        },
+        {
+            "name": "Hypertensive Urgency",
+            "match": {"bp_reading": "Severe (>180/120)", "associated_symptoms": "None"},
+            "differentiating_factors": "BP >180/120 without end-organ damage. Oral medications (clonidine). USMLE key: outpatient follow-up."
+        }
+    ]
+}
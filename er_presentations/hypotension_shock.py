@@ -0,0 +1,34 @@
+# er_presentations/hypotension_shock.py
+# Questions and diagnoses for the "Hypotension/Shock" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Sudden", "Gradual"],
+        "associated_symptoms": ["Fever", "Chest pain", "Abdominal pain", "Bleeding"],
+        "past_medical_history": ["Sepsis", "Trauma", "MI"],
+        "physical_exam": ["Tachycardia", "Cool extremities", "JVD"],
+        "social_history": ["Recent trauma"]
+    },
+    "diagnoses": [
+        {
+            "name": "Septic Shock",
+            "match": {"onset": "Sudden", "associated_symptoms": "Fever", "past_medical_history": "Sepsis"},
+            "differentiating_factors": "Hypotension, fever, warm skin early. qSOFA score, blood cultures. Broad-spectrum antibiotics, fluids. USMLE key: early goal-directed therapy."
+        },
+        {
+            "name": "Hypovolemic Shock",
+            "match": {"onset": "Sudden", "associated_symptoms": "Bleeding", "past_medical_history": "Trauma"},
+            "differentiating_factors": "Hypotension, tachycardia, cool skin post-bleeding. Fluids, blood transfusion. USMLE key: class III/IV shock."
+        },
+        {
+            "name": "Cardiogenic Shock",
+            "match": {"onset": "Sudden", "associated_symptoms": "Chest pain", "physical_exam": "JVD"},
+            "differentiating_factors": "Hypotension, JVD, pulmonary edema post-MI. Echocardiogram, inotropes (dobutamine). USMLE key: low cardiac output."
+        },
+        {
+            "name": "Anaphylactic Shock",
+            "match": {"onset": "Sudden", "associated_symptoms": "Rash", "past_medical_history": "Allergies"},
+            "differentiating_factors": "Hypotension, urticaria, wheezing post-allergen. IM epinephrine, fluids. USMLE key: rapid onset."
+        }
+    ]
+}
@@ -0,0 +1,34 @@
+# er_presentations/jaundice.py
+# Questions and diagnoses for the "Jaundice" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Acute", "Chronic"],
+        "associated_symptoms": ["Abdominal pain", "Fever", "Weight loss", "Pruritus"],
+        "past_medical_history": ["Hepatitis", "Alcohol use", "Gallstones"],
+        "physical_exam": ["Hepatomegaly", "Splenomegaly", "Scleral icterus"],
+        "social_history": ["IV drug use", "Alcohol use"]
+    },
+    "diagnoses": [
+        {
+            "name": "Viral Hepatitis",
+            "match": {"onset": "Acute", "associated_symptoms": ["Fever", "Abdominal pain"], "social_history": "IV drug use"},
+            "differentiating_factors": "Acute jaundice, elevated transaminases, viral serologies (HAV, HBV, HCV). Supportive care, antivirals for HBV/HCV. USMLE key: risk factors critical."
+        },
+        {
+            "name": "Cholecystitis/Cholangitis",
+            "match": {"onset": "Acute", "associated_symptoms": ["Abdominal pain", "Fever"], "past_medical_history": "Gallstones"},
+            "differentiating_factors": "RUQ pain, fever, jaundice (Charcot’s triad for cholangitis). Ultrasound, ERCP for cholangitis. Antibiotics, cholecystectomy. USMLE key: Murphy’s sign, ascending cholangitis."
+        },
+        {
+            "name": "Alcoholic Hepatitis",
+            "match": {"onset": "Chronic", "past_medical_history": "Alcohol use"},
+            "differentiating_factors": "Jaundice, hepatomegaly, AST:ALT >2:1. Corticosteroids if severe (Maddrey score >32). USMLE key: alcohol history."
+        },
+        {
+            "name": "Pancreatic Cancer",
+            "match": {"onset": "Chronic", "associated_symptoms": ["Weight loss", "Abdominal pain"]},
+            "differentiating_factors": "Painless jaundice, weight loss, Courvoisier’s sign (palpable gallbladder). CT/MRI, biopsy. USMLE key: elderly, smoking history."
+        }
+    ]
+}
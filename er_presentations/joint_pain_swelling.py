@@ -0,0 +1,34 @@
+# er_presentations/joint_pain_swelling.py
+# Questions and diagnoses for the "Joint Pain/Swelling" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "location": ["Knee", "Shoulder", "Ankle", "Hip", "Multiple joints"],
+        "onset": ["Acute", "Chronic"],
+        "associated_symptoms": ["Redness", "Warmth", "Fever", "Limited range of motion", "Morning stiffness"],
+        "past_medical_history": ["Gout", "Rheumatoid arthritis", "Recent infection"],
+        "physical_exam": ["Effusion", "Erythema"]
+    },
+    "diagnoses": [
+        {
+            "name": "Septic Arthritis",
+            "match": {"onset": "Acute", "associated_symptoms": ["Redness", "Warmth", "Fever"], "physical_exam": "Effusion"},
+            "differentiating_factors": "Hot, swollen joint with fever. Joint aspiration: WBC >50,000, positive culture. Antibiotics (vancomycin, ceftriaxone), surgical drainage. USMLE key: S. aureus most common."
+        },
+        {
+            "name": "Gout",
+            "match": {"onset": "Acute", "location": "Ankle", "associated_symptoms": ["Redness", "Warmth"]},
+            "differentiating_factors": "Sudden, severe pain, often first MTP joint. Uric acid elevated, crystals on aspiration. Colchicine, NSAIDs. USMLE key: podagra."
+        },
+        {
+            "name": "Rheumatoid Arthritis (RA) flare",
+            "match": {"onset": "Chronic", "location": "Multiple joints", "associated_symptoms": "Morning stiffness"},
+            "differentiating_factors": "Symmetric polyarthritis, morning stiffness >1 hour. RF, anti-CCP positive. DMARDs (methotrexate). USMLE key: MCP/PIP involvement."
+        },
+        {
+            "name": "Osteoarthritis",
+            "match": {"onset": "Chronic", "associated_symptoms": "Limited range of motion"},
+            "differentiating_factors": "Joint pain worse with activity, improved with rest. X-ray: joint space narrowing, osteophytes. NSAIDs, physical therapy. USMLE key: weight-bearing joints."
+        }
+    ]
+}
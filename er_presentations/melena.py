@@ -0,0 +1,33 @@
+# er_presentations/melena.py
+# Questions and diagnoses for the "Melena" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "character": ["Black tarry stools", "Occult blood"],
+        "associated_symptoms": ["Abdominal pain", "Nausea", "Fatigue"],
+        "past_medical_history": ["PUD", "NSAID use", "Liver disease"],
+        "physical_exam": ["Pallor", "Epigastric tenderness"]
+    },
+    "diagnoses": [
+        {
+            "name": "Peptic Ulcer Disease (PUD)",
+            "match": {"character": "Black tarry stools", "past_medical_history": ["PUD", "NSAID use"]},
+            "differentiating_factors": "Epigastric pain, melena, H. pylori or NSAID use. EGD diagnostic, PPI, H. pylori eradication. USMLE key: perforation risk."
+        },
+        {
+            "name": "Gastritis",
+            "match": {"character": "Black tarry stools", "past_medical_history": "NSAID use"},
+            "differentiating_factors": "Melena, epigastric pain, often NSAID or alcohol-related. PPI, stop offending agent. USMLE key: rule out PUD."
+        },
+        {
+            "name": "Esophageal Varices",
+            "match": {"character": "Black tarry stools", "past_medical_history": "Liver disease"},
+            "differentiating_factors": "Melena or hematemesis in cirrhosis. EGD, band ligation. Octreotide, beta-blockers. USMLE key: portal hypertension."
+        },
+        {
+            "name": "Mallory-Weiss Tear",
+            "match": {"associated_symptoms": ["Nausea", "Vomiting"]},
+            "differentiating_factors": "Melena post-vomiting, alcohol use. EGD diagnostic, supportive care. USMLE key: self-limiting in most cases."
+        }
+    ]
+}
@@ -0,0 +1,35 @@
+# er_presentations/nausea_and_vomiting.py
+# Questions and diagnoses for the "Nausea and Vomiting" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Acute", "Chronic"],
+        "associated_symptoms": ["Abdominal pain", "Diarrhea", "Fever", "Headache", "Vertigo"],
+        "timing": ["After meals", "Morning", "None"],
+        "past_medical_history": ["Pregnancy", "Diabetes", "Migraine"],
+        "physical_exam": ["Abdominal distension", "Tenderness"],
+        "social_history": ["Alcohol use", "Recent travel"]
+    },
+    "diagnoses": [
+        {
+            "name": "Gastroenteritis",
+            "match": {"onset": "Acute", "associated_symptoms": ["Diarrhea", "Abdominal pain"], "social_history": "Recent travel"},
+            "differentiating_factors": "Vomiting, diarrhea, cramping pain, often viral (norovirus). Stool studies if severe. Fluids, antiemetics (ondansetron). USMLE key: dehydration risk."
+        },
+        {
+            "name": "Bowel Obstruction",
+            "match": {"onset": "Acute", "associated_symptoms": "Abdominal pain", "physical_exam": "Abdominal distension"},
+            "differentiating_factors": "Vomiting (feculent if distal), distension, no flatus/stool. X-ray: air-fluid levels. NG tube, surgery if strangulation. USMLE key: high-pitched bowel sounds."
+        },
+        {
+            "name": "Pancreatitis",
+            "match": {"onset": "Acute", "associated_symptoms": "Abdominal pain", "timing": "After meals"},
+            "differentiating_factors": "Epigastric pain radiating to back, post-meal. Elevated lipase. CT for complications. IV fluids, NPO. USMLE key: alcohol, gallstones."
+        },
+        {
+            "name": "Morning Sickness",
+            "match": {"onset": "Chronic", "timing": "Morning", "past_medical_history": "Pregnancy"},
+            "differentiating_factors": "Nausea/vomiting in first trimester. Supportive care, antiemetics (pyridoxine, doxylamine). USMLE key: rule out hyperemesis gravidarum."
+        }
+    ]
+}
@@ -0,0 +1,34 @@
+# er_presentations/neck_pain.py
+# Questions and diagnoses for the "Neck Pain" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Sudden", "Gradual"],
+        "associated_symptoms": ["Fever", "Stiff neck", "Headache", "Weakness"],
+        "past_medical_history": ["Trauma", "Infection", "RA"],
+        "physical_exam": ["Nuchal rigidity", "Tender lymph nodes"],
+        "social_history": ["Recent infection"]
+    },
+    "diagnoses": [
+        {
+            "name": "Cervical Strain",
+            "match": {"onset": "Sudden", "past_medical_history": "Trauma"},
+            "differentiating_factors": "Localized pain post-trauma, no neurological deficits. NSAIDs, physical therapy. USMLE key: benign, common."
+        },
+        {
+            "name": "Meningitis",
+            "match": {"onset": "Sudden", "associated_symptoms": ["Fever", "Stiff neck"], "physical_exam": "Nuchal rigidity"},
+            "differentiating_factors": "Neck stiffness, fever, headache. LP: elevated WBC, low glucose (bacterial). Antibiotics (ceftriaxone, vancomycin). USMLE key: Kernig’s/Brudzinski’s signs."
+        },
+        {
+            "name": "Cervical Spondylosis",
+            "match": {"onset": "Gradual", "past_medical_history": "RA"},
+            "differentiating_factors": "Chronic neck pain, stiffness, radiculopathy. X-ray: degenerative changes. NSAIDs, physical therapy. USMLE key: elderly patients."
+        },
+        {
+            "name": "Subarachnoid Hemorrhage",
+            "match": {"onset": "Sudden", "associated_symptoms": ["Headache", "Stiff neck"]},
+            "differentiating_factors": "Thunderclap headache, neck stiffness. CT head, LP if negative (xanthochromia). Neurosurgical emergency. USMLE key: sentinel bleed."
+        }
+    ]
+}
@@ -0,0 +1,40 @@
+# er_presentations/numbness_tingling.py
+# Questions and diagnoses for the "Numbness/Tingling" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "location": ["Unilateral", "Bilateral", "Facial", "Extremity"],
+        "onset": ["Sudden", "Gradual"],
+        "associated_symptoms": ["Weakness", "Speech difficulty", "Vision changes", "Pain"],
+        "past_medical_history": ["Diabetes", "Stroke", "MS", "Vitamin B12 deficiency"],
+        "physical_exam": ["Sensory loss", "Reflex changes", "Motor deficits"],
+        "social_history": ["Alcohol use"]
+    },
+    "diagnoses": [
+        {
+            "name": "Stroke (CVA)",
+            "match": {"onset": "Sudden", "location": "Unilateral", "associated_symptoms": ["Weakness", "Speech difficulty"]},
+            "differentiating_factors": "Sudden unilateral numbness with weakness or aphasia. CT/MRI to rule out hemorrhage; tPA if ischemic within 4.5 hours. USMLE key: NIHSS for severity, time-critical."
+        },
+        {
+            "name": "Peripheral Neuropathy",
+            "match": {"onset": "Gradual", "location": "Bilateral", "past_medical_history": "Diabetes"},
+            "differentiating_factors": "Symmetric distal numbness, burning pain, often diabetic. HbA1c elevated, nerve conduction studies confirm. Glycemic control, gabapentin for pain. USMLE key: ‘stocking-glove’ distribution."
+        },
+        {
+            "name": "Multiple Sclerosis (MS)",
+            "match": {"onset": "Gradual", "associated_symptoms": "Vision changes", "past_medical_history": "MS"},
+            "differentiating_factors": "Numbness with optic neuritis or motor deficits, relapsing-remitting. MRI: white matter lesions. High-dose steroids, disease-modifying therapies (interferon). USMLE key: lesions separated in time and space."
+        },
+        {
+            "name": "Vitamin B12 Deficiency",
+            "match": {"onset": "Gradual", "location": "Bilateral", "past_medical_history": "Vitamin B12 deficiency"},
+            "differentiating_factors": "Numbness, paresthesias, macrocytic anemia. Low B12, elevated methylmalonic acid. IM B12 replacement. USMLE key: pernicious anemia, subacute combined degeneration."
+        },
+        {
+            "name": "Bell’s Palsy",
+            "match": {"location": "Facial", "onset": "Sudden", "associated_symptoms": "Facial weakness"},
+            "differentiating_factors": "Unilateral facial numbness/weakness, no central signs. Corticosteroids (prednisone) within 72 hours, antivirals if HSV suspected. USMLE key: peripheral CN VII palsy, no forehead sparing."
+        }
+    ]
+}
@@ -0,0 +1,35 @@
+# er_presentations/palpitations.py
+# Questions and diagnoses for the "Palpitations" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Sudden", "Gradual"],
+        "character": ["Racing", "Skipping a beat", "Pounding"],
+        "associated_symptoms": ["Dizziness", "Syncope", "Chest pain", "Dyspnea"],
+        "past_medical_history": ["Thyroid disease", "Arrhythmia"],
+        "physical_exam": ["Irregular pulse", "Tachycardia"],
+        "social_history": ["Caffeine use", "Drug use"]
+    },
+    "diagnoses": [
+        {
+            "name": "Atrial Fibrillation (A-fib)",
+            "match": {"character": "Racing", "onset": "Sudden", "physical_exam": "Irregular pulse"},
+            "differentiating_factors": "Irregularly irregular rhythm, stroke risk. EKG diagnostic. Anticoagulation, rate control (beta-blockers). USMLE key: CHA2DS2-VASc score."
+        },
+        {
+            "name": "Supraventricular Tachycardia (SVT)",
+            "match": {"character": "Racing", "onset": "Sudden"},
+            "differentiating_factors": "Regular, narrow-complex tachycardia. Vagal maneuvers, adenosine. USMLE key: abrupt onset/offset."
+        },
+        {
+            "name": "Ventricular Tachycardia (V-tach)",
+            "match": {"associated_symptoms": ["Dizziness", "Syncope", "Chest pain"]},
+            "differentiating_factors": "Wide-complex tachycardia, risk of cardiac arrest. EKG diagnostic. Amiodarone, cardioversion if unstable. USMLE key: cardiac history."
+        },
+        {
+            "name": "Anxiety-Induced Palpitations",
+            "match": {"associated_symptoms": "Dizziness", "social_history": "Caffeine use"},
+            "differentiating_factors": "Palpitations with anxiety, normal EKG. Reassurance, avoid triggers. USMLE key: rule out organic causes."
+        }
+    ]
+}
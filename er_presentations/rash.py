@@ -0,0 +1,41 @@
+# er_presentations/rash.py
+# Questions and diagnoses for the "Rash" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Sudden", "Gradual"],
+        "appearance": ["Maculopapular", "Vesicular", "Urticarial", "Erythema Migrans", "Purpuric"],
+        "associated_symptoms": ["Fever", "Itching", "Joint pain", "Pain"],
+        "risk_factors": ["Recent medication", "Tick exposure", "Allergen exposure"],
+        "past_medical_history": ["Autoimmune disease", "HIV"],
+        "physical_exam": ["Distribution (dermatomal, diffuse)", "Palpable purpura"],
+        "social_history": ["Recent travel", "Animal contact"]
+    },
+    "diagnoses": [
+        {
+            "name": "Allergic Reaction (Urticaria)",
+            "match": {"onset": "Sudden", "appearance": "Urticarial", "associated_symptoms": "Itching"},
+            "differentiating_factors": "Itchy hives, triggered by food, medication, or insect bites. Antihistamines (diphenhydramine), steroids if severe. USMLE key: rule out anaphylaxis."
+        },
+        {
+            "name": "Cellulitis",
+            "match": {"onset": "Sudden", "appearance": "Erythema", "associated_symptoms": "Fever"},
+            "differentiating_factors": "Localized redness, warmth, swelling. Antibiotics (cephalexin, clindamycin). USMLE key: check for abscess."
+        },
+        {
+            "name": "Shingles (Herpes Zoster)",
+            "match": {"appearance": "Vesicular", "physical_exam": "Distribution (dermatomal)"},
+            "differentiating_factors": "Painful, vesicular rash in dermatomal distribution, preceded by burning. Antivirals (acyclovir) if <72 hours. USMLE key: post-herpetic neuralgia risk."
+        },
+        {
+            "name": "Lyme Disease",
+            "match": {"appearance": "Erythema Migrans", "risk_factors": "Tick exposure"},
+            "differentiating_factors": "Bull’s-eye rash, fever, joint pain post-tick bite. Serology confirms. Doxycycline. USMLE key: early localized stage."
+        },
+        {
+            "name": "Meningococcemia",
+            "match": {"appearance": "Purpuric", "associated_symptoms": ["Fever", "Headache"]},
+            "differentiating_factors": "Purpuric rash, fever, hypotension. Blood cultures, LP if meningitis suspected. Antibiotics (ceftriaxone). USMLE key: petechial rash."
+        }
+    ]
+}
@@ -0,0 +1,34 @@
+# er_presentations/respiratory_distress.py
+# Questions and diagnoses for the "Respiratory Distress" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Sudden", "Gradual"],
+        "associated_symptoms": ["Wheezing", "Stridor", "Cough", "Fever"],
+        "past_medical_history": ["Asthma", "CHF", "COPD"],
+        "physical_exam": ["Accessory muscle use", "Crackles", "JVD"],
+        "social_history": ["Smoking", "Allergen exposure"]
+    },
+    "diagnoses": [
+        {
+            "name": "Asthma Exacerbation",
+            "match": {"onset": "Sudden", "associated_symptoms": "Wheezing", "past_medical_history": "Asthma"},
+            "differentiating_factors": "Sudden respiratory distress, wheezing, reduced peak flow. Albuterol, corticosteroids. USMLE key: reversible obstruction."
+        },
+        {
+            "name": "Congestive Heart Failure (CHF)",
+            "match": {"onset": "Gradual", "associated_symptoms": "Crackles", "physical_exam": "JVD"},
+            "differentiating_factors": "Dyspnea, crackles, edema, elevated BNP. Diuretics (furosemide), oxygen. USMLE key: pink frothy sputum."
+        },
+        {
+            "name": "Pneumothorax",
+            "match": {"onset": "Sudden", "physical_exam": "Decreased breath sounds"},
+            "differentiating_factors": "Sudden distress, unilateral decreased breath sounds. CXR: lung collapse. Chest tube. USMLE key: tension pneumothorax signs."
+        },
+        {
+            "name": "Acute Respiratory Distress Syndrome (ARDS)",
+            "match": {"onset": "Sudden", "past_medical_history": "Recent trauma"},
+            "differentiating_factors": "Severe hypoxia, bilateral crackles, PaO2/FiO2 <300. CXR: bilateral infiltrates. Low tidal volume ventilation. USMLE key: non-cardiogenic edema."
+        }
+    ]
+}
@@ -0,0 +1,35 @@
+# er_presentations/seizures.py
+# Questions and diagnoses for the "Seizures" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "type": ["Generalized", "Focal"],
+        "known_history": ["Yes (epilepsy)", "No"],
+        "associated_symptoms": ["Fever", "Head trauma", "Drug/alcohol use", "Tongue biting"],
+        "past_medical_history": ["Epilepsy", "Stroke"],
+        "physical_exam": ["Postictal state", "Injuries"],
+        "social_history": ["Alcohol withdrawal"]
+    },
+    "diagnoses": [
+        {
+            "name": "Epilepsy",
+            "match": {"type": "Generalized", "known_history": "Yes (epilepsy)"},
+            "differentiating_factors": "Seizures in known epilepsy. Medication noncompliance common. Antiepileptics (levetiracetam). USMLE key: avoid triggers."
+        },
+        {
+            "name": "Status Epilepticus",
+            "match": {"type": "Generalized"},
+            "differentiating_factors": "Seizures >5 minutes or multiple without recovery. Benzodiazepines (lorazepam), antiepileptics. USMLE key: airway protection."
+        },
+        {
+            "name": "Febrile Seizure",
+            "match": {"associated_symptoms": "Fever"},
+            "differentiating_factors": "Seizures in children with fever, benign. Antipyretics, workup for infection. USMLE key: age 6 months to 5 years."
+        },
+        {
+            "name": "Alcohol Withdrawal Seizure",
+            "match": {"social_history": "Alcohol withdrawal", "associated_symptoms": "Drug/alcohol use"},
+            "differentiating_factors": "Seizures 12-48 hours post-alcohol cessation. Benzodiazepines (lorazepam). USMLE key: treat underlying withdrawal."
+        }
+    ]
+}
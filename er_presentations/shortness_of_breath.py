@@ -0,0 +1,67 @@
+# er_presentations/shortness_of_breath.py
+# Questions and diagnoses for the "Shortness of Breath" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Sudden", "Gradual"],
+        "associated_symptoms": ["Cough", "Wheezing", "Chest pain", "Fever", "Ankle swelling", "Orthopnea", "Paroxysmal nocturnal dyspnea", "Hemoptysis", "Weight loss"],
+        "exacerbating_factors": ["Exertion", "Lying flat", "Allergens", "Cold air", "None"],
+        "relieving_factors": ["Bronchodilators", "Sitting up", "Oxygen", "None"],
+        "risk_factors": ["Smoking", "Heart disease", "Asthma", "Recent immobilization", "Malignancy", "Obesity"],
+        "past_medical_history": ["COPD", "CHF", "Asthma", "DVT/PE", "Pulmonary hypertension"],
+        "physical_exam": ["Crackles", "Wheezes", "Decreased breath sounds", "JVD", "Edema", "Cyanosis"],
+        "social_history": ["Smoking history", "Occupational exposure"]
+    },
+    "diagnoses": [
+        {
+            "name": "Asthma Exacerbation",
+            "match": {"onset": "Sudden", "associated_symptoms": ["Wheezing", "Cough"], "relieving_factors": "Bronchodilators", "past_medical_history": "Asthma"},
+            "differentiating_factors": "Sudden dyspnea with wheezing, triggered by allergens, infection, or exercise. Reduced peak flow. Albuterol, corticosteroids; magnesium sulfate for severe cases. USMLE key: accessory muscle use, pulsus paradoxus."
+        },
+        {
+            "name": "Congestive Heart Failure (CHF)",
+            "match": {"onset": "Gradual", "associated_symptoms": ["Ankle swelling", "Orthopnea", "Paroxysmal nocturnal dyspnea"], "physical_exam": ["Crackles", "JVD", "Edema"]},
+            "differentiating_factors": "Gradual dyspnea with edema, orthopnea, JVD. CXR: pulmonary edema, cardiomegaly. BNP elevated. Diuretics (furosemide), ACE inhibitors, oxygen. USMLE key: S3 gallop, pink frothy sputum."
+        },
+        {
+            "name": "Pneumonia",
+            "match": {"onset": ["Sudden", "Gradual"], "associated_symptoms": ["Fever", "Cough"], "physical_exam": "Crackles"},
+            "differentiating_factors": "Fever, productive cough, dyspnea, focal crackles. CXR: consolidation. Leukocytosis, elevated CRP. Antibiotics (levofloxacin or ceftriaxone + azithromycin). USMLE key: community-acquired vs. hospital-acquired."
+        },
+        {
+            "name": "Pulmonary Embolism (PE)",
+            "match": {"onset": "Sudden", "associated_symptoms": ["Chest pain", "Hemoptysis"], "risk_factors": "Recent immobilization"},
+            "differentiating_factors": "Sudden dyspnea, pleuritic pain, hypoxia, tachycardia. Wells score; D-dimer if low probability. CTPA diagnostic. Anticoagulation (heparin, DOACs); thrombolytics if unstable. USMLE key: hypoxia with clear lungs."
+        },
+        {
+            "name": "COPD Exacerbation",
+            "match": {"onset": "Gradual", "associated_symptoms": ["Cough", "Wheezing"], "risk_factors": "Smoking", "past_medical_history": "COPD"},
+            "differentiating_factors": "Chronic cough, increased sputum, dyspnea in smoker. CXR: hyperinflation. Bronchodilators, steroids, antibiotics if bacterial. USMLE key: pursed-lip breathing, barrel chest."
+        },
+        {
+            "name": "Pneumothorax",
+            "match": {"onset": "Sudden", "associated_symptoms": "Chest pain", "physical_exam": "Decreased breath sounds"},
+            "differentiating_factors": "Sudden dyspnea, unilateral pain, decreased breath sounds, hyperresonance. CXR diagnostic. Tension pneumothorax: tracheal deviation, hypotension. Chest tube or needle decompression. USMLE key: young, tall males."
+        },
+        {
+            "name": "Anaphylaxis",
+            "match": {"onset": "Sudden", "associated_symptoms": ["Wheezing", "Hives"], "risk_factors": "Allergen exposure"},
+            "differentiating_factors": "Sudden dyspnea with hives, angioedema, hypotension post-allergen. IM epinephrine, antihistamines, steroids. USMLE key: biphasic reaction risk."
+        },
+        {
+            "name": "Acute Respiratory Distress Syndrome (ARDS)",
+            "match": {"onset": "Sudden", "associated_symptoms": "Dyspnea", "past_medical_history": "Recent trauma"},
+            "differentiating_factors": "Severe hypoxia, bilateral crackles post-sepsis, trauma, or aspiration. CXR: bilateral infiltrates. PaO2/FiO2 <300. Mechanical ventilation (low tidal volume). USMLE key: non-cardiogenic pulmonary edema."
+        },
+        {
+            "name": "Pulmonary Edema (Non-Cardiogenic)",
+            "match": {"onset": "Sudden", "associated_symptoms": "Dyspnea", "past_medical_history": "Recent aspiration"},
+            "differentiating_factors": "Sudden dyspnea with crackles, post-aspiration or drug overdose. CXR: bilateral infiltrates, normal heart size. Supportive care, treat underlying cause. USMLE key: distinguish from CHF."
+        },
+        {
+            "name": "Pulmonary Hypertension",
+            "match": {"onset": "Gradual", "associated_symptoms": ["Dyspnea", "Fatigue"], "past_medical_history": "Pulmonary hypertension"},
+            "differentiating_factors": "Progressive dyspnea, fatigue, syncope. Echo: elevated RV pressure. Right heart catheterization confirms. Vasodilators (epoprostenol). USMLE key: loud P2 on exam."
+        }
+    ]
+}
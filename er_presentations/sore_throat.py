@@ -0,0 +1,40 @@
+# er_presentations/sore_throat.py
+# Questions and diagnoses for the "Sore Throat" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Sudden", "Gradual"],
+        "associated_symptoms": ["Fever", "Cough", "White patches on tonsils", "Rash", "Lymphadenopathy", "Fatigue", "Dysphagia"],
+        "risk_factors": ["Recent exposure to sick contacts", "Immunocompromised"],
+        "past_medical_history": ["Recurrent tonsillitis", "HIV"],
+        "physical_exam": ["Exudates", "Tender lymph nodes", "Splenomegaly", "Trismus"],
+        "social_history": ["Smoking", "Sexual history"]
+    },
+    "diagnoses": [
+        {
+            "name": "Viral Pharyngitis",
+            "match": {"onset": "Gradual", "associated_symptoms": ["Cough", "Fatigue"]},
+            "differentiating_factors": "Mild sore throat with URI symptoms (rhinorrhea, cough). Supportive care. USMLE key: most common cause."
+        },
+        {
+            "name": "Strep Throat",
+            "match": {"onset": "Sudden", "associated_symptoms": ["Fever", "White patches on tonsils"], "physical_exam": "Tender lymph nodes"},
+            "differentiating_factors": "Sudden sore throat, fever, no cough, tender cervical nodes. Centor criteria. Rapid strep test, throat culture. Penicillin or amoxicillin. USMLE key: prevent rheumatic fever."
+        },
+        {
+            "name": "Mononucleosis",
+            "match": {"associated_symptoms": ["Fatigue", "Lymphadenopathy"], "physical_exam": "Splenomegaly"},
+            "differentiating_factors": "Prolonged sore throat, fatigue, lymphadenopathy, splenomegaly. Monospot test, EBV serologies. Supportive care; avoid contact sports. USMLE key: splenic rupture risk."
+        },
+        {
+            "name": "Peritonsillar Abscess",
+            "match": {"onset": "Sudden", "physical_exam": ["Exudates", "Trismus"]},
+            "differentiating_factors": "Severe unilateral sore throat, trismus, muffled voice, uvular deviation. CT/ultrasound confirms. Drainage, antibiotics (amoxicillin-clavulanate). USMLE key: ENT emergency."
+        },
+        {
+            "name": "Epiglottitis",
+            "match": {"onset": "Sudden", "associated_symptoms": ["Dysphagia", "Fever"], "physical_exam": "Trismus"},
+            "differentiating_factors": "Rapid-onset sore throat, drooling, stridor. Lateral neck X-ray: thumbprint sign. Airway management, antibiotics (ceftriaxone). USMLE key: H. influenzae in unvaccinated."
+        }
+    ]
+}
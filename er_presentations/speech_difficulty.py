@@ -0,0 +1,34 @@
+# er_presentations/speech_difficulty.py
+# Questions and diagnoses for the "Speech Difficulty" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "type": ["Slurred speech", "Word-finding difficulty", "Incoherent speech"],
+        "onset": ["Sudden", "Gradual"],
+        "associated_symptoms": ["Weakness", "Numbness", "Facial droop", "Confusion"],
+        "past_medical_history": ["Stroke", "TIA", "Dementia"],
+        "physical_exam": ["Cranial nerve deficits", "Motor weakness"]
+    },
+    "diagnoses": [
+        {
+            "name": "Ischemic Stroke",
+            "match": {"onset": "Sudden", "type": "Word-finding difficulty", "associated_symptoms": ["Weakness", "Facial droop"]},
+            "differentiating_factors": "Sudden aphasia with hemiparesis or facial droop. CT/MRI, tPA if within 4.5 hours. USMLE key: Broca’s (expressive) vs. Wernicke’s (receptive) aphasia."
+        },
+        {
+            "name": "Transient Ischemic Attack (TIA)",
+            "match": {"onset": "Sudden", "type": "Word-finding difficulty"},
+            "differentiating_factors": "Transient speech difficulty resolving <24 hours. Antiplatelets (aspirin), risk factor control. USMLE key: stroke precursor."
+        },
+        {
+            "name": "Brain Tumor",
+            "match": {"onset": "Gradual", "associated_symptoms": ["Headache", "Seizures"]},
+            "differentiating_factors": "Progressive speech difficulty with headache, seizures. MRI: mass effect. Surgical referral, steroids. USMLE key: focal symptoms with mass."
+        },
+        {
+            "name": "Dementia",
+            "match": {"onset": "Gradual", "type": "Word-finding difficulty", "past_medical_history": "Dementia"},
+            "differentiating_factors": "Progressive word-finding issues, memory loss. MMSE, MRI for atrophy. Supportive care. USMLE key: Alzheimer’s vs. frontotemporal dementia."
+        }
+    ]
+}
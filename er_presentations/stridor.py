@@ -0,0 +1,34 @@
+# er_presentations/stridor.py
+# Questions and diagnoses for the "Stridor" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Sudden", "Gradual"],
+        "associated_symptoms": ["Dyspnea", "Fever", "Drooling", "Cough"],
+        "past_medical_history": ["Allergies", "Recent intubation"],
+        "physical_exam": ["Inspiratory stridor", "Tracheal deviation"],
+        "social_history": ["Foreign body exposure"]
+    },
+    "diagnoses": [
+        {
+            "name": "Anaphylaxis",
+            "match": {"onset": "Sudden", "past_medical_history": "Allergies"},
+            "differentiating_factors": "Stridor, hives, hypotension post-allergen. IM epinephrine, airway management. USMLE key: rapid progression."
+        },
+        {
+            "name": "Epiglottitis",
+            "match": {"onset": "Sudden", "associated_symptoms": ["Fever", "Drooling"]},
+            "differentiating_factors": "Stridor, drooling, fever, tripod position. Lateral neck X-ray: thumbprint sign. Airway management, antibiotics (ceftriaxone). USMLE key: H. influenzae in unvaccinated."
+        },
+        {
+            "name": "Foreign Body Aspiration",
+            "match": {"onset": "Sudden", "social_history": "Foreign body exposure"},
+            "differentiating_factors": "Sudden stridor, choking history. CXR, bronchoscopy for removal. USMLE key: pediatric emergency."
+        },
+        {
+            "name": "Laryngeal Edema",
+            "match": {"onset": "Sudden", "past_medical_history": "Recent intubation"},
+            "differentiating_factors": "Stridor post-intubation or trauma. Steroids, airway monitoring. USMLE key: post-extubation complication."
+        }
+    ]
+}
@@ -0,0 +1,29 @@
+# er_presentations/syncope.py
+# Questions and diagnoses for the "Syncope" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Sudden", "Preceded by symptoms"],
+        "triggers": ["Standing up", "Painful stimulus", "Exertion", "None"],
+        "associated_symptoms": ["Palpitations", "Chest pain", "Fainting", "Seizure-like activity"],
+        "past_medical_history": ["Arrhythmia", "Dehydration"],
+        "physical_exam": ["Orthostatic vitals"]
+    },
+    "diagnoses": [
+        {
+            "name": "Vasovagal Syncope",
+            "match": {"onset": "Preceded by symptoms", "triggers": "Painful stimulus"},
+            "differentiating_factors": "Lightheadedness, nausea, sweating before fainting. Young, healthy patients. Supportive care. USMLE key: benign, common."
+        },
+        {
+            "name": "Orthostatic Hypotension",
+            "match": {"onset": "Sudden", "triggers": "Standing up", "physical_exam": "Orthostatic vitals"},
+            "differentiating_factors": "BP drop on standing, elderly or dehydrated. Fluids, address cause (medications). USMLE key: check diuretics."
+        },
+        {
+            "name": "Cardiogenic Syncope",
+            "match": {"onset": "Sudden", "triggers": "Exertion", "associated_symptoms": "Chest pain"},
+            "differentiating_factors": "Exertional syncope, arrhythmia or aortic stenosis. EKG, echo. USMLE key: red flag for cardiac cause."
+        }
+    ]
+}
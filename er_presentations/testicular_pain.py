@@ -0,0 +1,33 @@
+# er_presentations/testicular_pain.py
+# Questions and diagnoses for the "Testicular Pain" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Sudden", "Gradual"],
+        "associated_symptoms": ["Swelling", "Fever", "Nausea", "Dysuria"],
+        "past_medical_history": ["Recent trauma", "Infection"],
+        "physical_exam": ["Cremasteric reflex absent", "Testicular tenderness"]
+    },
+    "diagnoses": [
+        {
+            "name": "Testicular Torsion",
+            "match": {"onset": "Sudden", "associated_symptoms": "Nausea", "physical_exam": "Cremasteric reflex absent"},
+            "differentiating_factors": "Sudden severe pain, absent cremasteric reflex, high-riding testis. Doppler ultrasound: no flow. Surgical detorsion. USMLE key: time-sensitive, 6-hour window."
+        },
+        {
+            "name": "Epididymitis",
+            "match": {"onset": "Gradual", "associated_symptoms": ["Fever", "Dysuria"]},
+            "differentiating_factors": "Gradual pain, dysuria, epididymal tenderness. Antibiotics (ceftriaxone + doxycycline). USMLE key: STD or UTI."
+        },
+        {
+            "name": "Testicular Trauma",
+            "match": {"onset": "Sudden", "past_medical_history": "Recent trauma"},
+            "differentiating_factors": "Pain post-trauma, hematoma on ultrasound. Conservative management or surgery. USMLE key: rule out rupture."
+        },
+        {
+            "name": "Testicular Cancer",
+            "match": {"onset": "Gradual", "associated_symptoms": "Swelling"},
+            "differentiating_factors": "Painless mass, gradual pain. Ultrasound: solid mass. Tumor markers (AFP, β-hCG). USMLE key: young males."
+        }
+    ]
+}
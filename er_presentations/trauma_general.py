@@ -0,0 +1,33 @@
+# er_presentations/trauma_general.py
+# Questions and diagnoses for the "Trauma (General)" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "mechanism": ["Stab wound", "Gunshot wound", "Blunt force trauma"],
+        "injury_location": ["Abdomen", "Chest", "Extremity"],
+        "hemodynamic_status": ["Stable", "Unstable"],
+        "physical_exam": ["Penetrating wound", "Crepitus", "Abdominal rigidity"]
+    },
+    "diagnoses": [
+        {
+            "name": "Hemorrhagic Shock",
+            "match": {"mechanism": ["Stab wound", "Gunshot wound", "Blunt force trauma"], "hemodynamic_status": "Unstable"},
+            "differentiating_factors": "Hypotension, tachycardia post-trauma. Fluid resuscitation, blood transfusion, control bleeding. USMLE key: class III/IV shock."
+        },
+        {
+            "name": "Pneumothorax",
+            "match": {"mechanism": "Blunt force trauma", "injury_location": "Chest", "physical_exam": "Crepitus"},
+            "differentiating_factors": "Unilateral chest pain, dyspnea, decreased breath sounds. CXR diagnostic. Chest tube or needle decompression. USMLE key: tension pneumothorax signs."
+        },
+        {
+            "name": "Splenic/Liver Laceration",
+            "match": {"mechanism": "Blunt force trauma", "injury_location": "Abdomen", "hemodynamic_status": "Unstable"},
+            "differentiating_factors": "Abdominal pain, tenderness post-blunt trauma. FAST ultrasound, CT. Surgical intervention if unstable. USMLE key: Kehr’s sign for spleen."
+        },
+        {
+            "name": "Flail Chest",
+            "match": {"mechanism": "Blunt force trauma", "injury_location": "Chest", "physical_exam": "Crepitus"},
+            "differentiating_factors": "Paradoxical chest movement, multiple rib fractures. CXR diagnostic. Pain control, positive pressure ventilation. USMLE key: respiratory compromise."
+        }
+    ]
+}
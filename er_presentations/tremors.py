@@ -0,0 +1,35 @@
+# er_presentations/tremors.py
+# Questions and diagnoses for the "Tremors" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "type": ["Resting", "Intention", "Postural"],
+        "onset": ["Sudden", "Gradual"],
+        "associated_symptoms": ["Rigidity", "Bradykinesia", "Ataxia", "Confusion"],
+        "past_medical_history": ["Parkinson’s", "Thyroid disease"],
+        "physical_exam": ["Cogwheel rigidity", "Cerebellar signs"],
+        "social_history": ["Alcohol use", "Medication changes"]
+    },
+    "diagnoses": [
+        {
+            "name": "Parkinson’s Disease",
+            "match": {"type": "Resting", "associated_symptoms": ["Rigidity", "Bradykinesia"]},
+            "differentiating_factors": "Resting tremor, bradykinesia, cogwheel rigidity. Levodopa trial diagnostic. Dopamine agonists, MAO-B inhibitors. USMLE key: TRAP (tremor, rigidity, akinesia, postural instability)."
+        },
+        {
+            "name": "Essential Tremor",
+            "match": {"type": "Postural", "onset": "Gradual"},
+            "differentiating_factors": "Bilateral postural/action tremor, improves with alcohol. Propranolol, primidone. USMLE key: family history common."
+        },
+        {
+            "name": "Cerebellar Tremor",
+            "match": {"type": "Intention", "associated_symptoms": "Ataxia", "physical_exam": "Cerebellar signs"},
+            "differentiating_factors": "Intention tremor with ataxia, dysmetria. MRI to rule out stroke/tumor. Treat underlying cause. USMLE key: cerebellar signs."
+        },
+        {
+            "name": "Hyperthyroidism",
+            "match": {"type": "Postural", "associated_symptoms": "Weight loss", "past_medical_history": "Thyroid disease"},
+            "differentiating_factors": "Fine tremor with tachycardia, weight loss. Low TSH, high T4. Beta-blockers (propranolol), methimazole. USMLE key: thyroid function tests."
+        }
+    ]
+}
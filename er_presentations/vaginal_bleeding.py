@@ -0,0 +1,35 @@
+# er_presentations/vaginal_bleeding.py
+# Questions and diagnoses for the "Vaginal Bleeding" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Sudden", "Gradual"],
+        "character": ["Heavy", "Light", "Clots"],
+        "associated_symptoms": ["Abdominal pain", "Dizziness", "Fever"],
+        "past_medical_history": ["Pregnancy", "Fibroids", "PCOS"],
+        "physical_exam": ["Pelvic tenderness", "Uterine enlargement"],
+        "social_history": ["Recent miscarriage"]
+    },
+    "diagnoses": [
+        {
+            "name": "Ectopic Pregnancy",
+            "match": {"onset": "Sudden", "associated_symptoms": ["Abdominal pain", "Dizziness"], "past_medical_history": "Pregnancy"},
+            "differentiating_factors": "Unilateral pelvic pain, vaginal bleeding, positive β-hCG. Transvaginal ultrasound: no intrauterine pregnancy. Methotrexate or surgery. USMLE key: reproductive-age women."
+        },
+        {
+            "name": "Spontaneous Abortion",
+            "match": {"onset": "Sudden", "associated_symptoms": "Abdominal pain", "past_medical_history": "Pregnancy"},
+            "differentiating_factors": "Vaginal bleeding, cramping, positive β-hCG. Ultrasound: non-viable pregnancy. D&C or expectant management. USMLE key: first trimester."
+        },
+        {
+            "name": "Uterine Fibroids",
+            "match": {"onset": "Gradual", "character": "Heavy", "past_medical_history": "Fibroids"},
+            "differentiating_factors": "Heavy menstrual bleeding, pelvic pressure. Ultrasound: fibroids. NSAIDs, hormonal therapy. USMLE key: common in reproductive age."
+        },
+        {
+            "name": "Endometrial Cancer",
+            "match": {"onset": "Gradual", "past_medical_history": "PCOS"},
+            "differentiating_factors": "Postmenopausal bleeding or irregular bleeding. Endometrial biopsy. USMLE key: obesity, PCOS risk factors."
+        }
+    ]
+}
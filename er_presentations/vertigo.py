@@ -0,0 +1,38 @@
+# er_presentations/vertigo.py
+# Questions and diagnoses for the "Vertigo" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Sudden", "Gradual"],
+        "associated_symptoms": ["Hearing loss", "Tinnitus", "Nausea", "Head movements", "Focal neurological deficits"],
+        "past_medical_history": ["Migraine", "Stroke"],
+        "physical_exam": ["Nystagmus", "Gait instability"]
+    },
+    "diagnoses": [
+        {
+            "name": "Benign Paroxysmal Positional Vertigo (BPPV)",
+            "match": {"onset": "Sudden", "associated_symptoms": "Head movements", "physical_exam": "Nystagmus"},
+            "differentiating_factors": "Brief vertigo triggered by head movements. Dix-Hallpike maneuver diagnostic, shows geotropic nystagmus. Epley maneuver curative. USMLE key: no hearing loss, benign course."
+        },
+        {
+            "name": "Ménière's Disease",
+            "match": {"onset": "Sudden", "associated_symptoms": ["Hearing loss", "Tinnitus"]},
+            "differentiating_factors": "Episodic vertigo (hours), low-frequency hearing loss, tinnitus, aural fullness. Audiometry confirms hearing loss. Low-salt diet, diuretics (hydrochlorothiazide), betahistine. USMLE key: fluctuating symptoms, progressive hearing loss."
+        },
+        {
+            "name": "Vestibular Neuritis",
+            "match": {"onset": "Sudden", "associated_symptoms": "Nausea"},
+            "differentiating_factors": "Severe vertigo lasting days, often post-viral. No hearing loss, unidirectional nystagmus. Corticosteroids (prednisone), antiemetics (meclizine). USMLE key: viral prodrome, no auditory symptoms."
+        },
+        {
+            "name": "Cerebellar Stroke",
+            "match": {"onset": "Sudden", "associated_symptoms": "Focal neurological deficits", "physical_exam": "Gait instability"},
+            "differentiating_factors": "Sudden vertigo with ataxia, dysmetria, or cranial nerve deficits. CT/MRI confirms cerebellar infarct or hemorrhage. Neurology consult, thrombolytics if ischemic and within window. USMLE key: focal deficits, emergent imaging."
+        },
+        {
+            "name": "Vestibular Migraine",
+            "match": {"onset": "Sudden", "past_medical_history": "Migraine", "associated_symptoms": ["Headache", "Photophobia"]},
+            "differentiating_factors": "Vertigo with migraine symptoms (photophobia, headache). Triptans for acute attacks, prophylaxis (propranolol, amitriptyline). USMLE key: migraine history, no persistent neurological deficits."
+        }
+    ]
+}
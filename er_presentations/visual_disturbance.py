@@ -0,0 +1,34 @@
+# er_presentations/visual_disturbance.py
+# Questions and diagnoses for the "Visual Disturbance" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "type": ["Vision loss", "Double vision", "Flashing lights"],
+        "onset": ["Sudden", "Gradual"],
+        "associated_symptoms": ["Headache", "Pain with eye movement", "Nausea"],
+        "past_medical_history": ["Diabetes", "MS", "Hypertension"],
+        "physical_exam": ["Fundoscopic changes", "Pupillary defects"]
+    },
+    "diagnoses": [
+        {
+            "name": "Retinal Detachment",
+            "match": {"type": "Flashing lights", "onset": "Sudden", "associated_symptoms": "Floaters"},
+            "differentiating_factors": "Sudden floaters, flashes, curtain-like vision loss. Fundoscopy: detached retina. Urgent ophthalmology referral. USMLE key: visual field defect."
+        },
+        {
+            "name": "Optic Neuritis",
+            "match": {"type": "Vision loss", "onset": "Sudden", "associated_symptoms": "Pain with eye movement"},
+            "differentiating_factors": "Unilateral vision loss, pain with eye movement, often MS-related. MRI: optic nerve enhancement. High-dose steroids. USMLE key: afferent pupillary defect."
+        },
+        {
+            "name": "Temporal Arteritis",
+            "match": {"onset": "Sudden", "associated_symptoms": ["Headache", "Jaw claudication"], "past_medical_history": "Age >50"},
+            "differentiating_factors": "Sudden vision loss, temporal headache, ESR/CRP elevated. Temporal artery biopsy. High-dose prednisone. USMLE key: vision loss irreversible."
+        },
+        {
+            "name": "Diabetic Retinopathy",
+            "match": {"onset": "Gradual", "type": "Vision loss", "past_medical_history": "Diabetes"},
+            "differentiating_factors": "Gradual vision loss, hemorrhages/exudates on fundoscopy. HbA1c elevated. Laser therapy, VEGF inhibitors. USMLE key: control diabetes."
+        }
+    ]
+}
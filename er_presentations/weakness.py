@@ -0,0 +1,35 @@
+# er_presentations/weakness.py
+# Questions and diagnoses for the "Weakness" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Sudden", "Gradual"],
+        "location": ["One side of body", "Both sides of body", "All four limbs"],
+        "associated_symptoms": ["Numbness", "Difficulty speaking", "Drooping face", "Trouble swallowing"],
+        "past_medical_history": ["Stroke", "MS", "Myasthenia gravis"],
+        "physical_exam": ["Facial asymmetry", "Reflex changes"],
+        "social_history": ["Recent infection"]
+    },
+    "diagnoses": [
+        {
+            "name": "Stroke (CVA)",
+            "match": {"onset": "Sudden", "location": "One side of body", "associated_symptoms": ["Difficulty speaking", "Drooping face"]},
+            "differentiating_factors": "Sudden focal deficits (hemiparesis, aphasia). CT to rule out hemorrhage; tPA if ischemic and <4.5 hours. USMLE key: time is brain."
+        },
+        {
+            "name": "Myasthenia Gravis",
+            "match": {"onset": "Gradual", "location": "Both sides of body", "associated_symptoms": ["Trouble swallowing"]},
+            "differentiating_factors": "Fluctuating, fatigable weakness, worse with activity. Anti-AChR antibodies, edrophonium test. Pyridostigmine. USMLE key: ptosis, diplopia."
+        },
+        {
+            "name": "Guillain-Barré Syndrome",
+            "match": {"onset": "Gradual", "location": "Both sides of body", "associated_symptoms": "Numbness", "social_history": "Recent infection"},
+            "differentiating_factors": "Ascending paralysis, numbness, post-viral. LP: elevated protein, normal WBC. IVIG, plasmapheresis. USMLE key: areflexia."
+        },
+        {
+            "name": "Botulism",
+            "match": {"onset": "Gradual", "associated_symptoms": ["Trouble swallowing"], "social_history": "Recent infection"},
+            "differentiating_factors": "Descending paralysis, diplopia, dry mouth. Antitoxin, supportive care. USMLE key: canned food exposure."
+        }
+    ]
+}
@@ -0,0 +1,34 @@
+# er_presentations/wheezing.py
+# Questions and diagnoses for the "Wheezing" presentation, loaded on first access.
+
+PRESENTATION = {
+    "questions": {
+        "onset": ["Sudden", "Gradual"],
+        "associated_symptoms": ["Dyspnea", "Cough", "Fever", "Urticaria"],
+        "past_medical_history": ["Asthma", "COPD", "Allergies"],
+        "physical_exam": ["Accessory muscle use", "Stridor"],
+        "social_history": ["Allergen exposure", "Smoking"]
+    },
+    "diagnoses": [
+        {
+            "name": "Asthma Exacerbation",
+            "match": {"onset": "Sudden", "past_medical_history": "Asthma", "associated_symptoms": "Dyspnea"},
+            "differentiating_factors": "Sudden wheezing, dyspnea, reduced peak flow. Albuterol, corticosteroids. USMLE key: pulsus paradoxus in severe cases."
+        },
+        {
+            "name": "COPD Exacerbation",
+            "match": {"onset": "Gradual", "past_medical_history": "COPD", "social_history": "Smoking"},
+            "differentiating_factors": "Wheezing, increased sputum, chronic smoker. Bronchodilators, steroids, antibiotics if bacterial. USMLE key: barrel chest."
+        },
+        {
+            "name": "Anaphylaxis",
+            "match": {"onset": "Sudden", "associated_symptoms": "Urticaria", "social_history": "Allergen exposure"},
+            "differentiating_factors": "Wheezing, hives, hypotension post-allergen. IM epinephrine, antihistamines. USMLE key: biphasic reaction risk."
+        },
+        {
+            "name": "Foreign Body Aspiration",
+            "match": {"onset": "Sudden", "physical_exam": "Stridor"},
+            "differentiating_factors": "Sudden wheezing or stridor, unilateral findings. CXR, bronchoscopy for removal. USMLE key: children, sudden onset."
+        }
+    ]
+}
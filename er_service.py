@@ -0,0 +1,350 @@
+# er_service.py
+# This file serves run_diagnostic_tree over HTTP for programmatic callers (e.g. an EHR
+# integration), using only asyncio from the standard library.
+#
+# Start it with:
+#     python er_service.py [--host 127.0.0.1] [--port 8000] [--queue-size 1024]
+#
+# Endpoints:
+#   POST /diagnose          JSON {"presentation", "patient_data", "k"?, "threshold"?}
+#                           -> JSON list of results, 404 for an unknown presentation
+#   POST /diagnose/batch    NDJSON, one /diagnose request per line
+#                           -> NDJSON, one result line per request line, in input order
+#   GET  /differentiating_factors?presentation=...&diagnosis_id=...  -> JSON string
+#   GET  /presentations     -> JSON list of chief complaints
+#   GET  /health            -> JSON queue depth and coalescing counters
+#
+# Identical requests that are queued or being scored at the same time are coalesced into one
+# scoring job. Jobs wait in a bounded queue: a single request that finds it full gets 503 with
+# Retry-After, and a batch stops reading its body until there is room again, both in that
+# queue and among its own results waiting for the client to read them.
+
+import asyncio
+import json
+from urllib.parse import parse_qs, urlsplit
+
+import er_symptomsmore
+from er_index import DEFAULT_THRESHOLD
+
+MAX_BODY_BYTES = 1024 * 1024  # Largest single request, batch line or header block
+JOBS_PER_TURN = 64  # Jobs the worker scores before yielding to the event loop
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    411: "Length Required",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+
+
+class BadRequest(Exception):
+    """A request that cannot be scored; the message is returned to the caller."""
+
+
+def parse_request(payload):
+    """
+    Validates one decoded /diagnose request.
+    :return: (presentation, patient_data, k, threshold)
+    """
+    if not isinstance(payload, dict):
+        raise BadRequest("Request must be a JSON object")
+    presentation = payload.get("presentation")
+    patient_data = payload.get("patient_data", {})
+    k = payload.get("k")
+    threshold = payload.get("threshold", DEFAULT_THRESHOLD)
+    if not isinstance(presentation, str):
+        raise BadRequest("presentation must be a string")
+    if not isinstance(patient_data, dict):
+        raise BadRequest("patient_data must be an object")
+    if k is not None and (not isinstance(k, int) or isinstance(k, bool)):
+        raise BadRequest("k must be an integer")
+    if not isinstance(threshold, (int, float)) or isinstance(threshold, bool):
+        raise BadRequest("threshold must be a number")
+    # JSON arrays are multi-select findings; tuples keep them hashable for coalescing.
+    patient_data = {
+        key: tuple(value) if isinstance(value, list) else value for key, value in patient_data.items()
+    }
+    return presentation, patient_data, k, threshold
+
+
+class ScoringService:
+    """
+    Scoring queue shared by every connection: coalesces identical in-flight requests and
+    bounds the number of jobs waiting to be scored.
+    """
+
+    def __init__(self, queue_size=1024):
+        self.queue = asyncio.Queue(maxsize=queue_size)
+        self._in_flight = {}
+        self.coalesced = 0
+        self.scored = 0
+        self._worker = None
+
+    def start(self):
+        self._worker = asyncio.get_running_loop().create_task(self._work())
+
+    async def stop(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+
+    def _job(self, key, request):
+        future = self._in_flight.get(key) if key is not None else None
+        if future is not None:
+            self.coalesced += 1
+            return future, None
+        future = asyncio.get_running_loop().create_future()
+        if key is not None:
+            self._in_flight[key] = future
+        return future, (key, request, future)
+
+    def submit_nowait(self, request):
+        """
+        Returns a future for the result of a request, or None when the queue is full.
+        :param request: (presentation, patient_data, k, threshold)
+        """
+        key = er_symptomsmore.request_key(*request)
+        if (key is None or key not in self._in_flight) and self.queue.full():
+            return None
+        future, job = self._job(key, request)
+        if job is not None:
+            self.queue.put_nowait(job)
+        return future
+
+    async def submit(self, request):
+        """Like submit_nowait, but waits for room in the queue instead of failing."""
+        future, job = self._job(er_symptomsmore.request_key(*request), request)
+        if job is not None:
+            await self.queue.put(job)
+        return future
+
+    async def _work(self):
+        while True:
+            jobs = [await self.queue.get()]
+            while len(jobs) < JOBS_PER_TURN and not self.queue.empty():
+                jobs.append(self.queue.get_nowait())
+            for key, request, future in jobs:
+                try:
+                    result = er_symptomsmore.run_diagnostic_tree(*request)
+                except Exception as error:  # Surfaced to the caller, never kills the worker
+                    result = {"error": f"Scoring failed: {error}"}
+                self._in_flight.pop(key, None)
+                self.scored += 1
+                if not future.done():
+                    future.set_result(result)
+                self.queue.task_done()
+            await asyncio.sleep(0)
+
+    def health(self):
+        return {
+            "status": "ok",
+            "queued": self.queue.qsize(),
+            "queue_size": self.queue.maxsize,
+            "in_flight": len(self._in_flight),
+            "scored": self.scored,
+            "coalesced": self.coalesced,
+        }
+
+
+def _response(status, body, content_type="application/json", headers=()):
+    head = [f"HTTP/1.1 {status} {REASONS[status]}", f"Content-Type: {content_type}", f"Content-Length: {len(body)}"]
+    head.extend(headers)
+    return ("\r\n".join(head) + "\r\n\r\n").encode() + body
+
+
+def _json_response(status, value, headers=()):
+    return _response(status, json.dumps(value).encode(), headers=headers)
+
+
+async def _read_head(reader):
+    head = await reader.readuntil(b"\r\n\r\n")
+    request_line, *header_lines = head.decode("latin-1").split("\r\n")
+    method, target, version = request_line.split(" ", 2)
+    headers = {}
+    for line in header_lines:
+        if line:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+    return method, target, version, headers
+
+
+def _content_length(headers):
+    """Returns the request's Content-Length, 0 when it has none, or None when it is not a valid length."""
+    try:
+        length = int(headers.get("content-length", 0))
+    except ValueError:
+        return None
+    return length if length >= 0 else None
+
+
+async def _diagnose(service, reader, length):
+    if length > MAX_BODY_BYTES:
+        while length > 0:  # Discard the body so the connection stays usable
+            data = await reader.read(min(length, 64 * 1024))
+            if not data:
+                break
+            length -= len(data)
+        return _json_response(413, {"error": f"Body exceeds {MAX_BODY_BYTES} bytes"})
+    try:
+        request = parse_request(json.loads(await reader.readexactly(length)))
+    except (ValueError, BadRequest) as error:
+        return _json_response(400, {"error": str(error)})
+    future = service.submit_nowait(request)
+    if future is None:
+        return _json_response(503, {"error": "Scoring queue is full"}, headers=("Retry-After: 1",))
+    result = await future
+    if isinstance(result, dict):
+        return _json_response(404 if result["error"] == "Presentation not found" else 500, result)
+    return _json_response(200, result)
+
+
+async def _diagnose_batch(service, reader, writer, remaining):
+    """
+    Streams one NDJSON result line per body line, in input order, as chunked transfer encoding.
+    Results waiting to be written are bounded like the scoring queue, so the body is read no
+    faster than the client reads the response, coalesced duplicate lines included.
+    """
+    loop = asyncio.get_running_loop()
+    writer.write(
+        b"HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\nTransfer-Encoding: chunked\r\n\r\n"
+    )
+    pending = asyncio.Queue(maxsize=service.queue.maxsize)
+
+    async def write_results():
+        failure = None
+        while True:
+            future = await pending.get()
+            if future is None:
+                break
+            if failure is not None:
+                continue  # Keeps draining so the reader never blocks on a dead connection
+            line = json.dumps(await future).encode() + b"\n"
+            try:
+                writer.write(b"%x\r\n%s\r\n" % (len(line), line))
+                await writer.drain()
+            except ConnectionError as error:
+                failure = error
+        if failure is not None:
+            raise failure
+
+    async def submit(line):
+        try:
+            future = await service.submit(parse_request(json.loads(line)))
+        except (ValueError, BadRequest) as error:
+            future = loop.create_future()
+            future.set_result({"error": str(error)})
+        await pending.put(future)
+
+    writer_task = loop.create_task(write_results())
+    try:
+        # Read no further than Content-Length, so a pipelined request is left untouched.
+        buffer = b""
+        while remaining > 0:
+            data = await reader.read(min(remaining, 64 * 1024))
+            if not data:
+                break
+            remaining -= len(data)
+            *lines, buffer = (buffer + data).split(b"\n")
+            if len(buffer) > MAX_BODY_BYTES:
+                raise ValueError(f"Batch line exceeds {MAX_BODY_BYTES} bytes")
+            for line in lines:
+                if line.strip():
+                    await submit(line)
+        if buffer.strip():
+            await submit(buffer)  # The last line may lack its newline
+    finally:
+        await pending.put(None)
+        await writer_task
+    return b"0\r\n\r\n"
+
+
+async def _route(service, reader, writer, method, target, headers):
+    url = urlsplit(target)
+    if url.path in ("/diagnose", "/diagnose/batch"):
+        if method != "POST":
+            return _json_response(405, {"error": "Use POST"})
+        length = _content_length(headers)
+        if length is None:
+            headers["connection"] = "close"  # The body cannot be framed, so the connection is not reused
+            return _json_response(
+                400, {"error": "Content-Length must be a non-negative integer"}, headers=("Connection: close",)
+            )
+        if url.path == "/diagnose":
+            return await _diagnose(service, reader, length)
+        if "content-length" not in headers:
+            return _json_response(411, {"error": "Content-Length is required"})
+        return await _diagnose_batch(service, reader, writer, length)
+    if method != "GET":
+        return _json_response(405, {"error": "Use GET"})
+    if url.path == "/presentations":
+        return _json_response(200, list(er_symptomsmore.ER_PRESENTATIONS))
+    if url.path == "/differentiating_factors":
+        query = parse_qs(url.query)
+        try:
+            presentation = query["presentation"][0]
+            diagnosis_id = int(query["diagnosis_id"][0])
+        except (KeyError, ValueError):
+            return _json_response(400, {"error": "presentation and an integer diagnosis_id are required"})
+        text = er_symptomsmore.get_differentiating_factors(presentation, diagnosis_id)
+        if text is None:
+            return _json_response(404, {"error": "Diagnosis not found"})
+        return _json_response(200, text)
+    if url.path == "/health":
+        return _json_response(200, service.health())
+    return _json_response(404, {"error": "Not found"})
+
+
+async def handle_connection(service, reader, writer):
+    """Serves HTTP/1.1 requests on one connection until the client closes it."""
+    try:
+        while True:
+            try:
+                method, target, version, headers = await _read_head(reader)
+            except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ValueError):
+                break  # Closed, or not HTTP
+            response = await _route(service, reader, writer, method, target, headers)
+            writer.write(response)
+            await writer.drain()
+            if headers.get("connection", "").lower() == "close" or version == "HTTP/1.0":
+                break
+    except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+        pass  # The connection is dropped; a batch cut short ends without its final chunk
+    finally:
+        writer.close()
+
+
+async def serve(host="127.0.0.1", port=8000, queue_size=1024):
+    """Compiles the knowledge base and serves requests until cancelled."""
+    er_symptomsmore.get_global_index()  # Compile every presentation before the first request
+    service = ScoringService(queue_size)
+    service.start()
+    server = await asyncio.start_server(
+        lambda reader, writer: handle_connection(service, reader, writer), host, port, limit=MAX_BODY_BYTES
+    )
+    print(f"Serving {len(er_symptomsmore.ER_PRESENTATIONS)} presentations on http://{host}:{port}")
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await service.stop()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="HTTP scoring service for run_diagnostic_tree")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--queue-size", type=int, default=1024, help="scoring jobs allowed to wait")
+    arguments = parser.parse_args()
+    try:
+        asyncio.run(serve(arguments.host, arguments.port, arguments.queue_size))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,330 @@
+# er_snapshot.py
+# This file serializes the compiled form of a knowledge base (see er_index.py) into a compact,
+# versioned binary snapshot, and memory-maps it back so a worker can score patients without
+# executing the Python dict literals of every presentation at startup.
+#
+# Build or refresh a snapshot explicitly with:
+#     python er_snapshot.py [er_symptomsmore|er_symptoms]
+# load_snapshot() also rebuilds it automatically whenever its source files change.
+#
+# Layout (all integers little-endian u32 unless noted):
+#   header      magic "ERKB", version (u16), reserved (u16), stat signature, sha256 content hash (32 bytes),
+#               string table offset, presentation directory offset
+#   strings     count, count + 1 offsets into the blob, UTF-8 blob
+#   directory   count, then (name string id, record offset, matrix offset) per presentation
+#   record      length N, then N values:
+#                 features     n, then (key id, option id) per feature, in bit order
+#                 diagnoses    n, then per diagnosis: name id, differentiating factors id,
+#                              total criteria, mask word count, mask words, open criteria count, key ids
+#   matrix      the (features x diagnoses) float32 criteria matrix of each presentation, row-major,
+#               after all records; NumPy arrays of run_diagnostic_tree_batch are views of it
+#
+# Every process that opens a snapshot maps the same pages of the OS page cache. The criteria
+# matrices are used in place, so run_diagnostic_tree_batch shares them between workers. The
+# strings, texts and records are decoded into Python objects, private to each process, when
+# a presentation is compiled from them; score() runs on those.
+
+import mmap
+import os
+import struct
+import sys
+import zlib
+
+from er_index import CompiledPresentation, compile_presentations
+
+FORMAT_VERSION = 3
+MAGIC = b"ERKB"
+HEADER = struct.Struct("<4sHHI32sII")
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def _execute(name):
+    # Runs a source file afresh and returns its globals. Snapshots are built from these rather
+    # than from imported modules, whose dicts may have been edited in place since the import
+    # and no longer match the files the content hash is taken over.
+    path = os.path.join(BASE_DIR, name)
+    module = name[:-len(".py")].replace("/", ".").removesuffix(".__init__")
+    namespace = {"__name__": module, "__file__": path}
+    with open(path, encoding="utf-8") as source:
+        exec(compile(source.read(), path, "exec"), namespace)
+    return namespace
+
+
+def _expanded_presentations():
+    shards = _execute("er_presentations/__init__.py")["SHARDS"]
+    return {name: _execute(f"er_presentations/{module}.py")["PRESENTATION"] for name, module in shards.items()}
+
+
+def _original_presentations():
+    return _execute("er_symptoms.py")["ER_PRESENTATIONS"]
+
+
+# Knowledge base -> (files it is derived from, loader executing them into a dict of presentations).
+# Directories stand for the .py files inside them.
+KNOWLEDGE_BASES = {
+    "er_symptomsmore": (("er_symptomsmore.py", "er_presentations"), _expanded_presentations),
+    "er_symptoms": (("er_symptoms.py",), _original_presentations),
+}
+# The model, the compiler and this file define what a snapshot contains, so they are hashed too.
+FORMAT_SOURCES = ("er_model.py", "er_index.py", "er_snapshot.py")
+SIGNATURE_OFFSET = 8  # Byte offset of the stat signature within HEADER
+
+
+def snapshot_path(knowledge_base):
+    """Returns where the snapshot of a knowledge base is kept, next to the bytecode cache."""
+    return os.path.join(BASE_DIR, "__pycache__", f"{knowledge_base}.kb")
+
+
+def source_files(knowledge_base):
+    """
+    Lists the source files a knowledge base snapshot is derived from, in a stable order,
+    as (name relative to BASE_DIR, path) pairs.
+    """
+    files = []
+    for name in KNOWLEDGE_BASES[knowledge_base][0] + FORMAT_SOURCES:
+        path = os.path.join(BASE_DIR, name)
+        if os.path.isdir(path):
+            files.extend(
+                (f"{name}/{entry}", os.path.join(path, entry))
+                for entry in sorted(os.listdir(path)) if entry.endswith(".py")
+            )
+        else:
+            files.append((name, path))
+    return files
+
+
+def stat_signature(files):
+    """Cheap fingerprint of file names, sizes and mtimes, checked before the content hash."""
+    parts = []
+    for name, path in files:
+        stat = os.stat(path)
+        parts.append(f"{name}:{stat.st_size}:{stat.st_mtime_ns}")
+    return zlib.crc32("\n".join(parts).encode())
+
+
+def content_hash(files):
+    """SHA-256 over the names and contents of the source files."""
+    import hashlib
+
+    digest = hashlib.sha256()
+    for name, path in files:
+        digest.update(name.encode() + b"\0")
+        with open(path, "rb") as source:
+            digest.update(source.read())
+        digest.update(b"\0")
+    return digest.digest()
+
+
+def build_snapshot(compiled_presentations, path, signature=0, digest=bytes(32)):
+    """
+    Writes compiled presentations to a snapshot file, replacing any existing one atomically.
+    :param compiled_presentations: dict of presentation name -> CompiledPresentation
+    :param signature: int, stat signature of the source files
+    :param digest: bytes, SHA-256 content hash of the source files
+    """
+    string_ids = {}
+
+    def intern(text):
+        string_id = string_ids.get(text)
+        if string_id is None:
+            string_id = string_ids[text] = len(string_ids)
+        return string_id
+
+    records = []
+    for name, compiled in compiled_presentations.items():
+        values = [len(compiled.feature_ids)]
+        for key, option in compiled.feature_ids:
+            values += [intern(key), intern(option)]
+        values.append(len(compiled.masks))
+        for index, mask in enumerate(compiled.masks):
+            word_count = (mask.bit_length() + 31) // 32
+            words = struct.unpack(f"<{word_count}I", mask.to_bytes(4 * word_count, "little"))
+            values += [intern(compiled.names[index]), intern(compiled.texts[index])]
+            values += [len(compiled.scores[index]) - 1, len(words), *words]
+            values += [len(compiled.open_criteria[index]), *(intern(key) for key in compiled.open_criteria[index])]
+        matrix = [
+            float(diagnosis_mask >> feature & 1)
+            for feature in range(len(compiled.feature_ids)) for diagnosis_mask in compiled.masks
+        ]
+        records.append((
+            intern(name), struct.pack(f"<{len(values) + 1}I", len(values), *values),
+            struct.pack(f"<{len(matrix)}f", *matrix),
+        ))
+
+    blob = b"".join(text.encode() for text in string_ids)
+    offsets = [0]
+    for text in string_ids:
+        offsets.append(offsets[-1] + len(text.encode()))
+    strings = struct.pack(f"<{len(offsets) + 1}I", len(string_ids), *offsets) + blob
+    strings += b"\0" * (-len(strings) % 4)
+
+    strings_offset = HEADER.size
+    directory_offset = strings_offset + len(strings)
+    record_offset = directory_offset + 4 + 12 * len(records)
+    matrix_offset = record_offset + sum(len(record) for _, record, _ in records)
+    directory = [len(records)]
+    for name_id, record, matrix in records:
+        directory += [name_id, record_offset, matrix_offset]
+        record_offset += len(record)
+        matrix_offset += len(matrix)
+
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, 0, signature, digest, strings_offset, directory_offset)
+    temporary = f"{path}.{os.getpid()}.tmp"
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(temporary, "wb") as snapshot:
+        snapshot.write(header)
+        snapshot.write(strings)
+        snapshot.write(struct.pack(f"<{len(directory)}I", *directory))
+        for _, record, _ in records:
+            snapshot.write(record)
+        for _, _, matrix in records:
+            snapshot.write(matrix)
+    os.replace(temporary, path)
+
+
+class Snapshot:
+    """
+    Memory-mapped snapshot. Strings are decoded and interned on first use, and each
+    presentation is rebuilt into a CompiledPresentation only when it is asked for.
+    Criteria matrices are never copied out of the map, so close() fails while one of them
+    is still referenced.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as snapshot:
+            self._map = mmap.mmap(snapshot.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, self.signature, self.digest, strings_offset, directory_offset = HEADER.unpack_from(self._map)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            self._map.close()
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} knowledge base snapshot")
+
+        (count,) = struct.unpack_from("<I", self._map, strings_offset)
+        self._string_offsets = struct.unpack_from(f"<{count + 1}I", self._map, strings_offset + 4)
+        self._blob_offset = strings_offset + 4 * (count + 2)
+        self._strings = [None] * count
+
+        (count,) = struct.unpack_from("<I", self._map, directory_offset)
+        directory = struct.unpack_from(f"<{3 * count}I", self._map, directory_offset + 4)
+        self._records = {
+            self.string(directory[i]): (directory[i + 1], directory[i + 2]) for i in range(0, len(directory), 3)
+        }
+
+    def string(self, string_id):
+        text = self._strings[string_id]
+        if text is None:
+            start = self._blob_offset + self._string_offsets[string_id]
+            end = self._blob_offset + self._string_offsets[string_id + 1]
+            text = self._strings[string_id] = sys.intern(self._map[start:end].decode())
+        return text
+
+    def names(self):
+        return list(self._records)
+
+    def __contains__(self, name):
+        return name in self._records
+
+    def compiled(self, name):
+        """Returns the CompiledPresentation stored for a presentation."""
+        offset, matrix_offset = self._records[name]
+        (length,) = struct.unpack_from("<I", self._map, offset)
+        values = struct.unpack_from(f"<{length}I", self._map, offset + 4)
+        string = self.string
+        position = 0
+
+        def take(count=1):
+            nonlocal position
+            position += count
+            return values[position - count:position]
+
+        (feature_count,) = take()
+        features = take(2 * feature_count)
+        feature_ids = {
+            (string(features[i]), string(features[i + 1])): 1 << (i // 2)
+            for i in range(0, len(features), 2)
+        }
+
+        names = []
+        text_ids = []
+        totals = []
+        masks = []
+        open_criteria = []
+        (diagnosis_count,) = take()
+        for _ in range(diagnosis_count):
+            name_id, factors_id, total_criteria, word_count = take(4)
+            words = take(word_count)
+            names.append(string(name_id))
+            text_ids.append(factors_id)
+            totals.append(total_criteria)
+            masks.append(int.from_bytes(struct.pack(f"<{word_count}I", *words), "little"))
+            (open_count,) = take()
+            open_criteria.append(tuple(string(key_id) for key_id in take(open_count)))
+
+        shape = (feature_count, diagnosis_count)
+        return CompiledPresentation.from_arrays(
+            feature_ids, names, _SnapshotTexts(self, text_ids), masks, totals, open_criteria,
+            criteria_matrix=lambda: self.criteria_matrix(matrix_offset, shape),
+        )
+
+    def criteria_matrix(self, offset, shape):
+        """Returns a read-only NumPy view of a criteria matrix stored in the map. Requires NumPy."""
+        import numpy as np
+
+        return np.frombuffer(self._map, dtype="<f4", count=shape[0] * shape[1], offset=offset).reshape(shape)
+
+    def close(self):
+        self._map.close()
+
+
+class _SnapshotTexts:
+    """Differentiating factors of one snapshot presentation, decoded from the map on first read."""
+
+    def __init__(self, snapshot, text_ids):
+        self._snapshot = snapshot
+        self._text_ids = text_ids
+
+    def __len__(self):
+        return len(self._text_ids)
+
+    def __getitem__(self, index):
+        return self._snapshot.string(self._text_ids[index])
+
+
+def load_snapshot(knowledge_base="er_symptomsmore", path=None):
+    """
+    Opens the snapshot of a knowledge base, building it first if it is missing, written by
+    another format version, or out of date with its source files.
+    The stat signature is checked first; the content hash is only computed when it differs,
+    so touching a file without changing it only refreshes the stored signature.
+    """
+    path = path or snapshot_path(knowledge_base)
+    sources = source_files(knowledge_base)
+    signature = stat_signature(sources)
+    snapshot = None
+    try:
+        snapshot = Snapshot(path)
+    except (OSError, ValueError, struct.error):
+        pass
+    if snapshot is not None:
+        if snapshot.signature == signature:
+            return snapshot
+        digest = content_hash(sources)
+        snapshot.close()
+        if snapshot.digest == digest:
+            with open(path, "r+b") as stale:
+                stale.seek(SIGNATURE_OFFSET)
+                stale.write(struct.pack("<I", signature))
+            return Snapshot(path)
+    else:
+        digest = content_hash(sources)
+
+    presentations = KNOWLEDGE_BASES[knowledge_base][1]()
+    build_snapshot(compile_presentations(presentations), path, signature, digest)
+    return Snapshot(path)
+
+
+if __name__ == "__main__":
+    for knowledge_base in sys.argv[1:] or ["er_symptomsmore"]:
+        snapshot = load_snapshot(knowledge_base)
+        print(f"{snapshot_path(knowledge_base)}: {len(snapshot.names())} presentations, sha256 {snapshot.digest.hex()}")
+        snapshot.close()
@@ -2,9 +2,17 @@
 # This is a Streamlit application for a progressive, ER-focused diagnostic tool.
 
 import streamlit as st
-from er_symptomsmore import ER_PRESENTATIONS
+from er_engine import get_knowledge_base, get_next_question, match_diagnosis
+from er_index import IncrementalScorer
 # The er_treatments.py file is no longer needed since treatments are not displayed.
 
+QUESTION_MODES = {
+    "standard": "Ask every question",
+    "adaptive": "Adaptive: most informative question first, stop once the diagnosis is decided",
+    "early_stop": "Early termination: stop once the top-scoring diagnosis can no longer be overtaken",
+    "rapid": "Rapid entry: every question in one form, scored when it is submitted",
+}
+
 def initialize_session_state():
     """Initializes session state variables if they don't exist."""
     if "step" not in st.session_state:
@@ -15,6 +23,10 @@ def initialize_session_state():
         st.session_state.answers = {}
     if "diagnosis" not in st.session_state:
         st.session_state.diagnosis = None
+    if "scorer" not in st.session_state:
+        st.session_state.scorer = None
+    if "question_mode" not in st.session_state:
+        st.session_state.question_mode = "standard"
 
 def reset_app():
     """Resets the application to the initial state."""
@@ -22,38 +34,150 @@ def reset_app():
     st.session_state.chief_complaint = None
     st.session_state.answers = {}
     st.session_state.diagnosis = None
+    st.session_state.scorer = None
+
+# The callbacks below run before the script does, so each click renders its new state in a
+# single script run instead of setting it mid-run and calling st.rerun().
+
+def finish_if_answered():
+    """Moves on to the results once get_next_question has nothing left to ask."""
+    presentation = st.session_state.chief_complaint
+    question_key, _ = get_next_question(
+        presentation,
+        st.session_state.answers,
+        mode=st.session_state.question_mode,
+        scorer=st.session_state.scorer,
+    )
+    if question_key is None:
+        st.session_state.diagnosis = match_diagnosis(
+            presentation,
+            st.session_state.answers,
+            mode=st.session_state.question_mode,
+            scorer=st.session_state.scorer,
+        )
+        st.session_state.step = "results"
+
+def select_complaint(complaint):
+    """Starts the questions for a chief complaint."""
+    st.session_state.chief_complaint = complaint
+    st.session_state.scorer = IncrementalScorer(get_knowledge_base().compiled[complaint])
+    st.session_state.step = "questions"
+    if st.session_state.question_mode != "rapid":  # Rapid entry asks everything at once
+        finish_if_answered()
+
+def answer_question(question_key, answer):
+    """Records the answer to a question."""
+    st.session_state.answers[question_key] = answer
+    st.session_state.scorer.answer(question_key, answer)
+    finish_if_answered()
+
+def confirm_selection(question_key, options):
+    """Records the options chosen in a multi-select question, as a tuple in option order."""
+    selected = st.session_state[f"{question_key}_select"]
+    answer_question(question_key, tuple(option for option in options if option in selected))
 
-def get_next_question(presentation, answers):
+def submit_rapid_entry(presentation):
     """
-    Determines the next question to ask based on the current answers.
-    Returns the question key and a list of options.
+    Records every finding entered in the rapid-entry form and scores them all at once.
+    Questions left blank stay unanswered. The diagnosis is the one match_diagnosis gives
+    for them, as in standard mode; the closest partial matches from the scorer are listed
+    with the results.
     """
-    for question_key in ER_PRESENTATIONS[presentation]["questions"]:
-        if question_key not in answers:
-            return question_key, ER_PRESENTATIONS[presentation]["questions"][question_key]
-    return None, None
+    for question in presentation.questions:
+        value = st.session_state[f"rapid_{question.key}"]
+        if question.multi:
+            if not value:
+                continue
+            value = tuple(option for option in question.options if option in value)
+        elif value is None:
+            continue
+        st.session_state.answers[question.key] = value
+        st.session_state.scorer.answer(question.key, value)
+    st.session_state.diagnosis = match_diagnosis(presentation.name, st.session_state.answers)
+    st.session_state.step = "results"
 
-def match_diagnosis(presentation, answers):
+def question_text(question_key):
+    """Returns how a question is asked."""
+    # Special case for "type" as it can be ambiguous
+    if question_key == "type":
+        return "What is the type of the symptom?"
+    # Special case for "associated_symptoms"
+    if question_key == "associated_symptoms":
+        return "What are the associated symptoms?"
+    return f"What is the {question_key}?"
+
+@st.fragment
+def question_panel(knowledge_base):
     """
-    Matches the user's answers to a possible diagnosis based on the ER_PRESENTATIONS data.
+    Renders the current question, its answer widgets and the live differential.
+    As a fragment, answering a question reruns only this panel; the page title and headers
+    around it are left as they are. Once a callback has moved on to the results, the panel
+    reruns the whole page instead.
     """
-    diagnoses = ER_PRESENTATIONS[presentation]["diagnoses"]
-    for diagnosis in diagnoses:
-        match_criteria = diagnosis["match"]
-        is_match = True
-        for key, value in match_criteria.items():
-            user_answer = answers.get(key)
-            if isinstance(value, list):
-                if user_answer not in value:
-                    is_match = False
-                    break
+    if st.session_state.step != "questions":
+        st.rerun()
+    presentation = st.session_state.chief_complaint
+    question_key, options = get_next_question(
+        presentation,
+        st.session_state.answers,
+        mode=st.session_state.question_mode,
+        scorer=st.session_state.scorer,
+    )
+    
+    if question_key:
+        # Dynamically display the question based on the key
+        st.markdown(f"**Question:** {question_text(question_key)}")
+        
+        question = knowledge_base.presentations[presentation].question(question_key)
+        if question is not None and question.multi:
+            selected = st.multiselect("Select all that apply", options, key=f"{question_key}_select")
+            st.button(
+                "Confirm",
+                key=f"{question_key}_confirm",
+                disabled=not selected,
+                on_click=confirm_selection,
+                args=(question_key, options),
+            )
+        else:
+            # Create buttons for each option
+            cols = st.columns(len(options))
+            for i, option in enumerate(options):
+                with cols[i]:
+                    st.button(
+                        option, key=f"{question_key}_{option}", on_click=answer_question, args=(question_key, option)
+                    )
+
+        # Live differential from the incremental scorer, updated after every answer
+        candidates = st.session_state.scorer.ranked(k=3)
+        if candidates:
+            diagnoses = knowledge_base.presentations[presentation].diagnoses
+            st.markdown("**Leading candidates so far:**")
+            for index, match_score in candidates:
+                st.markdown(f"- {diagnoses[index].name} ({match_score:.0%} of criteria)")
+    else:
+        # The callbacks normally get here first; the results replace the whole page
+        finish_if_answered()
+        st.rerun()
+
+def rapid_entry_form(knowledge_base):
+    """
+    Renders every question of the chief complaint in one form. Nothing reruns while it is
+    filled in, and submitting it goes straight to the results in a single script run.
+    """
+    presentation = knowledge_base.presentations[st.session_state.chief_complaint]
+    with st.form("rapid_entry"):
+        for question in presentation.questions:
+            if question.multi:
+                st.multiselect(question_text(question.key), question.options, key=f"rapid_{question.key}")
             else:
-                if user_answer != value:
-                    is_match = False
-                    break
-        if is_match:
-            return diagnosis
-    return None
+                st.selectbox(
+                    question_text(question.key),
+                    question.options,
+                    index=None,
+                    placeholder="Not assessed",
+                    key=f"rapid_{question.key}",
+                )
+        st.form_submit_button("Score findings", key="rapid_submit", on_click=submit_rapid_entry, args=(presentation,))
 
 def main():
     initialize_session_state()
@@ -63,69 +187,61 @@ def main():
         page_icon="🏥",
         layout="centered",
     )
+    knowledge_base = get_knowledge_base()
 
     st.title("🏥 ER Diagnostic Tree")
     st.markdown("A progressive tool to practice differential diagnosis for common ER presentations.")
     
     if st.session_state.step == "start":
         st.subheader("Select a Chief Complaint")
-        complaints = list(ER_PRESENTATIONS.keys())
+        st.session_state.question_mode = st.radio(
+            "Question flow",
+            list(QUESTION_MODES),
+            index=list(QUESTION_MODES).index(st.session_state.question_mode),
+            format_func=QUESTION_MODES.get,
+        )
+        complaints = knowledge_base.complaints
         
         # Split the complaints into two columns for better display
         cols = st.columns(2)
         for i, complaint in enumerate(complaints):
             with cols[i % 2]:
-                if st.button(complaint, use_container_width=True, key=f"btn_{i}"):
-                    st.session_state.chief_complaint = complaint
-                    st.session_state.step = "questions"
-                    st.rerun()
-
-    elif st.session_state.step == "questions":
-        presentation = st.session_state.chief_complaint
-        st.subheader(f"Chief Complaint: {presentation}")
-        
-        question_key, options = get_next_question(presentation, st.session_state.answers)
-        
-        if question_key:
-            # Dynamically display the question based on the key
-            question_text = f"**Question:** What is the {question_key}?"
-            # Special case for "type" as it can be ambiguous
-            if question_key == "type":
-                 question_text = "**Question:** What is the type of the symptom?"
-            # Special case for "associated_symptoms"
-            elif question_key == "associated_symptoms":
-                question_text = "**Question:** What are the associated symptoms?"
-            
-            st.markdown(question_text)
-            
-            # Create buttons for each option
-            cols = st.columns(len(options))
-            for i, option in enumerate(options):
-                with cols[i]:
-                    if st.button(option, key=f"{question_key}_{option}"):
-                        st.session_state.answers[question_key] = option
-                        st.rerun()
+                st.button(
+                    complaint, use_container_width=True, key=f"btn_{i}", on_click=select_complaint, args=(complaint,)
+                )
+
+    if st.session_state.step == "questions":
+        st.subheader(f"Chief Complaint: {st.session_state.chief_complaint}")
+        if st.session_state.question_mode == "rapid":
+            rapid_entry_form(knowledge_base)
         else:
-            # All questions have been answered, now find the diagnosis
-            st.session_state.diagnosis = match_diagnosis(presentation, st.session_state.answers)
-            st.session_state.step = "results"
-            st.rerun()
+            question_panel(knowledge_base)
 
-    elif st.session_state.step == "results":
+    if st.session_state.step == "results":
         st.subheader("Your Analysis")
         st.markdown(f"**Chief Complaint:** {st.session_state.chief_complaint}")
         st.markdown("**Your Findings:**")
         for key, value in st.session_state.answers.items():
+            if isinstance(value, tuple):
+                value = ", ".join(value)
             st.markdown(f"- {key.capitalize()}: {value}")
         
         st.markdown("---")
         
         diagnosis = st.session_state.diagnosis
         if diagnosis:
-            st.success(f"**Most Probable Diagnosis:** {diagnosis['name']}")
-            st.info(f"**Differentiating Factors:** {diagnosis['differentiating_factors']}")
+            st.success(f"**Most Probable Diagnosis:** {diagnosis.name}")
+            st.info(f"**Differentiating Factors:** {diagnosis.differentiating_factors}")
         else:
             st.warning("Could not match a specific diagnosis with these findings.")
+        if st.session_state.question_mode == "rapid":
+            # Partial matches from the incremental scorer, apart from the diagnosis above
+            candidates = st.session_state.scorer.ranked(k=3)
+            if candidates:
+                diagnoses = knowledge_base.presentations[st.session_state.chief_complaint].diagnoses
+                st.markdown("**Closest matches by criteria met:**")
+                for index, match_score in candidates:
+                    st.markdown(f"- {diagnoses[index].name} ({match_score:.0%} of criteria)")
         
         st.markdown("---")
         st.button("Start Over", on_click=reset_app)
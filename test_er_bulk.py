@@ -0,0 +1,88 @@
+# test_er_bulk.py
+# This file runs er_bulk.py over small JSONL and CSV files, in this process and across a
+# process pool, scoring records one at a time and, with --batch, per presentation, and checks
+# that each output line is what calling er_symptomsmore.run_diagnostic_tree directly on the
+# record returns, with malformed records and unknown presentations reported by record number.
+#
+# Run with `python -m pytest`.
+
+import csv
+import io
+import json
+import random
+
+import pytest
+
+import er_bulk
+import er_symptomsmore
+from er_bench import synthetic_patients
+from er_index import DEFAULT_THRESHOLD
+
+RECORDS = 120
+
+
+def bulk_records(count, seed=0):
+    # (id, presentation, patient data) over every presentation, multi-select findings as tuples
+    rng = random.Random(seed)
+    names = list(er_symptomsmore.ER_PRESENTATIONS)
+    records = []
+    for index in range(count):
+        name = rng.choice(names)
+        patient_data = synthetic_patients(er_symptomsmore.ER_PRESENTATIONS[name], 1, seed=index)[0]
+        records.append((f"r{index}", name, patient_data))
+    return records
+
+
+def expected_output(record_id, name, patient_data, k=None, threshold=DEFAULT_THRESHOLD):
+    results = er_symptomsmore.run_diagnostic_tree(name, patient_data, k, threshold)
+    return json.loads(json.dumps({"id": record_id, "presentation": name, "results": results}))
+
+
+def run_bulk(tmp_path, lines, suffix, *arguments):
+    source = tmp_path / f"input{suffix}"
+    source.write_text("".join(lines), encoding="utf-8")
+    target = tmp_path / "output.jsonl"
+    er_bulk.main([str(source), "-o", str(target), *arguments])
+    return [json.loads(line) for line in target.read_text(encoding="utf-8").splitlines()]
+
+
+@pytest.mark.parametrize("batch", [[], ["--batch"]])
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_jsonl_matches_run_diagnostic_tree(tmp_path, jobs, batch):
+    records = bulk_records(RECORDS)
+    lines = [
+        json.dumps({"id": record_id, "presentation": name, "patient_data": patient_data}) + "\n"
+        for record_id, name, patient_data in records
+    ]
+    lines[10] = "not json\n"
+    lines[20] = json.dumps({"presentation": "Chest Pain", "patient_data": []}) + "\n"
+    lines[30] = json.dumps({"presentation": "Not a complaint", "patient_data": {}}) + "\n"
+    outputs = run_bulk(
+        tmp_path, lines, ".jsonl", "--jobs", jobs, "--chunk-size", "40", "-k", "2", "--threshold", "0.34", *batch
+    )
+    assert len(outputs) == len(records)
+    for index, (record, output) in enumerate(zip(records, outputs)):
+        if index in (10, 20, 30):
+            assert set(output) == {"record", "error"} and output["record"] == index + 1
+        else:
+            assert output == expected_output(*record, k=2, threshold=0.34), record
+
+
+@pytest.mark.parametrize("batch", [[], ["--batch"]])
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_csv_with_presentation_matches_run_diagnostic_tree(tmp_path, jobs, batch):
+    name = "Chest Pain"
+    patients = synthetic_patients(er_symptomsmore.ER_PRESENTATIONS[name], RECORDS, seed=5)
+    keys = list(er_symptomsmore.ER_PRESENTATIONS[name]["questions"])
+    text = io.StringIO()
+    writer = csv.writer(text)
+    writer.writerow(["id", *keys])
+    for index, patient_data in enumerate(patients):
+        values = (patient_data.get(key, "") for key in keys)
+        writer.writerow(
+            [index, *(er_bulk.MULTI_SEPARATOR.join(value) if isinstance(value, tuple) else value for value in values)]
+        )
+    lines = [text.getvalue()]
+    outputs = run_bulk(tmp_path, lines, ".csv", "--jobs", jobs, "--chunk-size", "50", "--presentation", name, *batch)
+    assert outputs == [expected_output(str(index), name, patient_data) for index, patient_data in enumerate(patients)]
+
@@ -0,0 +1,72 @@
+# test_er_engine.py
+# This file plays whole question sessions through er_engine.py on both knowledge bases and
+# checks that the modes which stop early end on the diagnosis the full set of answers gives:
+# "adaptive" against standard first-match on every answer, and "early_stop", with and without
+# an IncrementalScorer, against the top run_diagnostic_tree result on every answer.
+#
+# Run with `python -m pytest`.
+
+import pytest
+
+from er_bench import synthetic_patients
+from er_engine import get_next_question, match_diagnosis
+from er_index import IncrementalScorer, KnowledgeBase
+from er_symptoms import ER_PRESENTATIONS as ORIGINAL_PRESENTATIONS
+from er_symptomsmore import ER_PRESENTATIONS as EXPANDED_PRESENTATIONS
+
+PATIENTS_PER_PRESENTATION = 50
+
+KNOWLEDGE_BASES = {
+    "er_symptoms": KnowledgeBase(ORIGINAL_PRESENTATIONS),
+    "er_symptomsmore": KnowledgeBase(EXPANDED_PRESENTATIONS),
+}
+
+PRESENTATIONS = [
+    pytest.param(label, name, id=f"{label}:{name}")
+    for label, presentations in (("er_symptoms", ORIGINAL_PRESENTATIONS), ("er_symptomsmore", EXPANDED_PRESENTATIONS))
+    for name in presentations
+]
+
+
+def complete_patients(knowledge_base, name):
+    # Every question answered, some multi-select ones with several options
+    presentation = knowledge_base.presentations[name]
+    presentation_data = {"questions": {question.key: list(question.options) for question in presentation.questions}}
+    return synthetic_patients(presentation_data, PATIENTS_PER_PRESENTATION, seed=4, answer_rate=1.0)
+
+
+def play_session(knowledge_base, name, patient_data, mode, scorer=None):
+    # Answers each question get_next_question asks from patient_data until it stops.
+    answers = {}
+    while True:
+        question_key, _ = get_next_question(name, answers, mode, scorer, knowledge_base=knowledge_base)
+        if question_key is None:
+            return answers
+        assert question_key not in answers, question_key
+        answers[question_key] = patient_data.get(question_key)
+        if scorer is not None:
+            scorer.answer(question_key, answers[question_key])
+
+
+@pytest.mark.parametrize("label, name", PRESENTATIONS)
+def test_adaptive_session_matches_full_answers(label, name):
+    knowledge_base = KNOWLEDGE_BASES[label]
+    for patient_data in complete_patients(knowledge_base, name):
+        answers = play_session(knowledge_base, name, patient_data, "adaptive")
+        expected = match_diagnosis(name, patient_data, knowledge_base=knowledge_base)
+        assert match_diagnosis(name, answers, "adaptive", knowledge_base=knowledge_base) is expected, patient_data
+
+
+@pytest.mark.parametrize("label, name", PRESENTATIONS)
+def test_early_stop_session_matches_full_answers(label, name):
+    knowledge_base = KNOWLEDGE_BASES[label]
+    compiled = knowledge_base.compiled[name]
+    diagnoses = knowledge_base.presentations[name].diagnoses
+    for patient_data in complete_patients(knowledge_base, name):
+        top = compiled.score(patient_data, k=1)
+        expected = diagnoses[top[0][0]] if top else None
+        answers = play_session(knowledge_base, name, patient_data, "early_stop")
+        assert match_diagnosis(name, answers, "early_stop", knowledge_base=knowledge_base) is expected, patient_data
+        scorer = IncrementalScorer(compiled)
+        answers = play_session(knowledge_base, name, patient_data, "early_stop", scorer)
+        assert match_diagnosis(name, answers, "early_stop", scorer, knowledge_base=knowledge_base) is expected, patient_data
@@ -0,0 +1,191 @@
+# test_er_index.py
+# This file checks the compiled forms of er_index.py against a direct reading of every
+# presentation in both knowledge bases (er_symptoms.py and er_symptomsmore.py): each normalized
+# Criterion against the criterion as written, score() against counting matching criteria,
+# score_batch() and run_diagnostic_tree_batch() against scoring one record at a time,
+# score_all_presentations() against merging run_diagnostic_tree() over every presentation,
+# MatchTable.lookup() against the first diagnosis whose criteria all match, and KnowledgeBase
+# building each presentation only when it is looked up.
+#
+# Run with `python -m pytest`.
+
+import gc
+import json
+import random
+import weakref
+
+import pytest
+
+from er_index import DEFAULT_THRESHOLD, CompiledPresentation, KnowledgeBase, MatchTable
+from er_model import MULTI_VALUE_TYPES, Presentation
+from er_symptoms import ER_PRESENTATIONS as ORIGINAL_PRESENTATIONS
+from er_symptomsmore import ER_PRESENTATIONS as EXPANDED_PRESENTATIONS
+from er_symptomsmore import run_diagnostic_tree, run_diagnostic_tree_batch, score_all_presentations
+
+PATIENTS_PER_PRESENTATION = 200
+
+PRESENTATIONS = [
+    pytest.param(presentations, name, id=f"{label}:{name}")
+    for label, presentations in (("er_symptoms", ORIGINAL_PRESENTATIONS), ("er_symptomsmore", EXPANDED_PRESENTATIONS))
+    for name in presentations
+]
+
+
+def reference_accepts(criterion, value):
+    # match_diagnosis as first written in main.py: equality for a string, membership for a list,
+    # extended to multi-select answers as "any selected option"
+    if isinstance(value, MULTI_VALUE_TYPES):
+        return any(reference_accepts(criterion, option) for option in value)
+    if isinstance(criterion, list):
+        return value in criterion
+    return value == criterion
+
+
+def random_patients(presentation_data, count, seed=0):
+    # Answers drawn from the options, the criterion values and truncations of both,
+    # with some questions left unanswered and some answered with several options.
+    rng = random.Random(seed)
+    values = {key: list(options) for key, options in presentation_data["questions"].items()}
+    for diagnosis in presentation_data["diagnoses"]:
+        for key, criterion in diagnosis["match"].items():
+            values.setdefault(key, []).extend([criterion] if isinstance(criterion, str) else criterion)
+    for _ in range(count):
+        patient_data = {}
+        for key, pool in values.items():
+            roll = rng.random()
+            if roll < 0.2 or not pool:
+                continue
+            value = rng.choice(pool)
+            if roll > 0.9:
+                value = value[:rng.randint(0, len(value))]
+            elif roll > 0.7:
+                value = rng.choice((frozenset, list))(rng.sample(pool, min(len(pool), rng.randint(1, 5))))
+            patient_data[key] = value
+        yield patient_data
+
+
+def reference_hits(diagnosis, patient_data):
+    return sum(
+        1 for key, criterion in diagnosis["match"].items()
+        if key in patient_data and reference_accepts(criterion, patient_data[key])
+    )
+
+
+@pytest.mark.parametrize("presentations, name", PRESENTATIONS)
+def test_criteria_match_reference(presentations, name):
+    presentation_data = presentations[name]
+    presentation = Presentation.from_dict(name, presentation_data)
+    for patient_data in random_patients(presentation_data, PATIENTS_PER_PRESENTATION):
+        for diagnosis, model in zip(presentation_data["diagnoses"], presentation.diagnoses):
+            for key, criterion in diagnosis["match"].items():
+                value = patient_data.get(key)
+                assert model.criterion(key).accepts(value) == reference_accepts(criterion, value), (
+                    diagnosis["name"], key, value
+                )
+
+
+@pytest.mark.parametrize("presentations, name", PRESENTATIONS)
+def test_score_matches_reference(presentations, name):
+    presentation_data = presentations[name]
+    compiled = CompiledPresentation(Presentation.from_dict(name, presentation_data))
+    for patient_data in random_patients(presentation_data, PATIENTS_PER_PRESENTATION):
+        expected = []
+        for index, diagnosis in enumerate(presentation_data["diagnoses"]):
+            match_score = reference_hits(diagnosis, patient_data) / len(diagnosis["match"])
+            if match_score >= DEFAULT_THRESHOLD:
+                expected.append((index, match_score))
+        expected.sort(key=lambda match: match[1], reverse=True)
+        assert compiled.score(patient_data) == expected, patient_data
+
+
+@pytest.mark.parametrize("presentations, name", PRESENTATIONS)
+def test_score_batch_matches_score(presentations, name):
+    pytest.importorskip("numpy")
+    presentation_data = presentations[name]
+    compiled = CompiledPresentation(Presentation.from_dict(name, presentation_data))
+    patients = list(random_patients(presentation_data, PATIENTS_PER_PRESENTATION, seed=1))
+    for threshold in (0.0, DEFAULT_THRESHOLD, 1.0):
+        for k in (None, 1):
+            expected = [compiled.score(patient_data, k, threshold) for patient_data in patients]
+            # 200 patients in chunks of 64 leave a partial last chunk
+            assert compiled.score_batch(patients, chunk_size=64, k=k, threshold=threshold) == expected, (threshold, k)
+
+
+@pytest.mark.parametrize("name", list(EXPANDED_PRESENTATIONS))
+def test_run_diagnostic_tree_batch_matches_run_diagnostic_tree(name):
+    pytest.importorskip("numpy")
+    patients = [
+        json.loads(json.dumps(patient_data, default=list))
+        for patient_data in random_patients(EXPANDED_PRESENTATIONS[name], PATIENTS_PER_PRESENTATION, seed=2)
+    ]
+    expected = [run_diagnostic_tree(name, patient_data, 2) for patient_data in patients]
+    assert run_diagnostic_tree_batch(name, patients, 2) == expected
+
+
+@pytest.mark.parametrize("name", list(EXPANDED_PRESENTATIONS))
+def test_score_all_presentations_matches_run_diagnostic_tree(name):
+    # Records answering this presentation's questions and the next one's, as an intake
+    # feed without a chief complaint might
+    names = list(EXPANDED_PRESENTATIONS)
+    other = names[(names.index(name) + 1) % len(names)]
+    patients = [
+        {**other_data, **patient_data}
+        for patient_data, other_data in zip(
+            random_patients(EXPANDED_PRESENTATIONS[name], 20, seed=3),
+            random_patients(EXPANDED_PRESENTATIONS[other], 20, seed=4),
+        )
+    ]
+    for patient_data in patients:
+        for threshold in (0.0, 0.34, DEFAULT_THRESHOLD, 1.0):
+            merged = [
+                (presentation, result["diagnosis_id"], result["diagnosis"], result["match_score"])
+                for presentation in names
+                for result in run_diagnostic_tree(presentation, patient_data, threshold=threshold)
+            ]
+            # Best first, ties in presentation and then diagnosis order
+            merged.sort(key=lambda result: result[3], reverse=True)
+            for k in (None, 10, 1):
+                results = score_all_presentations(patient_data, k, threshold)
+                assert [
+                    (result["presentation"], result["diagnosis_id"], result["diagnosis"], result["match_score"])
+                    for result in results
+                ] == merged[:k], (patient_data, threshold, k)
+
+
+@pytest.mark.parametrize("presentations, name", PRESENTATIONS)
+def test_match_table_matches_reference(presentations, name):
+    presentation_data = presentations[name]
+    presentation = Presentation.from_dict(name, presentation_data)
+    table = MatchTable(presentation)
+    for patient_data in random_patients(presentation_data, PATIENTS_PER_PRESENTATION):
+        first = next(
+            (
+                index for index, diagnosis in enumerate(presentation_data["diagnoses"])
+                if reference_hits(diagnosis, patient_data) == len(diagnosis["match"])
+            ),
+            None,
+        )
+        assert table.lookup(patient_data) is (None if first is None else presentation.diagnoses[first]), patient_data
+
+
+def test_knowledge_base_builds_presentations_on_first_lookup():
+    class Source(dict):  # A plain dict cannot be referenced weakly
+        pass
+
+    source = Source(ORIGINAL_PRESENTATIONS)
+    knowledge_base = KnowledgeBase(source)
+    released = weakref.ref(source)
+    del source
+    assert knowledge_base.complaints == tuple(ORIGINAL_PRESENTATIONS)
+    compiled = knowledge_base.compiled["Chest Pain"]
+    assert [name for name in knowledge_base.complaints if knowledge_base.presentations.is_built(name)] == ["Chest Pain"]
+    assert not knowledge_base.match_tables.is_built("Chest Pain")
+    expected = CompiledPresentation(Presentation.from_dict("Chest Pain", ORIGINAL_PRESENTATIONS["Chest Pain"]))
+    assert (compiled.names, compiled.masks, compiled.scores) == (expected.names, expected.masks, expected.scores)
+    with pytest.raises(KeyError):
+        knowledge_base.compiled["Not a complaint"]
+
+    assert released() is not None
+    assert len(list(knowledge_base.compiled.values())) == len(ORIGINAL_PRESENTATIONS)
+    gc.collect()
+    assert released() is None
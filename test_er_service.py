@@ -0,0 +1,137 @@
+# test_er_service.py
+# This file runs er_service.py on a local port and checks that what it returns over HTTP is
+# what calling er_symptomsmore.py directly returns: /diagnose and /diagnose/batch against
+# run_diagnostic_tree (coalesced duplicates, malformed lines and unknown presentations
+# included), /differentiating_factors against get_differentiating_factors, and /presentations.
+#
+# Run with `python -m pytest`.
+
+import asyncio
+import json
+import random
+
+import er_service
+import er_symptomsmore
+from er_bench import synthetic_patients
+from er_index import DEFAULT_THRESHOLD
+
+
+def diagnose_requests(count, seed=0):
+    # Requests over every presentation, with multi-select findings as JSON lists, some
+    # thresholds and k set, and every fifth request repeated so that it is coalesced.
+    rng = random.Random(seed)
+    names = list(er_symptomsmore.ER_PRESENTATIONS)
+    requests = []
+    for index in range(count):
+        if index % 5 == 4:
+            requests.append(requests[-1])
+            continue
+        name = rng.choice(names)
+        request = {
+            "presentation": name,
+            "patient_data": synthetic_patients(er_symptomsmore.ER_PRESENTATIONS[name], 1, seed=index)[0],
+        }
+        if rng.random() < 0.3:
+            request["k"] = rng.randint(0, 3)
+        if rng.random() < 0.3:
+            request["threshold"] = rng.choice((0, 0.34, 1))
+        requests.append(json.loads(json.dumps(request)))
+    return requests
+
+
+def expected_result(request):
+    # run_diagnostic_tree called directly, as JSON would carry it
+    result = er_symptomsmore.run_diagnostic_tree(
+        request["presentation"], request["patient_data"], request.get("k"), request.get("threshold", DEFAULT_THRESHOLD)
+    )
+    return json.loads(json.dumps(result))
+
+
+async def exchange(port, request):
+    # Sends one HTTP request and returns (status, decoded body), joining a chunked body.
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(request)
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    status = int(head.split(b" ")[1])
+    if b"Transfer-Encoding: chunked" in head:
+        chunks = []
+        while True:
+            size, _, body = body.partition(b"\r\n")
+            if not int(size, 16):
+                break
+            chunks.append(body[:int(size, 16)])
+            body = body[int(size, 16) + 2:]
+        body = b"".join(chunks)
+    return status, body
+
+
+def call_service(requests):
+    # Starts the service on a free port, sends each raw request in turn and stops it again.
+    async def main():
+        service = er_service.ScoringService(queue_size=8)
+        service.start()
+        server = await asyncio.start_server(
+            lambda reader, writer: er_service.handle_connection(service, reader, writer), "127.0.0.1", 0
+        )
+        port = server.sockets[0].getsockname()[1]
+        try:
+            return [await exchange(port, request) for request in requests]
+        finally:
+            server.close()
+            await server.wait_closed()
+            await service.stop()
+
+    return asyncio.run(main())
+
+
+def post(path, body):
+    return b"POST %s HTTP/1.1\r\nConnection: close\r\nContent-Length: %d\r\n\r\n%s" % (path, len(body), body)
+
+
+def get(target):
+    return b"GET %s HTTP/1.1\r\nConnection: close\r\n\r\n" % target.encode()
+
+
+def test_diagnose_matches_run_diagnostic_tree():
+    requests = diagnose_requests(100) + [{"presentation": "Not a complaint", "patient_data": {}}]
+    responses = call_service([post(b"/diagnose", json.dumps(request).encode()) for request in requests])
+    for request, (status, body) in zip(requests, responses):
+        expected = expected_result(request)
+        assert status == (404 if isinstance(expected, dict) else 200), request
+        assert json.loads(body) == expected, request
+
+
+def test_diagnose_batch_matches_run_diagnostic_tree():
+    requests = diagnose_requests(300, seed=1)
+    lines = [json.dumps(request).encode() for request in requests]
+    lines[10] = b"not json"
+    lines[20] = json.dumps({"presentation": "Chest Pain", "patient_data": []}).encode()
+    lines[30] = json.dumps({"presentation": "Not a complaint", "patient_data": {}}).encode()
+    [(status, body)] = call_service([post(b"/diagnose/batch", b"\n".join(lines))])
+    assert status == 200
+    results = [json.loads(line) for line in body.splitlines()]
+    assert len(results) == len(lines)
+    for index, (line, result) in enumerate(zip(lines, results)):
+        if index in (10, 20):
+            assert set(result) == {"error"}, line
+        else:
+            assert result == expected_result(json.loads(line)), line
+
+
+def test_lookups_match_direct_calls():
+    names = list(er_symptomsmore.ER_PRESENTATIONS)
+    targets = [(name, diagnosis_id) for name in names[:5] for diagnosis_id in (0, 1, 99)]
+    responses = call_service(
+        [get("/presentations")]
+        + [get(f"/differentiating_factors?presentation={name.replace(' ', '+')}&diagnosis_id={diagnosis_id}")
+           for name, diagnosis_id in targets]
+    )
+    assert responses[0] == (200, json.dumps(names).encode())
+    for (name, diagnosis_id), (status, body) in zip(targets, responses[1:]):
+        text = er_symptomsmore.get_differentiating_factors(name, diagnosis_id)
+        if text is None:
+            assert status == 404
+        else:
+            assert (status, json.loads(body)) == (200, text)
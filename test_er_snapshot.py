@@ -0,0 +1,42 @@
+# test_er_snapshot.py
+# This file builds a snapshot of each knowledge base (see er_snapshot.py) and checks that every
+# presentation compiled from it matches one compiled directly from the source files, even when
+# the imported knowledge base has been edited in place before the build.
+#
+# Run with `python -m pytest`.
+
+import pytest
+
+from er_index import CompiledPresentation
+from er_model import Presentation
+from er_snapshot import KNOWLEDGE_BASES, load_snapshot
+from er_symptoms import ER_PRESENTATIONS as ORIGINAL_PRESENTATIONS
+from er_symptomsmore import ER_PRESENTATIONS as EXPANDED_PRESENTATIONS
+
+IMPORTED = {"er_symptoms": ORIGINAL_PRESENTATIONS, "er_symptomsmore": EXPANDED_PRESENTATIONS}
+
+
+@pytest.mark.parametrize("knowledge_base", list(KNOWLEDGE_BASES))
+def test_snapshot_matches_source_files_after_in_place_edit(knowledge_base, tmp_path):
+    diagnosis = IMPORTED[knowledge_base]["Chest Pain"]["diagnoses"][0]
+    name = diagnosis["name"]
+    diagnosis["name"] = "POISONED"
+    try:
+        snapshot = load_snapshot(knowledge_base, str(tmp_path / f"{knowledge_base}.kb"))
+    finally:
+        diagnosis["name"] = name
+
+    try:
+        presentations = KNOWLEDGE_BASES[knowledge_base][1]()
+        assert snapshot.names() == list(presentations)
+        for presentation, presentation_data in presentations.items():
+            expected = CompiledPresentation(Presentation.from_dict(presentation, presentation_data))
+            compiled = snapshot.compiled(presentation)
+            assert compiled.names == expected.names
+            assert compiled.feature_ids == expected.feature_ids
+            assert compiled.masks == expected.masks
+            assert compiled.scores == expected.scores
+            assert list(compiled.texts) == list(expected.texts)
+        assert snapshot.compiled("Chest Pain").names[0] == name
+    finally:
+        snapshot.close()